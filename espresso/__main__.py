@@ -3,37 +3,106 @@
 Espresso - Ana uygulama başlatıcı
 """
 
+import os
 import sys
 import argparse
-import gi
-
-gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib
-
-from espresso.controllers.app_controller import AppController
 
 
 def parse_arguments():
     """Komut satırı argümanlarını işler"""
     parser = argparse.ArgumentParser(description="Espresso Sistem Monitörü")
-    parser.add_argument("--interval", type=int, default=1,
-                        help="Veri güncelleme aralığı (saniye)")
+    parser.add_argument("--interval", type=float, default=0.25,
+                        help="CPU örnekleme ve ekran yenileme aralığı (saniye, ör. 0.25)")
     parser.add_argument("--theme", type=str, choices=["light", "dark"], default="dark",
                         help="Uygulama teması (açık/koyu)")
     parser.add_argument("--scan-home", action="store_true",
                         help="Home dizinini otomatik tara")
+    parser.add_argument("--scan-workers", type=int, default=8,
+                        help="Dizin taramasında eşzamanlı çalışan iş parçacığı sayısı "
+                             "(1: tek iş parçacığı)")
+    parser.add_argument("--scan-display-depth", type=int, default=None,
+                        help="Tarama sonuçlarında ayrıntısı tutulacak dizin seviyesi "
+                             "(boyutlar her zaman tüm derinliği kapsar; varsayılan: sınırsız)")
+    parser.add_argument("--scan-index-dir", type=str, default=None,
+                        help="Tarama sonuçlarını yeniden taramalarda kullanmak üzere saklayan dizin "
+                             "(ör. ~/.cache/espresso/scan)")
+    parser.add_argument("--scan-watch", action="store_true",
+                        help="Tarama bittikten sonra dizinleri inotify ile izleyip ağacı canlı güncelle")
+    parser.add_argument("--scan-watch-limit", type=int, default=8192,
+                        help="İzleme kipinde izlenecek en fazla dizin sayısı (sığ dizinler önce)")
+    parser.add_argument("--history-dir", type=str, default=None,
+                        help="Metrik geçmişini yeniden başlatmalarda korumak için dizin "
+                             "(ör. ~/.local/share/espresso/history)")
+    
+    # Ekransız mod seçenekleri
+    parser.add_argument("--headless", action="store_true",
+                        help="GTK olmadan çalış ve her örnek için bir kayıt yaz")
+    parser.add_argument("--output", type=str, default="-",
+                        help="Ekransız modda kayıtların yazılacağı dosya (varsayılan: standart çıktı)")
+    parser.add_argument("--format", type=str, choices=["json", "msgpack"], default="json",
+                        help="Ekransız mod kayıt biçimi (satır başına JSON veya msgpack)")
+    parser.add_argument("--count", type=int, default=None,
+                        help="Ekransız modda bu kadar kayıt yazdıktan sonra çık")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Ekransız modda bu kadar saniye sonra çık")
+    
+    # Prometheus dışa aktarıcısı
+    parser.add_argument("--export-port", type=int, default=None,
+                        help="Metrikleri bu portta /metrics adresinden Prometheus biçiminde sun")
+    parser.add_argument("--export-address", type=str, default="127.0.0.1",
+                        help="Dışa aktarıcının dinleyeceği adres (varsayılan: 127.0.0.1)")
     return parser.parse_args()
 
 
+def run_headless(args):
+    """GTK yüklemeden metrik kayıtlarını yazar"""
+    from espresso.headless import HeadlessRunner
+    
+    try:
+        runner = HeadlessRunner(
+            interval=args.interval,
+            output=args.output,
+            fmt=args.format,
+            count=args.count,
+            duration=args.duration,
+            export_port=args.export_port,
+            export_address=args.export_address
+        )
+    except (ValueError, OSError) as e:
+        print(f"Ekransız mod hatası: {e}", file=sys.stderr)
+        return 1
+    
+    try:
+        runner.run()
+    except OSError as e:
+        print(f"Ekransız mod hatası: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 def main():
     """Ana uygulama başlatıcı"""
     args = parse_arguments()
     
+    # Ekransız modda GTK hiç içe aktarılmaz
+    if args.headless:
+        sys.exit(run_headless(args))
+    
+    from espresso.controllers.app_controller import AppController
+    
     # Uygulama kontrolcüsünü başlat
     app_controller = AppController(
         update_interval=args.interval,
         theme=args.theme,
-        scan_home=args.scan_home
+        scan_home=args.scan_home,
+        scan_workers=args.scan_workers,
+        scan_display_depth=args.scan_display_depth,
+        scan_index_dir=os.path.expanduser(args.scan_index_dir) if args.scan_index_dir else None,
+        scan_watch=args.scan_watch,
+        scan_watch_limit=args.scan_watch_limit,
+        history_dir=os.path.expanduser(args.history_dir) if args.history_dir else None,
+        export_port=args.export_port,
+        export_address=args.export_address
     )
     
     # GTK uygulamasını çalıştır
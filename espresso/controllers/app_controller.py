@@ -8,26 +8,54 @@ from gi.repository import Gtk, GLib, Gio
 
 from espresso.ui.app_window import AppWindow
 from espresso.models.metrics import SystemMetrics
+from espresso.models.collector import MetricsCollector, scaled_intervals
+from espresso.models.history import TimeSeriesStore
+from espresso.exporter import MetricsExporter
 from espresso.controllers.cpu_controller import CPUController
 from espresso.controllers.ram_controller import RAMController
 from espresso.controllers.gpu_controller import GPUController
 from espresso.controllers.disk_controller import DiskController
+from espresso.controllers.network_controller import NetworkController
 
 
 class AppController:
     """Ana uygulama kontrolcüsü"""
     
-    def __init__(self, update_interval=1, theme="dark", scan_home=False):
+    def __init__(self, update_interval=0.25, theme="dark", scan_home=False,
+                 history_dir=None, export_port=None, export_address="127.0.0.1",
+                 scan_workers=8, scan_display_depth=None, scan_index_dir=None,
+                 scan_watch=False, scan_watch_limit=8192):
         self.update_interval = update_interval
         self.theme = theme
         self.scan_home = scan_home
+        self.scan_workers = scan_workers
+        self.scan_display_depth = scan_display_depth
+        self.scan_index_dir = scan_index_dir
+        self.scan_watch = scan_watch
+        self.scan_watch_limit = scan_watch_limit
         
         # Modelleri oluştur
         self.metrics = SystemMetrics()
         
+        # update_interval en sık örneklenen bölümün (CPU) ve ekran yenilemenin aralığıdır
+        intervals = scaled_intervals(update_interval)
+        
+        # Metrikler GTK ana döngüsünü bloklamamak için ayrı iş parçacığında toplanır
+        self.collector = MetricsCollector(self.metrics, intervals)
+        
+        # Tüm kontrolcülerin paylaştığı geçmiş deposu; dizin verilirse
+        # geçmiş belleğe eşlenmiş dosyalarda tutulur ve yeniden başlatmada korunur
+        self.history = TimeSeriesStore(directory=history_dir)
+        
+        # İstenirse aynı görüntüler Prometheus'a /metrics üzerinden sunulur
+        self.exporter = None
+        if export_port is not None:
+            self.exporter = MetricsExporter(self.collector, export_port, export_address)
+        
         # Uygulama ve pencere oluştur
         self.app = Gtk.Application(application_id="com.espresso.monitor")
         self.app.connect("activate", self._on_activate)
+        self.app.connect("shutdown", self._on_shutdown)
     
     def get_app(self):
         """GTK uygulamasını döndürür"""
@@ -39,28 +67,50 @@ class AppController:
         self.window = AppWindow(app, self.theme)
         
         # Alt kontrolcüleri oluştur
-        self.cpu_controller = CPUController(self.window.cpu_panel, self.metrics)
-        self.ram_controller = RAMController(self.window.ram_panel, self.metrics)
-        self.gpu_controller = GPUController(self.window.gpu_panel, self.metrics)
-        self.disk_controller = DiskController(self.window.disk_panel, self.metrics, 
-                                            scan_home=self.scan_home)
+        self.cpu_controller = CPUController(self.window.cpu_panel, self.collector, self.history)
+        self.ram_controller = RAMController(self.window.ram_panel, self.collector, self.history)
+        self.gpu_controller = GPUController(self.window.gpu_panel, self.collector, self.history)
+        self.disk_controller = DiskController(self.window.disk_panel, self.collector, 
+                                            self.history, scan_home=self.scan_home,
+                                            scan_workers=self.scan_workers,
+                                            display_depth=self.scan_display_depth,
+                                            index_dir=self.scan_index_dir,
+                                            watch=self.scan_watch,
+                                            watch_limit=self.scan_watch_limit)
+        self.network_controller = NetworkController(self.window.network_panel, self.collector,
+                                                    self.history)
         
-        # Periyodik veri güncelleme zamanlayıcısını başlat
-        GLib.timeout_add_seconds(self.update_interval, self._update_data)
+        # Arka plan toplayıcısını başlat
+        self.collector.start()
+        if self.exporter is not None:
+            try:
+                self.exporter.start()
+            except OSError as e:
+                print(f"Dışa aktarıcı başlatma hatası: {e}")
+        
+        # Periyodik panel güncelleme zamanlayıcısını başlat
+        GLib.timeout_add(int(self.update_interval * 1000), self._update_data)
         
         # Pencereyi göster
         self.window.present()
     
+    def _on_shutdown(self, app):
+        """Uygulama kapanırken çağrılır"""
+        if self.exporter is not None:
+            self.exporter.stop()
+        if getattr(self, "disk_controller", None) is not None:
+            self.disk_controller.stop_watch()
+        self.collector.stop()
+        self.history.close()
+    
     def _update_data(self):
-        """Tüm sistem verilerini günceller"""
-        # Metrikleri güncelle
-        self.metrics.update_all()
-        
-        # Kontrolcüleri güncelle
+        """Panelleri en son metrik anlık görüntüsüyle günceller"""
+        # Kontrolcüler yalnızca toplayıcının yayınladığı görüntüyü okur
         self.cpu_controller.update()
         self.ram_controller.update()
         self.gpu_controller.update()
         self.disk_controller.update()
+        self.network_controller.update()
         
         # Zamanlayıcıyı devam ettir
         return True
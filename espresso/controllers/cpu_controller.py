@@ -10,29 +10,76 @@ from gi.repository import Gtk, GLib
 class CPUController:
     """CPU paneli kontrolcüsü"""
     
-    def __init__(self, cpu_panel, metrics):
+    # Çekirdek başına seri kapasitesi (çok çekirdekli sistemlerde belleği sınırlar)
+    CORE_CAPACITY = 3600
+    
+    def __init__(self, cpu_panel, collector, history):
         self.panel = cpu_panel
-        self.metrics = metrics
-        self.history = []
-        self.max_history = 60  # 60 veri noktası sakla
+        self.collector = collector
+        self.history = history
+        self.cpu_version = 0
+        self.temp_version = 0
+        self.psi_version = 0
+        
+        # Gruplama değişince bir sonraki örneği beklemeden yenile
+        self.panel.group_selector.connect("notify::selected", self._on_group_changed)
     
     def update(self):
         """CPU verilerini günceller ve paneli yeniler"""
-        # CPU kullanım verilerini al
-        cpu_usage = self.metrics.get_cpu_usage()
-        cpu_temp = self.metrics.get_cpu_temperature()
+        snapshot = self.collector.get_snapshot()
         
-        # Geçmiş verileri güncelle
-        self.history.append(cpu_usage)
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        # Yalnızca yeni CPU örneği geldiyse grafiği ve çekirdekleri yenile
+        cpu_version = snapshot.get_version("cpu")
+        if cpu_version != self.cpu_version:
+            self.cpu_version = cpu_version
+            
+            # Geçmiş verileri güncelle
+            self.history.append("cpu", snapshot.get_cpu_usage())
+            core_usages = snapshot.get_cpu_core_usages()
+            for i, usage in enumerate(core_usages):
+                self.history.append(f"cpu.core.{i}", usage, self.CORE_CAPACITY, rollup=False)
+            
+            # Grafik, seçili zaman penceresine uygun katmanı depodan kopyalamadan okur
+            self.panel.update_usage_graph(self.history.get("cpu"))
+            
+            # CPU çekirdek bilgilerini ve zaman dağılımını güncelle
+            self._refresh_cores(snapshot)
+            self.panel.update_time_breakdown(snapshot.get_cpu_times())
         
-        # Panel bileşenlerini güncelle
-        self.panel.update_usage_graph(self.history)
-        self.panel.update_temperature(cpu_temp)
+        # Sıcaklıklar kendi aralıklarında örneklenir
+        temp_version = snapshot.get_version("temp")
+        if temp_version != self.temp_version:
+            self.temp_version = temp_version
+            
+            self.panel.update_temperature(snapshot.get_cpu_temperature())
+            self.panel.update_temperature_details(
+                snapshot.get_cpu_package_temperatures(),
+                snapshot.get_cpu_core_temperatures()
+            )
         
-        # CPU çekirdek bilgilerini güncelle
-        core_usages = self.metrics.get_cpu_core_usages()
-        self.panel.update_core_info(core_usages)
+        # Basınç duraklama oranları
+        psi_version = snapshot.get_version("psi")
+        if psi_version != self.psi_version:
+            self.psi_version = psi_version
+            self.panel.update_pressure(snapshot.get_pressure().get("cpu"))
         
         return True
+    
+    def _refresh_cores(self, snapshot):
+        """Çekirdek çubuklarını seçili gruplamaya göre yeniler"""
+        group = self.panel.get_group()
+        if group is None:
+            self.panel.update_core_info(snapshot.get_cpu_core_usages())
+            return
+        
+        titles = {"node": "Düğüm", "socket": "Soket", "core": "Fiziksel"}
+        entries = snapshot.get_cpu_groups().get(group, [])
+        self.panel.update_core_info(
+            [entry["usage"] for entry in entries],
+            [f"{titles[group]} {entry['id']}:" for entry in entries],
+            ["CPU " + ", ".join(str(cpu) for cpu in entry["cpus"]) for entry in entries]
+        )
+    
+    def _on_group_changed(self, selector, param):
+        """Gruplama seçimi değiştiğinde çağrılır"""
+        self._refresh_cores(self.collector.get_snapshot())
@@ -9,18 +9,40 @@ gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib, Gio
 
 from espresso.models.disk_scanner import DiskScanner
+from espresso.models.scan_watcher import ScanWatcher
 
 
 class DiskController:
     """Disk paneli kontrolcüsü"""
     
-    def __init__(self, disk_panel, metrics, scan_home=False):
+    # Bağlama ve aygıt başına seri kapasitesi (1 sn aralıkla 10 dk); sayıları
+    # (loop, snap aygıtları) sınırsız olduğundan toplama katmanı tutulmaz
+    DEVICE_CAPACITY = 600
+    
+    def __init__(self, disk_panel, collector, history, scan_home=False, scan_workers=8,
+                 display_depth=None, index_dir=None, watch=False, watch_limit=8192):
         self.panel = disk_panel
-        self.metrics = metrics
+        self.collector = collector
+        self.history = history
+        self.version = 0
+        self.io_version = 0
+        self.psi_version = 0
         self.scan_home = scan_home
-        self.scanner = DiskScanner()
+        self.scanner = DiskScanner(workers=scan_workers, display_depth=display_depth,
+                                   index_dir=index_dir)
         self.scanning = False
         self.scan_thread = None
+        self.scan_root = None
+        
+        # İzleme kipi: tarama bitince ağaç inotify olaylarıyla canlı tutulur
+        self.watch = watch
+        self.watch_limit = watch_limit
+        self.display_depth = display_depth
+        self.watcher = None
+        
+        # Panelde gösterilen sonuçlar; dizinler açıldıkça bunlardan doldurulur
+        self.shown_results = None
+        self.panel.tree_view.connect("test-expand-row", self._on_row_expand)
         
         # Başlangıçta home dizinini taramak isteniyorsa
         if self.scan_home:
@@ -28,20 +50,70 @@ class DiskController:
     
     def update(self):
         """Disk verilerini günceller ve paneli yeniler"""
-        # Disk kullanım verilerini al
-        disk_info = self.metrics.get_disk_info()
+        snapshot = self.collector.get_snapshot()
+        
+        # Yeni disk örneği geldiyse kullanım bilgilerini güncelle
+        version = snapshot.get_version("disk")
+        if version != self.version:
+            self.version = version
+            disk_info = snapshot.get_disk_info()
+            
+            # Bölüm doluluk geçmişi
+            for mount_point, info in disk_info.items():
+                self.history.append(f"disk.{mount_point}", info["percent"],
+                                    self.DEVICE_CAPACITY, rollup=False)
+            
+            self.panel.update_disk_usage(disk_info)
+        
+        # G/Ç hızları kendi aralığında (1 sn) örneklenir
+        io_version = snapshot.get_version("io")
+        if io_version != self.io_version:
+            self.io_version = io_version
+            disk_io = snapshot.get_disk_io()
+            
+            histories = {}
+            for device, stats in disk_io.items():
+                read = self.history.get(f"io.{device}.read", self.DEVICE_CAPACITY, rollup=False)
+                write = self.history.get(f"io.{device}.write", self.DEVICE_CAPACITY, rollup=False)
+                read.append(stats["read_bytes"])
+                write.append(stats["write_bytes"])
+                histories[device] = (read, write)
+            
+            self.panel.update_disk_io(disk_io, histories)
         
-        # Panel bileşenlerini güncelle
-        self.panel.update_disk_usage(disk_info)
+        # G/Ç basıncı
+        psi_version = snapshot.get_version("psi")
+        if psi_version != self.psi_version:
+            self.psi_version = psi_version
+            self.panel.update_pressure(snapshot.get_pressure().get("io"))
         
         # Tarama durumunu kontrol et
         if self.scanning and self.scan_thread and not self.scan_thread.is_alive():
             self.scanning = False
             self.panel.update_scan_status(False)
             
-            # Tarama sonuçlarını göster
-            scan_results = self.scanner.get_results()
-            self.panel.update_directory_tree(scan_results)
+            # Tarama sonuçlarını göster; panel tipli dizileri doğrudan okur
+            results = self.scanner.get_compact_results()
+            self.shown_results = results
+            self.panel.update_directory_tree(results)
+            
+            # Ağaç kurulduktan sonra izleme başlar; sonuçlara bundan sonra izleyici ekler.
+            # İzlemeler izleyicinin kendi iş parçacığında kurulur, arayüz bloklanmaz
+            if self.watch and results is not None and not self.scanner.stop_requested:
+                self.watcher = ScanWatcher(results, self.display_depth, self.watch_limit)
+                if not self.watcher.start():
+                    self.watcher = None
+        
+        # İzleyicinin biriktirdiği değişiklikleri yerinde uygula
+        if self.watcher is not None and self.watcher.ready:
+            if self.watcher.overflowed:
+                # Kaçırılan olaylar var: hangi dizinlerin değiştiği bilinmediğinden tam tarama
+                self.scan_directory(self.scan_root, full=True)
+            else:
+                with self.watcher.lock:
+                    changes = self.watcher.take_changes()
+                    if changes:
+                        self.panel.update_directory_entries(self.watcher.results, changes)
         
         return True
     
@@ -50,11 +122,13 @@ class DiskController:
         if self.scanning:
             return
         
+        self.stop_watch()
         self.scanning = True
         self.panel.update_scan_status(True)
         
         # Taramayı ayrı bir iş parçacığında başlat
         home_dir = os.path.expanduser("~")
+        self.scan_root = home_dir
         self.scan_thread = threading.Thread(
             target=self.scanner.scan_directory,
             args=(home_dir,)
@@ -62,18 +136,20 @@ class DiskController:
         self.scan_thread.daemon = True
         self.scan_thread.start()
     
-    def scan_directory(self, directory):
-        """Belirtilen dizini tarar"""
+    def scan_directory(self, directory, full=False):
+        """Belirtilen dizini tarar (full True ise önceki sonuçlar kullanılmaz)"""
         if self.scanning:
             return
         
+        self.stop_watch()
         self.scanning = True
         self.panel.update_scan_status(True)
+        self.scan_root = directory
         
         # Taramayı ayrı bir iş parçacığında başlat
         self.scan_thread = threading.Thread(
             target=self.scanner.scan_directory,
-            args=(directory,)
+            args=(directory, full)
         )
         self.scan_thread.daemon = True
         self.scan_thread.start()
@@ -84,3 +160,23 @@ class DiskController:
             self.scanner.stop_scan()
             self.scanning = False
             self.panel.update_scan_status(False)
+        self.stop_watch()
+    
+    def _on_row_expand(self, tree_view, row, path):
+        """Dizin satırı ilk kez açılırken alt öğelerini ekler"""
+        if self.shown_results is None:
+            return False
+        
+        if self.watcher is not None:
+            # İzleyici sonuçlara eklerken alt öğe indeksi okunmaz
+            with self.watcher.lock:
+                self.panel.populate_directory_row(self.shown_results, row)
+        else:
+            self.panel.populate_directory_row(self.shown_results, row)
+        return False
+    
+    def stop_watch(self):
+        """Varsa tarama sonuçlarının izlenmesini durdurur"""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
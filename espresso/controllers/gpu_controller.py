@@ -10,14 +10,15 @@ from gi.repository import Gtk, GLib
 class GPUController:
     """GPU paneli kontrolcüsü"""
     
-    def __init__(self, gpu_panel, metrics):
+    def __init__(self, gpu_panel, collector, history):
         self.panel = gpu_panel
-        self.metrics = metrics
-        self.history = []
-        self.max_history = 60  # 60 veri noktası sakla
+        self.collector = collector
+        self.history = history
+        self.version = 0
+        self.last_sample_ts = {}  # GPU dizini -> son eklenen örneğin zaman damgası
         
         # GPU türünü belirle (NVIDIA, AMD veya yok)
-        self.gpu_type = self.metrics.get_gpu_type()
+        self.gpu_type = self.collector.get_snapshot().get_gpu_type()
         self.panel.set_gpu_type(self.gpu_type)
     
     def update(self):
@@ -27,18 +28,38 @@ class GPUController:
             self.panel.show_no_gpu_message()
             return True
         
-        # GPU kullanım verilerini al
-        gpu_usage = self.metrics.get_gpu_usage()
-        gpu_temp = self.metrics.get_gpu_temperature()
-        gpu_memory = self.metrics.get_gpu_memory()
+        snapshot = self.collector.get_snapshot()
+        
+        # Yeni GPU örneği yoksa paneli yenileme
+        version = snapshot.get_version("gpu")
+        if version == self.version:
+            return True
+        self.version = version
+        
+        gpus = snapshot.get_gpus()
+        
+        # Birden fazla GPU varsa özet değerler: en yüksek sıcaklık ve toplam bellek
+        if len(gpus) > 1:
+            gpu_temp = max(gpu["temp"] for gpu in gpus)
+            used = sum(gpu["memory"]["used"] for gpu in gpus)
+            total = sum(gpu["memory"]["total"] for gpu in gpus)
+            gpu_memory = {
+                "used": used,
+                "total": total,
+                "percent": (used / total) * 100 if total else 0
+            }
+        else:
+            gpu_temp = snapshot.get_gpu_temperature()
+            gpu_memory = snapshot.get_gpu_memory()
         
         # Geçmiş verileri güncelle
-        self.history.append(gpu_usage)
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        for gpu in gpus:
+            self._append_history(gpu)
         
         # Panel bileşenlerini güncelle
-        self.panel.update_usage_graph(self.history)
+        self.panel.update_usage_graph([
+            self.history.get(f"gpu.{gpu.get('index', 0)}") for gpu in gpus
+        ])
         self.panel.update_temperature(gpu_temp)
         self.panel.update_memory_info(
             gpu_memory["used"],
@@ -47,7 +68,31 @@ class GPUController:
         )
         
         # Ek GPU bilgilerini güncelle
-        gpu_info = self.metrics.get_gpu_info()
+        gpu_info = snapshot.get_gpu_info()
         self.panel.update_gpu_details(gpu_info)
         
+        # Her GPU için ayrı satırları güncelle
+        self.panel.update_gpu_list(gpus)
+        
+        # GPU süreçleri tablosunu güncelle
+        processes = [process for gpu in gpus for process in gpu.get("processes", [])]
+        self.panel.update_process_table(processes)
+        
         return True
+    
+    def _append_history(self, gpu):
+        """GPU'nun yeni kullanım verilerini geçmişine ekler"""
+        index = gpu.get("index", 0)
+        name = f"gpu.{index}"
+        samples = gpu.get("samples")
+        
+        if samples is None:
+            # Örnek arabelleği olmayan GPU'lar (AMD, desteklemeyen NVIDIA) anlık kullanımla beslenir
+            self.history.append(name, gpu["usage"])
+        elif samples:
+            # Sürücü örneklerini olduğu gibi ekle; aynı örneği iki kez ekleme
+            last_ts = self.last_sample_ts.get(index, 0)
+            self.history.get(name).extend(value for ts, value in samples if ts > last_ts)
+            self.last_sample_ts[index] = samples[-1][0]
+        # Yeni örnek yoksa anlık değer eklenmez; alt-saniye örneklerle aynı seride çözünürlük karışır
+
@@ -0,0 +1,73 @@
+"""
+Espresso - Ağ panel kontrolcüsü
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib
+
+
+class NetworkController:
+    """Ağ paneli kontrolcüsü"""
+
+    def __init__(self, network_panel, collector, history):
+        self.panel = network_panel
+        self.collector = collector
+        self.history = history
+        self.version = 0
+
+        # Süzgeç değişince bir sonraki örneği beklemeden yenile
+        self.panel.virtual_toggle.connect("toggled", self._on_filter_toggled)
+
+    def update(self):
+        """Ağ verilerini günceller ve paneli yeniler"""
+        snapshot = self.collector.get_snapshot()
+
+        # Yeni ağ örneği yoksa paneli yenileme
+        version = snapshot.get_version("net")
+        if version == self.version:
+            return True
+        self.version = version
+
+        network = snapshot.get_network()
+
+        # Toplamların geçmişi: fiziksel arayüzler ve tüm arayüzler ayrı tutulur;
+        # binlerce veth için arayüz başına seri açılmaz
+        for prefix, include_virtual in (("net", False), ("net.all", True)):
+            rx, tx = self._totals(network, include_virtual)
+            self.history.append(f"{prefix}.rx", rx)
+            self.history.append(f"{prefix}.tx", tx)
+
+        self._refresh(network)
+
+        return True
+
+    def _refresh(self, network):
+        """Paneli süzgece göre yeniler"""
+        show_virtual = self.panel.virtual_toggle.get_active()
+        prefix = "net.all" if show_virtual else "net"
+
+        interfaces = {
+            name: stats for name, stats in network.items()
+            if show_virtual or not stats["virtual"]
+        }
+
+        self.panel.update_usage_graph([
+            self.history.get(f"{prefix}.rx"),
+            self.history.get(f"{prefix}.tx")
+        ])
+        self.panel.update_totals(*self._totals(network, show_virtual))
+        self.panel.update_interface_table(interfaces)
+
+    def _totals(self, network, include_virtual):
+        """Arayüzlerin toplam alma/gönderme hızlarını döndürür"""
+        rx = tx = 0
+        for stats in network.values():
+            if include_virtual or not stats["virtual"]:
+                rx += stats["rx_bytes"]
+                tx += stats["tx_bytes"]
+        return rx, tx
+
+    def _on_filter_toggled(self, button):
+        """Sanal arayüz süzgeci değiştiğinde çağrılır"""
+        self._refresh(self.collector.get_snapshot().get_network())
@@ -10,22 +10,52 @@ from gi.repository import Gtk, GLib
 class RAMController:
     """RAM paneli kontrolcüsü"""
     
-    def __init__(self, ram_panel, metrics):
+    def __init__(self, ram_panel, collector, history):
         self.panel = ram_panel
-        self.metrics = metrics
-        self.history = []
-        self.max_history = 60  # 60 veri noktası sakla
+        self.collector = collector
+        self.history = history
+        self.version = 0
+        self.psi_version = 0
+        
+        # Düğüm görünümü açılınca bir sonraki örneği beklemeden yenile
+        self.panel.node_toggle.connect("toggled", self._on_node_toggled)
     
     def update(self):
         """RAM verilerini günceller ve paneli yeniler"""
+        snapshot = self.collector.get_snapshot()
+        
+        # Bellek basıncı kendi aralığında örneklenir
+        psi_version = snapshot.get_version("psi")
+        if psi_version != self.psi_version:
+            self.psi_version = psi_version
+            self.panel.update_pressure(snapshot.get_pressure().get("memory"))
+        
+        # Yeni RAM örneği yoksa paneli yenileme
+        version = snapshot.get_version("ram")
+        if version == self.version:
+            return True
+        self.version = version
+        
         # RAM kullanım verilerini al
-        ram_info = self.metrics.get_ram_info()
-        swap_info = self.metrics.get_swap_info()
+        ram_info = snapshot.get_ram_info()
+        swap_info = snapshot.get_swap_info()
         
         # Geçmiş verileri güncelle
-        self.history.append(ram_info["percent"])
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        self.history.append("ram", ram_info["percent"])
+        self.history.append("swap", swap_info["percent"])
+        
+        # Bellek bileşimi: toplam belleğe oranla uygulamalar, arabellek ve önbellek
+        details = snapshot.get_memory_details()
+        composition = None
+        if details and ram_info["total"]:
+            scale = 100 / ram_info["total"]
+            composition = [
+                ("ram.used", ram_info["used"] * scale),
+                ("ram.buffers", details["buffers"] * scale),
+                ("ram.cached", (details["cached"] + details["slab_reclaimable"]) * scale)
+            ]
+            for name, value in composition:
+                self.history.append(name, value)
         
         # Panel bileşenlerini güncelle
         self.panel.update_ram_bar(
@@ -42,5 +72,23 @@ class RAMController:
         
         # Detaylı bellek bilgilerini güncelle
         self.panel.update_memory_details(ram_info, swap_info)
+        self.panel.update_memory_composition(details, snapshot.get_vmstat_rates())
+        
+        if composition:
+            self.panel.update_composition_graph([self.history.get(name) for name, _ in composition])
+        
+        self._refresh_nodes(snapshot)
         
         return True
+    
+    def _refresh_nodes(self, snapshot):
+        """Düğüm başına bellek ve CPU kullanımını panele aktarır"""
+        node_cpu = {
+            entry["id"]: entry["usage"]
+            for entry in snapshot.get_cpu_groups().get("node", [])
+        }
+        self.panel.update_node_memory(snapshot.get_node_memory(), node_cpu)
+    
+    def _on_node_toggled(self, button):
+        """Düğüm görünümü açılıp kapandığında çağrılır"""
+        self._refresh_nodes(self.collector.get_snapshot())
@@ -0,0 +1,284 @@
+"""
+Espresso - Prometheus/OpenMetrics dışa aktarıcı
+"""
+
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+# Prometheus metin biçimi sürümü
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsExporter:
+    """Toplayıcının son anlık görüntüsünü /metrics adresinde sunan HTTP sunucusu
+
+    Metin her anlık görüntü için yalnızca bir kez oluşturulur ve önbelleğe
+    alınır; eşzamanlı kazımalar metrik toplamayı ya da yeniden biçimlemeyi
+    tetiklemez.
+    """
+
+    def __init__(self, collector, port, address="127.0.0.1"):
+        self.collector = collector
+        self.address = address
+        self.port = port
+
+        self.lock = threading.Lock()
+        self.cached_seq = None
+        self.cached_body = b""
+
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Sunucuyu arka plan iş parçacığında başlatır"""
+        if self.server is not None:
+            return
+
+        self.server = ThreadingHTTPServer((self.address, self.port), MetricsRequestHandler)
+        self.server.daemon_threads = True
+        self.server.exporter = self
+
+        self.thread = threading.Thread(target=self.server.serve_forever, name="espresso-exporter")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+
+    def render(self):
+        """Son anlık görüntünün metnini döndürür (görüntü değişmediyse önbellekten)"""
+        snapshot = self.collector.get_snapshot()
+        with self.lock:
+            if snapshot.seq != self.cached_seq:
+                self.cached_body = render_snapshot(snapshot).encode("utf-8")
+                self.cached_seq = snapshot.seq
+            return self.cached_body
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """/metrics isteklerini yanıtlayan işleyici"""
+
+    def do_GET(self):
+        """GET isteğini yanıtlar"""
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            self._send(200, CONTENT_TYPE, self.server.exporter.render())
+        elif path == "/":
+            self._send(200, "text/html; charset=utf-8",
+                       b'<html><body><a href="/metrics">Metrics</a></body></html>')
+        else:
+            self._send(404, "text/plain; charset=utf-8", b"Not Found\n")
+
+    def _send(self, status, content_type, body):
+        """Yanıtı gönderir"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Her kazıma için standart hataya günlük yazma"""
+        pass
+
+
+class MetricFamily:
+    """Aynı ada sahip örnekleri HELP/TYPE başlığıyla birlikte biçimleyen yardımcı"""
+
+    def __init__(self, name, help_text, metric_type="gauge"):
+        self.name = name
+        self.help_text = help_text
+        self.metric_type = metric_type
+        self.samples = []
+
+    def add(self, value, **labels):
+        """Etiketli bir örnek ekler"""
+        self.samples.append((labels, value))
+
+    def render(self, lines):
+        """Satırları verilen listeye ekler"""
+        if not self.samples:
+            return
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.metric_type}")
+        for labels, value in self.samples:
+            if labels:
+                label_text = ",".join(
+                    f'{key}="{_escape(label)}"' for key, label in labels.items()
+                )
+                lines.append(f"{self.name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{self.name} {_format_value(value)}")
+
+
+def render_snapshot(snapshot):
+    """Anlık görüntüyü Prometheus metin biçimine çevirir"""
+    families = []
+
+    def family(name, help_text, metric_type="gauge"):
+        metric = MetricFamily(name, help_text, metric_type)
+        families.append(metric)
+        return metric
+
+    # CPU
+    cpu_usage = family("espresso_cpu_usage_percent", "Toplam CPU kullanımı")
+    cpu_usage.add(snapshot.get_cpu_usage())
+
+    cpu_mode = family("espresso_cpu_mode_percent", "CPU zamanının kipe göre dağılımı")
+    for mode, percent in snapshot.get_cpu_times().items():
+        if mode != "usage":
+            cpu_mode.add(percent, mode=mode)
+
+    core_usage = family("espresso_cpu_core_usage_percent", "Çekirdek başına CPU kullanımı")
+    for core, usage in enumerate(snapshot.get_cpu_core_usages()):
+        core_usage.add(usage, core=core)
+
+    cpu_group = family("espresso_cpu_group_usage_percent",
+                       "NUMA düğümü, soket ve fiziksel çekirdek başına ortalama CPU kullanımı")
+    for group, entries in snapshot.get_cpu_groups().items():
+        for entry in entries:
+            cpu_group.add(entry["usage"], group=group, id=entry["id"])
+
+    cpu_temp = family("espresso_cpu_temperature_celsius", "Özet CPU sıcaklığı")
+    cpu_temp.add(snapshot.get_cpu_temperature())
+
+    sensor_temp = family("espresso_cpu_sensor_temperature_celsius", "CPU sensör sıcaklıkları")
+    for sensor, temp in snapshot.get_cpu_package_temperatures().items():
+        sensor_temp.add(temp, sensor=sensor, kind="package")
+    for sensor, temp in snapshot.get_cpu_core_temperatures().items():
+        sensor_temp.add(temp, sensor=sensor, kind="core")
+
+    # RAM ve swap
+    for prefix, info, help_text in (("memory", snapshot.get_ram_info(), "RAM"),
+                                    ("swap", snapshot.get_swap_info(), "Swap")):
+        size = family(f"espresso_{prefix}_bytes", f"{help_text} miktarları (bayt)")
+        for key in ("total", "available", "used", "free"):
+            if key in info:
+                size.add(info[key], type=key)
+
+        percent = family(f"espresso_{prefix}_usage_percent", f"{help_text} kullanımı")
+        if "percent" in info:
+            percent.add(info["percent"])
+
+    memory_detail = family("espresso_memory_detail_bytes", "/proc/meminfo dökümü (bayt)")
+    for field, value in snapshot.get_memory_details().items():
+        if not field.startswith("hugepages_"):
+            memory_detail.add(value, field=field)
+
+    hugepages = family("espresso_memory_hugepages", "Hugepage sayıları")
+    for field in ("hugepages_total", "hugepages_free"):
+        if field in snapshot.get_memory_details():
+            hugepages.add(snapshot.get_memory_details()[field], state=field[len("hugepages_"):])
+
+    node_memory = family("espresso_node_memory_bytes", "NUMA düğümü başına bellek (bayt)")
+    node_percent = family("espresso_node_memory_usage_percent", "NUMA düğümü başına bellek kullanımı")
+    for node, memory in snapshot.get_node_memory().items():
+        for key in ("total", "used", "free", "cached"):
+            node_memory.add(memory[key], node=node, type=key)
+        node_percent.add(memory["percent"], node=node)
+
+    vmstat = family("espresso_vmstat_rate", "Swap giriş/çıkış (sayfa/sn), sayfalama (KB/sn) ve büyük hata (/sn) hızları")
+    for counter, rate in snapshot.get_vmstat_rates().items():
+        vmstat.add(rate, counter=counter)
+
+    # Diskler
+    disk_size = family("espresso_disk_bytes", "Bölüm boyutları (bayt)")
+    disk_percent = family("espresso_disk_usage_percent", "Bölüm kullanımı")
+    disk_up = family("espresso_disk_responsive", "Bölüm statvfs sorgusuna yanıt veriyor mu (1/0)")
+    for mountpoint, usage in snapshot.get_disk_info().items():
+        labels = {
+            "mountpoint": mountpoint,
+            "device": usage.get("device", ""),
+            "fstype": usage.get("fstype", "")
+        }
+        for key in ("total", "used", "free"):
+            disk_size.add(usage.get(key, 0), type=key, **labels)
+        disk_percent.add(usage.get("percent", 0), **labels)
+        disk_up.add(0 if usage.get("status") == "unresponsive" else 1, **labels)
+
+    # Disk G/Ç
+    io_bytes = family("espresso_disk_io_bytes_per_second", "Aygıt başına okuma/yazma hızı")
+    io_ops = family("espresso_disk_io_operations_per_second", "Aygıt başına IOPS")
+    io_latency = family("espresso_disk_io_latency_milliseconds", "Ortalama G/Ç gecikmesi")
+    io_queue = family("espresso_disk_io_queue_depth", "Ortalama kuyruk derinliği")
+    io_util = family("espresso_disk_io_utilization_percent", "Aygıtın meşgul olduğu süre oranı")
+    for device, stats in snapshot.get_disk_io().items():
+        for direction in ("read", "write"):
+            io_bytes.add(stats[f"{direction}_bytes"], device=device, direction=direction)
+            io_ops.add(stats[f"{direction}_iops"], device=device, direction=direction)
+            io_latency.add(stats[f"{direction}_latency"], device=device, direction=direction)
+        io_queue.add(stats["queue_depth"], device=device)
+        io_util.add(stats["utilization"], device=device)
+
+    # Ağ arayüzleri
+    net_bytes = family("espresso_network_bytes_per_second", "Arayüz başına alma/gönderme hızı")
+    net_packets = family("espresso_network_packets_per_second", "Arayüz başına paket hızı")
+    net_errors = family("espresso_network_errors_per_second", "Arayüz başına hata hızı")
+    net_drops = family("espresso_network_drops_per_second", "Arayüz başına düşürülen paket hızı")
+    for interface, stats in snapshot.get_network().items():
+        virtual = "1" if stats["virtual"] else "0"
+        for direction in ("rx", "tx"):
+            labels = {"interface": interface, "direction": direction, "virtual": virtual}
+            net_bytes.add(stats[f"{direction}_bytes"], **labels)
+            net_packets.add(stats[f"{direction}_packets"], **labels)
+            net_errors.add(stats[f"{direction}_errors"], **labels)
+            net_drops.add(stats[f"{direction}_drops"], **labels)
+
+    # Basınç duraklama bilgisi (PSI)
+    psi_avg = family("espresso_pressure_avg_percent", "Çekirdeğin PSI ortalamaları")
+    psi_rate = family("espresso_pressure_stall_percent", "Son aralıkta duraklanan süre oranı")
+    psi_total = family("espresso_pressure_stall_seconds_total", "Toplam duraklama süresi", "counter")
+    for resource, kinds in snapshot.get_pressure().items():
+        for kind, stats in kinds.items():
+            labels = {"resource": resource, "kind": kind}
+            for window in ("avg10", "avg60", "avg300"):
+                psi_avg.add(stats[window], window=window, **labels)
+            psi_rate.add(stats["rate"], **labels)
+            psi_total.add(stats["total"] / 1000000, **labels)
+
+    # GPU'lar
+    gpu_usage = family("espresso_gpu_usage_percent", "GPU kullanımı")
+    gpu_temp = family("espresso_gpu_temperature_celsius", "GPU sıcaklığı")
+    gpu_memory = family("espresso_gpu_memory_bytes", "GPU bellek miktarları (bayt)")
+    gpu_process_memory = family("espresso_gpu_process_memory_bytes", "Süreç başına GPU belleği (bayt)")
+    for gpu in snapshot.get_gpus():
+        labels = {"gpu": gpu.get("index", 0), "name": gpu.get("name", "")}
+        gpu_usage.add(gpu.get("usage", 0), **labels)
+        gpu_temp.add(gpu.get("temp", 0), **labels)
+        memory = gpu.get("memory", {})
+        for key in ("total", "used", "free"):
+            gpu_memory.add(memory.get(key, 0), type=key, **labels)
+        for process in gpu.get("processes", []):
+            gpu_process_memory.add(process["memory"], pid=process["pid"],
+                                   process=process["name"], **labels)
+
+    # Görüntünün kendisi
+    timestamp = family("espresso_snapshot_timestamp_seconds", "Son anlık görüntünün zamanı")
+    timestamp.add(snapshot.timestamp)
+
+    lines = []
+    for metric in families:
+        metric.render(lines)
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    """Etiket değerindeki ters eğik çizgi, tırnak ve satır sonlarını kaçışlar"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value):
+    """Örnek değerini Prometheus sayı biçimine çevirir"""
+    if value is None:
+        return "NaN"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
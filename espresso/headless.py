@@ -0,0 +1,107 @@
+"""
+Espresso - Ekransız (headless) metrik toplayıcı
+"""
+
+import os
+import sys
+import json
+import time
+
+from espresso.models.metrics import SystemMetrics
+from espresso.models.collector import MetricsCollector, scaled_intervals
+from espresso.exporter import MetricsExporter
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class HeadlessRunner:
+    """Metrikleri GTK yüklemeden toplayıp her örnek için bir kayıt yazan sınıf
+
+    JSON biçiminde her kayıt tek satırdır (NDJSON); msgpack biçiminde
+    kayıtlar art arda yazılır ve bir akış ayrıştırıcısıyla okunur.
+    """
+
+    FORMATS = ("json", "msgpack")
+
+    def __init__(self, interval=1.0, output=None, fmt="json", count=None, duration=None,
+                 export_port=None, export_address="127.0.0.1"):
+        if fmt == "msgpack" and msgpack is None:
+            raise ValueError("msgpack biçimi için msgpack paketi gerekli (pip install msgpack)")
+
+        self.interval = interval
+        self.output = output
+        self.fmt = fmt
+        self.count = count
+        self.duration = duration
+
+        # GUI ile aynı toplayıcı ve bölüm aralıkları
+        self.metrics = SystemMetrics()
+        self.collector = MetricsCollector(self.metrics, scaled_intervals(interval))
+
+        # İstenirse aynı görüntüler Prometheus'a da sunulur
+        self.exporter = None
+        if export_port is not None:
+            self.exporter = MetricsExporter(self.collector, export_port, export_address)
+
+    def encode(self, record):
+        """Kaydı seçilen biçimde bayt dizisine çevirir"""
+        if self.fmt == "msgpack":
+            return msgpack.packb(record, use_bin_type=True)
+        return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def _open_output(self):
+        """Çıktı akışını açar ("-" veya None standart çıktıdır)"""
+        if not self.output or self.output == "-":
+            return sys.stdout.buffer
+        return open(self.output, "ab")
+
+    def run(self):
+        """Kayıt sayısı veya süre dolana kadar kayıt yazar, yazılan kayıt sayısını döndürür"""
+        stream = self._open_output()
+        written = 0
+        last_seq = 0
+
+        start = time.monotonic()
+        deadline = start + self.duration if self.duration else None
+        next_at = start
+
+        self.collector.start()
+        if self.exporter is not None:
+            self.exporter.start()
+        try:
+            while self.count is None or written < self.count:
+                # Sabit hızda örnekle; gecikmeler sonraki turlara kaymasın
+                next_at += self.interval
+                wake = next_at if deadline is None else min(next_at, deadline)
+                delay = wake - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+
+                # Toplayıcı yeni bir görüntü yayınlamadıysa aynı kaydı tekrar yazma
+                snapshot = self.collector.get_snapshot()
+                if snapshot.seq == last_seq:
+                    continue
+                last_seq = snapshot.seq
+
+                stream.write(self.encode(snapshot.to_dict()))
+                stream.flush()
+                written += 1
+        except BrokenPipeError:
+            # Okuyan taraf kapandı (ör. "| head"); çıkışta tekrar hata verilmesin
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.exporter is not None:
+                self.exporter.stop()
+            self.collector.stop()
+            if stream is not sys.stdout.buffer:
+                stream.close()
+
+        return written
@@ -0,0 +1,104 @@
+"""
+Espresso - Arka plan metrik toplayıcısı
+"""
+
+import time
+import heapq
+import threading
+
+
+# Bölüm başına varsayılan örnekleme aralıkları (saniye)
+DEFAULT_INTERVALS = {
+    "cpu": 0.25,
+    "ram": 1,
+    "temp": 2,
+    "gpu": 2,
+    "disk": 30,
+    "io": 1,
+    "net": 1,
+    "psi": 1
+}
+
+
+def scaled_intervals(interval):
+    """En sık örneklenen bölümün (CPU) aralığına göre bölüm aralıklarını döndürür
+
+    Diğer bölümler CPU'dan daha sık örneklenmez.
+    """
+    intervals = {
+        section: max(default, interval)
+        for section, default in DEFAULT_INTERVALS.items()
+    }
+    intervals["cpu"] = interval
+    return intervals
+
+
+class MetricsCollector:
+    """SystemMetrics bölümlerini kendi aralıklarında güncelleyip anlık görüntü yayınlayan sınıf"""
+
+    def __init__(self, metrics, intervals=None):
+        self.metrics = metrics
+        self.intervals = dict(DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+
+        self.thread = None
+        self.stop_event = threading.Event()
+
+        # Okuyucular her zaman tutarlı bir görüntü görür
+        self._snapshot = metrics.snapshot()
+
+    def start(self):
+        """Toplayıcı iş parçacığını başlatır"""
+        if self.thread and self.thread.is_alive():
+            return
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="espresso-collector")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """Toplayıcı iş parçacığını durdurur"""
+        self.stop_event.set()
+
+    def get_snapshot(self):
+        """En son yayınlanan anlık görüntüyü döndürür"""
+        return self._snapshot
+
+    def _run(self):
+        """Zamanlayıcı döngüsü"""
+        # (zamanı gelen an, öncelik, bölüm); eşit anlarda sık örneklenen bölüm önce çalışır
+        now = time.monotonic()
+        queue = []
+        for section in self.metrics.SECTIONS:
+            interval = self.intervals[section]
+            heapq.heappush(queue, (now, interval, section))
+
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+
+            # Zamanı gelen tüm bölümleri topla
+            due = []
+            while queue and queue[0][0] <= now:
+                due.append(heapq.heappop(queue))
+
+            if due:
+                for _, _, section in due:
+                    try:
+                        self.metrics.update(section)
+                    except Exception as e:
+                        print(f"Metrik toplama hatası ({section}): {e}")
+
+                # Referans ataması atomiktir; okuyucular kilit tutmaz
+                self._snapshot = self.metrics.snapshot()
+
+                # Bir sonraki zamanı planla, geciken turları telafi etmeye çalışma
+                now = time.monotonic()
+                for due_at, interval, section in due:
+                    next_at = due_at + interval
+                    if next_at < now:
+                        next_at = now + interval
+                    heapq.heappush(queue, (next_at, interval, section))
+
+            self.stop_event.wait(max(0, queue[0][0] - time.monotonic()))
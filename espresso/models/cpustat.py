@@ -0,0 +1,160 @@
+"""
+Espresso - /proc/stat tabanlı CPU zaman dağılımı modeli
+"""
+
+import os
+from array import array
+from itertools import repeat
+from operator import add, sub
+
+import psutil
+
+from espresso.models.sysfs import open_fd, pread_all, close_fd
+
+
+# /proc/stat "cpu" satırlarındaki alanlar (guest süreleri user/nice içinde zaten sayılır)
+CPU_TIME_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+
+
+class CPUStat:
+    """/proc/stat'ı tek okumada ayrıştırıp toplam ve çekirdek başına CPU dağılımını hesaplayan sınıf
+
+    Dosya bir kez açılır ve her turda önceden ayrılmış bir arabelleğe
+    pread ile okunur; yalnızca baştaki "cpu" satırları ayrıştırılır,
+    büyük "intr" satırı atlanır. Tikler satır başına sabit genişlikte
+    tek bir düz tamsayı dizisine yazılır; iki dizi turlar arasında
+    dönüşümlü kullanılır. Farklar ve yüzdeler çekirdek başına sözlük
+    kurulmadan, alan sütunları üzerinde toplu olarak hesaplanır. İlk
+    okumada tümü sıfırdır.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.fd = open_fd(os.path.join(proc_root, "stat"))
+        self.buffer = bytearray(64 * 1024)
+        self.current = array("q")   # satır satır tikler (satır başına width alan)
+        self.previous = array("q")
+        self.labels = []            # önceki okumanın satır etiketleri
+        self.width = 0              # satır başına alan sayısı
+        self.core_ids = []          # çekirdek sütunlarındaki sıraya karşılık gelen CPU numaraları
+
+    def read(self):
+        """(toplam dağılım, çekirdek başına dağılım) döndürür
+
+        Toplam dağılım CPU_TIME_FIELDS alanlarının yüzdelerini ve meşgul
+        oranını ("usage", iowait hariç) içeren bir sözlüktür. Çekirdek
+        dağılımı aynı anahtarlarla, core_ids sırasında çekirdek başına
+        değer listeleri tutar.
+        """
+        if self.fd is None:
+            return self._read_psutil()
+
+        # Çekirdeğin yazdığı tüm satırlar aynı sayıda alan içerir; genişlik ilk satırdan okunur
+        data = self._read_cpu_lines()
+        newline = data.find(b"\n")
+        width = len((data if newline < 0 else data[:newline]).split()) - 1
+        tokens = data.split()
+        if width <= 0 or len(tokens) % (width + 1):
+            return _empty_times(), _empty_core_times(0)
+
+        # Her satırın ilk belirteci etikettir, geri kalanlar sayıdır
+        labels = tokens[::width + 1]
+        del tokens[::width + 1]
+
+        # Önceki turun dizisi yeniden kullanılır
+        current, previous = self.previous, self.current
+        current[:] = array("q", map(int, tokens))
+
+        if labels != self.labels or width != self.width:
+            # CPU çevrimiçi/çevrimdışı oldu: önceki tikler etikete göre hizalanır,
+            # yeni satırların farkı sıfır olur
+            previous = self._align(previous, labels, width, current)
+            self.labels = labels
+            self.width = width
+            self.core_ids = [int(label[3:]) for label in labels[1:]]
+
+        self.current, self.previous = current, previous
+        return _percentages(current, previous, width)
+
+    def _align(self, previous, labels, width, current):
+        """Önceki tikleri yeni satır düzenine taşır; eşi olmayan satırlar güncel tiklerle doldurulur"""
+        aligned = array("q", current)
+        if width == self.width:
+            rows = {label: row for row, label in enumerate(self.labels)}
+            for row, label in enumerate(labels):
+                old = rows.get(label)
+                if old is not None:
+                    aligned[row * width:(row + 1) * width] = previous[old * width:(old + 1) * width]
+        return aligned
+
+    def _read_cpu_lines(self):
+        """Dosyanın "cpu" satırlarını içeren baş kısmını arabelleğe okur"""
+        self.buffer, size = pread_all(self.fd, self.buffer)
+        end = self.buffer.find(b"\nintr", 0, size)
+        return bytes(memoryview(self.buffer)[:end if end >= 0 else size])
+
+    def _read_psutil(self):
+        """/proc/stat bulunmayan sistemlerde psutil ile aynı dağılımı döndürür"""
+        def convert(times):
+            result = {field: getattr(times, field, 0.0) for field in CPU_TIME_FIELDS}
+            result["usage"] = round(100 - result["idle"] - result["iowait"], 1)
+            return result
+
+        total = convert(psutil.cpu_times_percent())
+        cores = [convert(times) for times in psutil.cpu_times_percent(percpu=True)]
+        self.core_ids = list(range(len(cores)))
+        core_times = {field: [times[field] for times in cores] for field in CPU_TIME_FIELDS + ("usage",)}
+        return total, core_times
+
+    def close(self):
+        """/proc/stat dosyasını kapatır"""
+        close_fd(self.fd)
+        self.fd = None
+
+
+def _empty_times():
+    """Sıfır yüzdelerden oluşan toplam dağılım"""
+    times = dict.fromkeys(CPU_TIME_FIELDS, 0.0)
+    times["usage"] = 0.0
+    return times
+
+
+def _empty_core_times(count):
+    """count çekirdek için sıfır yüzdelerden oluşan çekirdek dağılımı"""
+    return {field: [0.0] * count for field in CPU_TIME_FIELDS + ("usage",)}
+
+
+def _percentages(current, previous, width):
+    """İki tik dizisinin farkından (toplam, çekirdek başına) yüzdeleri hesaplar
+
+    Farklar tek geçişte alınır; her alan, satır genişliği adımlı bir dilimle
+    tüm satırlar için birden sütun olarak işlenir. İlk satır toplamdır.
+    """
+    # Sayaçlar geri gitmemeli; yine de gerekirse negatif farkları sıfır say
+    deltas = list(map(sub, current, previous))
+    if deltas and min(deltas) < 0:
+        deltas = list(map(max, deltas, repeat(0, len(deltas))))
+
+    # Eski çekirdeklerde steal gibi sonraki alanlar olmayabilir
+    rows = len(deltas) // width if width else 0
+    columns = [
+        deltas[position::width] if position < width else [0] * rows
+        for position in range(len(CPU_TIME_FIELDS))
+    ]
+
+    elapsed = columns[0]
+    for column in columns[1:]:
+        elapsed = list(map(add, elapsed, column))
+    scales = [100 / value if value else 0.0 for value in elapsed]
+
+    # psutil.cpu_percent ile aynı tanım: boşta ve G/Ç beklemesi meşgul sayılmaz
+    busy = list(map(sub, map(sub, elapsed, columns[3]), columns[4]))
+
+    percentages = {
+        field: [round(value * scale, 1) for value, scale in zip(column, scales)]
+        for field, column in zip(CPU_TIME_FIELDS, columns)
+    }
+    percentages["usage"] = [round(value * scale, 1) for value, scale in zip(busy, scales)]
+
+    total = {field: values[0] for field, values in percentages.items()}
+    cores = {field: values[1:] for field, values in percentages.items()}
+    return total, cores
@@ -5,21 +5,55 @@ Espresso - Disk tarama modeli
 import os
 import threading
 from pathlib import Path
-from collections import defaultdict
+from urllib.parse import quote
+
+from espresso.models.scan_results import ScanResults, ScanResultsView, DirectoryTreeView
 
 
 class DiskScanner:
-    """Dizin yapısını tarayıp boyut bilgilerini toplayan sınıf"""
+    """Dizin yapısını tarayıp boyut bilgilerini toplayan sınıf
+    
+    Ağaç açık bir yığınla, derinlik sınırı olmadan dolaşılır; toplam
+    boyutlar her zaman tüm alt ağacı kapsar. display_depth yalnızca
+    sonuçlarda kaç seviyenin ayrıntısının tutulacağını belirler (None:
+    tümü). workers 1'den büyükse alt dizinler sınırlı sayıda iş
+    parçacığına dağıtılır; os.scandir ve stat GIL'i bıraktığından meta
+    veri G/Ç beklemeleri örtüşür.
+    
+    Sonuçlar girdi başına sözlük yerine ScanResults'ta paralel tipli
+    dizilerle tutulur; get_results ve get_directory_tree eski biçimi
+    tembel görünümlerle sunar.
     
-    def __init__(self):
-        self.results = {}
+    Aynı dizin yeniden tarandığında önceki sonuç (bellekte ya da
+    index_dir'deki dizin dosyasında) kullanılır: mtime ve ctime'ı
+    değişmemiş dizinler yeniden listelenmez, dosyaları ve dosya toplamları
+    önceki kayıttan alınır; yalnızca alt dizinleri stat ile denetlenir.
+    """
+    
+    # Dizin dosyalarının uzantısı
+    SUFFIX = ".scan"
+    
+    def __init__(self, workers=8, display_depth=None, index_dir=None):
+        self.results = None
+        self.previous = None
         self.stop_requested = False
         self.lock = threading.Lock()
+        self.workers = max(1, workers)
+        self.display_depth = display_depth
+        self.index_dir = index_dir
+        self.total_size = 0
+        self.reused_directories = 0
     
-    def scan_directory(self, directory):
-        """Belirtilen dizini tarar ve boyut bilgilerini toplar"""
+    def scan_directory(self, directory, full=False):
+        """Belirtilen dizini tarar ve boyut bilgilerini toplar
+        
+        full True ise önceki sonuçlar yok sayılır ve tüm dizinler listelenir.
+        """
+        last_results = self.results
         self.stop_requested = False
-        self.results = {}
+        self.results = None
+        self.total_size = 0
+        self.reused_directories = 0
         
         try:
             # Dizin yolunu normalize et
@@ -29,62 +63,188 @@ class DiskScanner:
             if not os.path.isdir(directory):
                 return
             
+            # Değişmemiş dizinler için önceki tarama
+            if not full:
+                self.previous = self._load_previous(directory, last_results)
+                if self.previous is not None:
+                    self.previous.prepare()
+            
             # Dizini tara
-            self._scan_recursive(directory)
+            self.results = ScanResults(directory)
+            self._walk(directory)
             
-            # Sonuçları düzenle
-            self._organize_results()
+            # Yalnızca tamamlanmış taramalar dizin dosyasına yazılır
+            if not self.stop_requested:
+                self._save_index(directory)
             
         except (PermissionError, OSError) as e:
             print(f"Tarama hatası: {e}")
+        
+        finally:
+            self.previous = None
+    
+    def _index_path(self, directory):
+        """Dizinin tarama dizini dosyasının yolunu döndürür"""
+        return os.path.join(self.index_dir, quote(directory, safe="") + self.SUFFIX)
+    
+    def _load_previous(self, directory, last_results):
+        """Aynı kök için önceki sonuçları bellekten ya da dizin dosyasından döndürür"""
+        if last_results is not None and last_results.name(0) == directory:
+            return last_results
+        
+        if self.index_dir is None:
+            return None
+        
+        previous = ScanResults.load(self._index_path(directory))
+        if previous is None or previous.name(0) != directory:
+            return None
+        return previous
     
-    def _scan_recursive(self, directory, depth=0, max_depth=5):
-        """Dizini özyinelemeli olarak tarar"""
-        # Çok derine inmeyi önle
-        if depth > max_depth or self.stop_requested:
-            return 0
+    def _save_index(self, directory):
+        """Tarama sonucunu dizin dosyasına yazar"""
+        if self.index_dir is None:
+            return
         
-        total_size = 0
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            self.results.save(self._index_path(directory))
+        except OSError as e:
+            print(f"Tarama dizini kaydetme hatası: {e}")
+    
+    def _walk(self, root):
+        """Ağacı açık bir yığınla, gerekirse iş parçacığı havuzunda dolaşır
+        
+        Listelenen her dizinin alt dizinleri ortak bir yığına eklenir ve boşta
+        olan iş parçacığı tarafından alınır. Bir dizinin boyutu, tüm alt
+        dizinleri bittiğinde üst dizine eklenir; kök bitince tarama tamamlanır.
+        Python özyinelemesi kullanılmadığından derinlik sınırı yoktur.
+        """
+        # Dizin -> [bitmemiş iş sayısı, toplam boyut, üst dizin, sonuç indeksi,
+        # derinlik]; listeleme işinin kendisi de bir iş sayılır
+        self.pending = {root: [1, 0, None, 0, 0]}
+        self.stack = [(root, 0)]
+        self.active = 0
+        self.condition = threading.Condition(self.lock)
+        
+        # Tek iş parçacığında aynı döngü doğrudan çalışır
+        if self.workers == 1:
+            self._scan_worker()
+            self.pending = {}
+            return
+        
+        threads = []
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._scan_worker, name=f"espresso-scan-{i}"
+            )
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        
+        self.pending = {}
+    
+    def _scan_worker(self):
+        """Yığından dizin alıp listeleyen iş parçacığı döngüsü"""
+        while True:
+            with self.condition:
+                # Yığın boşken başka bir iş parçacığı yeni alt dizin ekleyebilir
+                while not self.stack and self.active and not self.stop_requested:
+                    self.condition.wait()
+                
+                if self.stop_requested or not self.stack:
+                    self.condition.notify_all()
+                    return
+                
+                directory, depth = self.stack.pop()
+                self.active += 1
+            
+            # Gösterim derinliğinden daha derindeki dosyalar yalnızca toplamlara
+            # katılır; dizinler artımlı tarama için gizli olarak tutulur
+            shown = self.display_depth is None or depth < self.display_depth
+            
+            # Dizin G/Ç'si kilit dışında yapılır
+            files, files_size, subdirs, stat, reused = self._read_directory(directory, shown)
+            
+            with self.condition:
+                node = self.pending[directory]
+                index = node[3]
+                if shown:
+                    for name, file_size in files:
+                        self.results.add(name, index, False, file_size)
+                node[1] += files_size
+                
+                # Durdurma yüzünden yarım kalan listeler sonraki taramada kullanılmasın
+                if stat is not None and not self.stop_requested:
+                    self.results.set_directory_stat(index, stat, files_size, shown)
+                if reused:
+                    self.reused_directories += 1
+                
+                for path, name in subdirs:
+                    # Dizin indeksi alt öğelerin üst dizini olarak hemen gerekir;
+                    # boyutu dizin bitince yazılır
+                    child = self.results.add(name, index, True, hidden=not shown)
+                    self.pending[path] = [1, 0, directory, child, depth + 1]
+                    node[0] += 1
+                    self.stack.append((path, depth + 1))
+                
+                self._finish_directory(directory)
+                self.active -= 1
+                self.condition.notify_all()
+    
+    def _read_directory(self, directory, shown):
+        """Dizinin içeriğini döndürür; değişmemişse önceki taramadan kurar
+        
+        ([(ad, boyut)] dosyalar, dosya toplamı, [(yol, ad)] alt dizinler,
+        dizinin stat sonucu, önceki taramadan mı) döndürür.
+        """
+        try:
+            stat = os.lstat(directory)
+        except OSError:
+            stat = None
+        
+        previous = self.previous
+        if previous is not None and stat is not None:
+            slot = previous.find_unchanged(stat)
+            old = previous.dir_indices[slot] if slot >= 0 else -1
+            
+            # Dosyaları gösterilecek bir dizin, önceki taramada dosyaları tutulduysa yeniden kullanılabilir
+            if old >= 0 and (not shown or previous.has_files(old)):
+                files = []
+                subdirs = []
+                for child in previous.children(old):
+                    # İzleme kipinde kaldırılan girdiler atlanır
+                    if not previous.is_live(child):
+                        continue
+                    name = previous.name(child)
+                    if previous.is_directory(child):
+                        subdirs.append((os.path.join(directory, name), name))
+                    elif shown:
+                        files.append((name, previous.size(child)))
+                
+                return files, previous.dir_file_sizes[slot], subdirs, stat, True
+        
+        files, subdirs = self._list_directory(directory)
+        return files, sum(file_size for _, file_size in files), subdirs, stat, False
+    
+    def _list_directory(self, directory):
+        """Dizini listeler; ([(ad, boyut)] dosyalar, [(yol, ad)] alt dizinler) döndürür"""
+        files = []
+        subdirs = []
         
         try:
-            # Dizin içeriğini listele
             with os.scandir(directory) as entries:
                 for entry in entries:
                     if self.stop_requested:
-                        return 0
+                        break
                     
                     try:
                         if entry.is_dir(follow_symlinks=False):
-                            # Alt dizin boyutunu hesapla
-                            subdir_size = self._scan_recursive(
-                                entry.path, depth + 1, max_depth
-                            )
-                            
-                            # Sonuçlara ekle
-                            with self.lock:
-                                self.results[entry.path] = {
-                                    "name": entry.name,
-                                    "type": "directory",
-                                    "size": subdir_size,
-                                    "parent": directory
-                                }
-                            
-                            total_size += subdir_size
-                            
+                            subdirs.append((entry.path, entry.name))
                         elif entry.is_file(follow_symlinks=False):
-                            # Dosya boyutunu al
-                            file_size = entry.stat().st_size
-                            
-                            # Sonuçlara ekle
-                            with self.lock:
-                                self.results[entry.path] = {
-                                    "name": entry.name,
-                                    "type": "file",
-                                    "size": file_size,
-                                    "parent": directory
-                                }
-                            
-                            total_size += file_size
+                            files.append((entry.name, entry.stat().st_size))
                     
                     except (PermissionError, OSError):
                         # Bazı dosya/dizinlere erişim izni olmayabilir
@@ -94,63 +254,52 @@ class DiskScanner:
             # Dizine erişim izni olmayabilir
             pass
         
-        return total_size
+        return files, subdirs
     
-    def _organize_results(self):
-        """Sonuçları düzenler ve ağaç yapısı oluşturur"""
-        # Sonuçları boyuta göre sırala
-        sorted_results = {}
-        
-        # Önce dizinleri ve dosyaları ayır
-        directories = {}
-        files = {}
-        
-        for path, info in self.results.items():
-            if info["type"] == "directory":
-                directories[path] = info
-            else:
-                files[path] = info
-        
-        # Dizinleri boyuta göre sırala
-        sorted_dirs = sorted(
-            directories.items(),
-            key=lambda x: x[1]["size"],
-            reverse=True
-        )
-        
-        # Dosyaları boyuta göre sırala
-        sorted_files = sorted(
-            files.items(),
-            key=lambda x: x[1]["size"],
-            reverse=True
-        )
-        
-        # Sonuçları birleştir
-        for path, info in sorted_dirs:
-            sorted_results[path] = info
-        
-        for path, info in sorted_files:
-            sorted_results[path] = info
-        
-        self.results = sorted_results
+    def _finish_directory(self, directory):
+        """Dizinin bir işini tamamlar; tüm işleri bittiyse boyutunu üst dizinlere aktarır"""
+        # Kilit tutulurken çağrılır
+        while directory is not None:
+            node = self.pending[directory]
+            node[0] -= 1
+            if node[0]:
+                return
+            
+            del self.pending[directory]
+            _, size, parent, index, _ = node
+            self.results.set_size(index, size)
+            if parent is None:
+                self.total_size = size
+                return
+            
+            self.pending[parent][1] += size
+            
+            # Üst dizinin de bu alt dizini bekleyen işi tamamlandı
+            directory = parent
     
     def stop_scan(self):
         """Devam eden taramayı durdurur"""
         self.stop_requested = True
     
     def get_results(self):
-        """Tarama sonuçlarını döndürür"""
+        """Tarama sonuçlarını yol -> bilgi eşlemesi olarak döndürür (tembel görünüm)"""
+        if self.results is None:
+            return {}
+        return ScanResultsView(self.results)
+    
+    def get_compact_results(self):
+        """Tarama sonuçlarının tipli dizi yapısını döndürür (tarama yoksa None)"""
         return self.results
     
+    def get_total_size(self):
+        """Taranan dizinin tüm alt ağacı kapsayan toplam boyutunu döndürür"""
+        return self.total_size
+    
     def get_directory_tree(self):
-        """Sonuçları ağaç yapısında döndürür"""
-        tree = defaultdict(list)
-        
-        for path, info in self.results.items():
-            parent = info["parent"]
-            tree[parent].append(path)
-        
-        return tree
+        """Sonuçları üst dizin -> alt öğe yolları eşlemesi olarak döndürür (tembel görünüm)"""
+        if self.results is None:
+            return {}
+        return DirectoryTreeView(self.results)
     
     @staticmethod
     def format_size(size_bytes):
@@ -0,0 +1,146 @@
+"""
+Espresso - /proc/diskstats tabanlı disk G/Ç modeli
+"""
+
+import os
+import time
+
+from espresso.models.sysfs import open_fd, pread_all, close_fd
+
+
+# /proc/diskstats sektörleri çekirdekte her zaman 512 bayttır
+SECTOR_SIZE = 512
+
+# Etkinlik gösterilmeyen sanal aygıt önekleri
+IGNORED_PREFIXES = ("loop", "ram", "zram", "fd")
+
+
+class DiskStats:
+    """/proc/diskstats farklarından blok aygıtı başına G/Ç hızlarını hesaplayan sınıf
+
+    Dosya bir kez açılır ve her turda tek pread ile okunur. Bağlı bölümler
+    ile tüm diskler (/sys/block) raporlanır; bölümler bağlama noktalarına
+    eşlenir.
+    """
+
+    def __init__(self, proc_root="/proc", sysfs_root="/sys", dev_root="/dev"):
+        self.sysfs_root = sysfs_root
+        self.dev_root = dev_root
+        self.fd = open_fd(os.path.join(proc_root, "diskstats"))
+        self.buffer = bytearray(16 * 1024)
+
+        self.previous = {}       # aygıt -> (an, sayaçlar)
+        self.block_devices = set()
+        self.known_devices = frozenset()
+
+        # Bağlama listesi değişmedikçe aygıt eşlemesi yeniden hesaplanmaz
+        self.mount_source = None
+        self.device_mounts = {}  # aygıt adı -> [bağlama noktaları]
+
+    def read(self, mounts=()):
+        """Aygıt adı -> G/Ç hızları sözlüğü döndürür
+
+        mounts, MountTable.mounts biçimindeki (bağlama noktası, aygıt, tür)
+        listesidir. İlk okumada hızlar sıfırdır.
+        """
+        if self.fd is None:
+            return {}
+
+        if mounts is not self.mount_source:
+            self.device_mounts = self._map_mounts(mounts)
+            self.mount_source = mounts
+
+        now = time.monotonic()
+        self.buffer, size = pread_all(self.fd, self.buffer)
+        data = bytes(memoryview(self.buffer)[:size])
+
+        rows = {}
+        for line in data.split(b"\n"):
+            parts = line.split()
+            if len(parts) < 14:
+                continue
+            rows[parts[2].decode("utf-8", "replace")] = parts[3:14]
+
+        # Disk eklenip çıkarıldığında tüm disk listesini yenile
+        devices = frozenset(rows)
+        if devices != self.known_devices:
+            self.block_devices = self._read_block_devices()
+            self.known_devices = devices
+
+        current = {}
+        result = {}
+        for name, fields in rows.items():
+            if name.startswith(IGNORED_PREFIXES):
+                continue
+            if name not in self.block_devices and name not in self.device_mounts:
+                continue
+
+            counters = [int(value) for value in fields]
+            current[name] = (now, counters)
+            stats = _rates(counters, self.previous.get(name), now)
+            stats["mountpoints"] = self.device_mounts.get(name, [])
+            result[name] = stats
+
+        self.previous = current
+        return result
+
+    def _read_block_devices(self):
+        """Tüm diskleri (bölümler hariç) döndürür"""
+        try:
+            return set(os.listdir(os.path.join(self.sysfs_root, "block")))
+        except OSError:
+            return set()
+
+    def _map_mounts(self, mounts):
+        """Bağlama listesindeki aygıt yollarını diskstats adlarına eşler"""
+        device_mounts = {}
+        for mountpoint, device, _ in mounts:
+            if not device.startswith("/"):
+                continue
+            # /dev/mapper/root -> dm-0, /dev/disk/by-uuid/... -> sda1
+            name = os.path.basename(os.path.realpath(device))
+            device_mounts.setdefault(name, []).append(mountpoint)
+        return device_mounts
+
+    def close(self):
+        """/proc/diskstats dosyasını kapatır"""
+        close_fd(self.fd)
+        self.fd = None
+
+
+def _rates(counters, previous, now):
+    """İki sayaç okuması arasındaki hızları hesaplar"""
+    # Sayaçlar: okuma, birleşen okuma, okunan sektör, okuma ms, yazma,
+    # birleşen yazma, yazılan sektör, yazma ms, süren G/Ç, G/Ç ms, ağırlıklı G/Ç ms
+    stats = {
+        "read_bytes": 0.0,
+        "write_bytes": 0.0,
+        "read_iops": 0.0,
+        "write_iops": 0.0,
+        "read_latency": 0.0,
+        "write_latency": 0.0,
+        "queue_depth": 0.0,
+        "utilization": 0.0,
+        "in_flight": counters[8]
+    }
+    if previous is None:
+        return stats
+
+    elapsed = now - previous[0]
+    if elapsed <= 0:
+        return stats
+
+    # Sayaçlar 32 bit sistemlerde taşabilir; negatif farkları sıfır say
+    delta = [max(now_value - before, 0) for now_value, before in zip(counters, previous[1])]
+    reads, read_sectors, read_ms = delta[0], delta[2], delta[3]
+    writes, write_sectors, write_ms = delta[4], delta[6], delta[7]
+
+    stats["read_bytes"] = read_sectors * SECTOR_SIZE / elapsed
+    stats["write_bytes"] = write_sectors * SECTOR_SIZE / elapsed
+    stats["read_iops"] = reads / elapsed
+    stats["write_iops"] = writes / elapsed
+    stats["read_latency"] = read_ms / reads if reads else 0.0
+    stats["write_latency"] = write_ms / writes if writes else 0.0
+    stats["queue_depth"] = delta[10] / (elapsed * 1000)
+    stats["utilization"] = min(delta[9] / (elapsed * 10), 100.0)
+    return stats
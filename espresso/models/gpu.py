@@ -0,0 +1,342 @@
+"""
+Espresso - GPU arka uçları
+"""
+
+import os
+import re
+import glob
+
+import psutil
+
+from espresso.models.sysfs import read_text, read_int, open_fd, pread_int, close_fd, natural_key
+
+
+# nvmlValueType_t -> c_nvmlValue_t birlik alanı
+_SAMPLE_FIELDS = {
+    0: "dVal",
+    1: "uiVal",
+    2: "ulVal",
+    3: "ullVal",
+    4: "sllVal"
+}
+
+
+def _empty_memory():
+    """Boş GPU bellek bilgisi döndürür"""
+    return {"total": 0, "used": 0, "free": 0, "percent": 0}
+
+
+class NvidiaGPUBackend:
+    """NVML'i bir kez başlatıp tüm aygıtların tanıtıcılarını önbellekleyen GPU arka ucu
+
+    Aygıt tanıtıcıları ve ad, toplam bellek gibi statik özellikler
+    başlangıçta okunur; her turda yalnızca değişken sayaçlar sorgulanır.
+    NVML kullanılamıyorsa kurucu istisna fırlatır.
+    """
+
+    def __init__(self, nvml=None):
+        if nvml is None:
+            import pynvml as nvml
+        self.nvml = nvml
+        self.nvml.nvmlInit()
+
+        self.devices = []
+        for index in range(self.nvml.nvmlDeviceGetCount()):
+            handle = self.nvml.nvmlDeviceGetHandleByIndex(index)
+            self.devices.append({
+                "handle": handle,
+                "name": _decode(self.nvml.nvmlDeviceGetName(handle)),
+                "uuid": _decode(self.nvml.nvmlDeviceGetUUID(handle)),
+                "last_sample_ts": 0,
+                "samples_supported": True,
+                "last_process_ts": 0,
+                "process_util_supported": True
+            })
+
+        # PID -> süreç adı önbelleği (tüm aygıtlar için ortak)
+        self.process_names = ProcessNameCache()
+
+    def read(self):
+        """Tüm aygıtların anlık metriklerini döndürür"""
+        nvml = self.nvml
+        gpus = []
+
+        for index, device in enumerate(self.devices):
+            handle = device["handle"]
+            gpu = {
+                "index": index,
+                "name": device["name"],
+                "uuid": device["uuid"],
+                "usage": 0,
+                "temp": 0,
+                "memory": _empty_memory()
+            }
+
+            # Bir aygıtın hatası diğerlerini etkilemesin
+            try:
+                gpu["usage"] = nvml.nvmlDeviceGetUtilizationRates(handle).gpu
+                gpu["temp"] = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
+
+                memory = nvml.nvmlDeviceGetMemoryInfo(handle)
+                if memory.total:
+                    gpu["memory"] = {
+                        "total": memory.total,
+                        "used": memory.used,
+                        "free": memory.free,
+                        "percent": (memory.used / memory.total) * 100
+                    }
+            except nvml.NVMLError:
+                pass
+
+            # Sürücünün kendi örnek arabelleği: seyrek yoklamada kaçan
+            # ani yükleri de içeren alt-saniye kullanım geçmişi
+            gpu["samples"] = self._read_samples(device)
+
+            # GPU'yu kullanan süreçler
+            gpu["processes"] = self._read_processes(index, device)
+
+            gpus.append(gpu)
+
+        # Artık hiçbir GPU'da görünmeyen PID'lerin adlarını unut
+        self.process_names.retain(
+            process["pid"] for gpu in gpus for process in gpu["processes"]
+        )
+
+        return gpus
+
+    def _read_samples(self, device):
+        """Son okunan zaman damgasından bu yana biriken kullanım örneklerini döndürür
+
+        (zaman damgası [µs], kullanım yüzdesi) çiftlerinden oluşan, zamana göre
+        sıralı bir liste döner. Desteklenmeyen aygıtlarda None döner; geçmiş
+        o zaman anlık kullanımdan beslenir.
+        """
+        if not device["samples_supported"]:
+            return None
+
+        nvml = self.nvml
+        try:
+            value_type, samples = nvml.nvmlDeviceGetSamples(
+                device["handle"], nvml.NVML_GPU_UTILIZATION_SAMPLES, device["last_sample_ts"]
+            )
+        except nvml.NVMLError as e:
+            # Son okumadan bu yana örnek yoksa NOT_FOUND döner
+            if getattr(e, "value", None) == getattr(nvml, "NVML_ERROR_NOT_SUPPORTED", None):
+                device["samples_supported"] = False
+                return None
+            return []
+
+        field = _SAMPLE_FIELDS.get(value_type, "uiVal")
+        result = sorted(
+            (sample.timeStamp, getattr(sample.sampleValue, field))
+            for sample in samples
+            if sample.timeStamp > device["last_sample_ts"]
+        )
+        if result:
+            device["last_sample_ts"] = result[-1][0]
+        return result
+
+    def _read_processes(self, index, device):
+        """Aygıtta çalışan hesaplama/grafik süreçlerini bellek ve kullanımlarıyla döndürür"""
+        nvml = self.nvml
+        handle = device["handle"]
+        processes = {}
+
+        for kind, query in (("C", nvml.nvmlDeviceGetComputeRunningProcesses),
+                            ("G", nvml.nvmlDeviceGetGraphicsRunningProcesses)):
+            try:
+                running = query(handle)
+            except nvml.NVMLError:
+                continue
+
+            for info in running:
+                process = processes.get(info.pid)
+                if process is None:
+                    process = processes[info.pid] = {
+                        "pid": info.pid,
+                        "name": "",
+                        "gpu": index,
+                        "type": "",
+                        "memory": 0,
+                        "sm_util": None,
+                        "mem_util": None
+                    }
+                process["type"] += kind
+                # C+G süreçler aynı belleği iki listede de raporlayabilir;
+                # bazı sürücüler (ör. WDDM) ise hiç raporlamaz (None)
+                process["memory"] = max(process["memory"], info.usedGpuMemory or 0)
+
+        if processes and device["process_util_supported"]:
+            self._read_process_utilization(device, processes)
+
+        for process in processes.values():
+            process["name"] = self.process_names.get(process["pid"])
+
+        return list(processes.values())
+
+    def _read_process_utilization(self, device, processes):
+        """Süreç başına SM/bellek kullanımını son okumadan bu yana toplar"""
+        nvml = self.nvml
+        try:
+            samples = nvml.nvmlDeviceGetProcessUtilization(
+                device["handle"], device["last_process_ts"]
+            )
+        except nvml.NVMLError as e:
+            # Son okumadan bu yana örnek yoksa NOT_FOUND döner
+            if getattr(e, "value", None) == getattr(nvml, "NVML_ERROR_NOT_SUPPORTED", None):
+                device["process_util_supported"] = False
+            return
+
+        for sample in samples:
+            if sample.timeStamp > device["last_process_ts"]:
+                device["last_process_ts"] = sample.timeStamp
+
+            # Aynı süreç için birden fazla örnek gelirse en yüksek değeri göster
+            process = processes.get(sample.pid)
+            if process is not None:
+                process["sm_util"] = max(process["sm_util"] or 0, sample.smUtil)
+                process["mem_util"] = max(process["mem_util"] or 0, sample.memUtil)
+
+    def close(self):
+        """NVML'i kapatır"""
+        try:
+            self.nvml.nvmlShutdown()
+        except self.nvml.NVMLError:
+            pass
+        self.devices = []
+
+
+class ProcessNameCache:
+    """PID'den süreç adına önbellek; ad her PID için yalnızca bir kez sorgulanır"""
+
+    def __init__(self):
+        self.names = {}
+
+    def get(self, pid):
+        """PID'nin süreç adını döndürür"""
+        name = self.names.get(pid)
+        if name is None:
+            try:
+                process = psutil.Process(pid)
+                cmdline = process.cmdline()
+                name = process.name()
+                # python, java gibi yorumlayıcılarda betik adı daha anlamlıdır
+                if len(cmdline) > 1 and name in ("python", "python3", "java", "node"):
+                    name = f"{name} {os.path.basename(cmdline[1])}"
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # Başka bir PID ad alanındaki (ör. konteyner) süreçler
+                name = f"[{pid}]"
+            self.names[pid] = name
+        return name
+
+    def retain(self, pids):
+        """Yalnızca verilen PID'lerin adlarını tutar (PID yeniden kullanımına karşı)"""
+        active = set(pids)
+        for pid in [pid for pid in self.names if pid not in active]:
+            del self.names[pid]
+
+
+class AMDGPUBackend:
+    """amdgpu sürücüsünün sysfs dosyalarını doğrudan okuyan GPU arka ucu
+
+    Kartlar başlangıçta bir kez keşfedilir; her turda yalnızca açık dosya
+    tanımlayıcıları pread ile yeniden okunur, süreç başlatılmaz.
+    """
+
+    VENDOR_ID = "0x1002"
+
+    def __init__(self, sysfs_root="/sys"):
+        self.sysfs_root = sysfs_root
+        self.cards = []
+        self._discover()
+
+    def _discover(self):
+        """Tüm AMD kartlarını bulur ve izlenecek dosyaları açar"""
+        seen = set()
+        card_dirs = glob.glob(os.path.join(self.sysfs_root, "class", "drm", "card*"))
+
+        for card_dir in sorted(card_dirs, key=natural_key):
+            card_name = os.path.basename(card_dir)
+
+            # card0-DP-1 gibi bağlayıcı girdilerini atla
+            if not re.fullmatch(r"card\d+", card_name):
+                continue
+
+            device_dir = os.path.join(card_dir, "device")
+            if read_text(os.path.join(device_dir, "vendor")) != self.VENDOR_ID:
+                continue
+
+            # Aynı PCI aygıtına bağlanan kartları bir kez say
+            real_device = os.path.realpath(device_dir)
+            if real_device in seen:
+                continue
+            seen.add(real_device)
+
+            name = read_text(os.path.join(device_dir, "product_name"))
+            if not name:
+                device_id = read_text(os.path.join(device_dir, "device"))
+                name = f"AMD GPU {device_id}".strip()
+
+            vram_total = read_int(os.path.join(device_dir, "mem_info_vram_total"))
+
+            self.cards.append({
+                "card": card_name,
+                "name": name,
+                "vram_total": vram_total,
+                "busy_fd": open_fd(os.path.join(device_dir, "gpu_busy_percent")),
+                "vram_used_fd": open_fd(os.path.join(device_dir, "mem_info_vram_used")),
+                "temp_fd": open_fd(self._find_temp_input(device_dir))
+            })
+
+    @staticmethod
+    def _find_temp_input(device_dir):
+        """Kartın hwmon dizinindeki kenar (edge) sıcaklık dosyasını bulur"""
+        inputs = sorted(glob.glob(os.path.join(device_dir, "hwmon", "hwmon*", "temp*_input")), key=natural_key)
+        for input_path in inputs:
+            label = read_text(input_path[:-len("_input")] + "_label")
+            if label == "edge":
+                return input_path
+        return inputs[0] if inputs else None
+
+    def read(self):
+        """Tüm kartların anlık metriklerini döndürür"""
+        gpus = []
+
+        for index, card in enumerate(self.cards):
+            total = card["vram_total"]
+            used = pread_int(card["vram_used_fd"])
+            temp = pread_int(card["temp_fd"]) / 1000
+
+            memory = _empty_memory()
+            if total:
+                memory = {
+                    "total": total,
+                    "used": used,
+                    "free": total - used,
+                    "percent": (used / total) * 100
+                }
+
+            gpus.append({
+                "index": index,
+                "name": card["name"],
+                "usage": pread_int(card["busy_fd"]),
+                "temp": temp,
+                "memory": memory,
+                "processes": []
+            })
+
+        return gpus
+
+    def close(self):
+        """Açık sysfs dosyalarını kapatır"""
+        for card in self.cards:
+            for key in ("busy_fd", "vram_used_fd", "temp_fd"):
+                close_fd(card[key])
+        self.cards = []
+
+
+def _decode(value):
+    """Eski pynvml sürümlerinin döndürdüğü bayt dizelerini çözer"""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return value
@@ -0,0 +1,441 @@
+"""
+Espresso - Zaman serisi geçmiş deposu
+"""
+
+import os
+import glob
+import mmap
+import time
+import struct
+from array import array
+from urllib.parse import quote, unquote
+
+
+# Seri başına varsayılan kapasite (1 sn aralıkla 4 saat)
+DEFAULT_CAPACITY = 4 * 60 * 60
+
+# Toplama katmanları: (kova genişliği sn, kova sayısı)
+ROLLUP_TIERS = (
+    (10, 6 * 60 * 24),      # 10 sn kovalar, 1 gün
+    (60, 60 * 24 * 7),      # 1 dk kovalar, 1 hafta
+    (600, 6 * 24 * 7)       # 10 dk kovalar, 1 hafta
+)
+
+# Her katman kovası için tutulan alanlar
+ROLLUP_FIELDS = ("min", "max", "mean", "last")
+
+
+class RingBuffer:
+    """Sabit kapasiteli, tipli dizi tabanlı halka arabellek
+
+    Her değer hem i hem de i + kapasite konumuna yazılır. Böylece son n
+    değer her zaman bitişik durur ve kopyalanmadan memoryview olarak
+    okunabilir; ekleme O(1)'dir.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, typecode="f"):
+        self.capacity = capacity
+        self.data = array(typecode, bytes(array(typecode).itemsize * 2 * capacity))
+        self.head = 0  # Bir sonraki yazma konumu
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        """Arabelleğe bir değer ekler, doluysa en eskisinin üzerine yazar"""
+        self.data[self.head] = value
+        self.data[self.head + self.capacity] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def extend(self, values):
+        """Arabelleğe birden fazla değer ekler"""
+        for value in values:
+            self.append(value)
+
+    def view(self, n=None):
+        """Son n değeri (eskiden yeniye) kopyasız memoryview olarak döndürür"""
+        if n is None or n > self.count:
+            n = self.count
+        end = self.head + self.capacity
+        return memoryview(self.data)[end - n:end]
+
+    def last(self, default=0):
+        """En son eklenen değeri döndürür"""
+        if not self.count:
+            return default
+        return self.data[self.head + self.capacity - 1]
+
+    def select(self, window, max_points, resolution=1):
+        """Toplama katmanı olmayan seride RollupSeries.select ile aynı biçimde son değerleri döndürür"""
+        n = max(min(int(window / resolution), max_points), 1)
+        return resolution, self.view(n), None, None
+
+
+class MappedRingBuffer(RingBuffer):
+    """Sabit boyutlu, belleğe eşlenmiş bir dosyada tutulan halka arabellek
+
+    Dosya küçük bir başlık ve RingBuffer ile aynı çift yazımlı veri
+    düzeninden oluşur. Değerler her turda yerinde yazılır; dosya büyümez
+    ve fsync yapılmaz. Yeniden açıldığında önceki geçmiş hemen görünür;
+    kapalı kalınan süre, başlıktaki son güncelleme zamanı ve örnekler arası
+    ortalama süreyle boş örneklerle doldurulur, kapasiteyi aşıyorsa geçmiş
+    sıfırlanır.
+    """
+
+    # magic, sürüm, tür kodu, kapasite, baş, sayı, son güncelleme zamanı, örnek aralığı
+    HEADER = struct.Struct("<4sHcxIIIdf")
+    HEADER_SIZE = 32
+    MAGIC = b"ESPH"
+    VERSION = 1
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY, typecode="f"):
+        self.path = path
+        self.capacity = capacity
+        self.typecode = typecode
+        self.head = 0
+        self.count = 0
+        self.updated = 0.0   # son ekleme zamanı (Unix)
+        self.interval = 0.0  # örnekler arası ortalama süre (sn), bilinmiyorsa 0
+
+        itemsize = array(typecode).itemsize
+        size = self.HEADER_SIZE + itemsize * 2 * capacity
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Düzen değiştiyse (ör. kapasite) son değerleri yeni dosyaya taşı
+            migrated = None
+            if os.fstat(fd).st_size != size:
+                migrated = self._read_values(fd)
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+            self.mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        self.data = memoryview(self.mmap)[self.HEADER_SIZE:].cast(typecode)
+
+        header = self._unpack_header()
+        if header and header[2] == typecode.encode() and header[3] == capacity:
+            # Aynı düzende kaydedilmiş geçmiş: kopyalamadan olduğu gibi kullan
+            self.head = header[4] % capacity
+            self.count = min(header[5], capacity)
+            self.updated = header[6]
+            self.interval = header[7]
+            self._fill_gap(time.time())
+        else:
+            self._write_header()
+            if migrated:
+                self.extend(migrated[-capacity:])
+
+    @classmethod
+    def _read_values(cls, fd):
+        """Eski düzendeki bir dosyanın değerlerini (eskiden yeniye) döndürür"""
+        raw = os.pread(fd, os.fstat(fd).st_size, 0)
+        if len(raw) < cls.HEADER_SIZE:
+            return None
+
+        magic, version, typecode, capacity, head, count, _, _ = cls.HEADER.unpack_from(raw)
+        if magic != cls.MAGIC or version != cls.VERSION or not capacity:
+            return None
+
+        try:
+            data = array(typecode.decode())
+            data.frombytes(raw[cls.HEADER_SIZE:cls.HEADER_SIZE + data.itemsize * 2 * capacity])
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if len(data) != 2 * capacity:
+            return None
+
+        end = head % capacity + capacity
+        return data[end - min(count, capacity):end].tolist()
+
+    def _unpack_header(self):
+        """Başlığı okur, geçersizse None döndürür"""
+        header = self.HEADER.unpack_from(self.mmap)
+        if header[0] != self.MAGIC or header[1] != self.VERSION:
+            return None
+        return header
+
+    def _write_header(self):
+        """Baş/sayı bilgisini dosya başlığına yazar"""
+        self.HEADER.pack_into(
+            self.mmap, 0, self.MAGIC, self.VERSION, self.typecode.encode(),
+            self.capacity, self.head, self.count, self.updated, self.interval
+        )
+
+    def _fill_gap(self, now):
+        """Uygulamanın kapalı kaldığı süreyi boş örneklerle doldurur
+
+        Grafikler örnekleri eşit aralıklı ve şimdiye hizalı çizer; boşluk
+        doldurulmazsa eski geçmiş şimdiyle bitişikmiş gibi kayar. Boşluk
+        kapasiteyi aşıyorsa eski örneklerin hiçbiri pencerede kalmaz.
+        """
+        if self.count and self.interval > 0 and self.updated > 0:
+            missing = round((now - self.updated) / self.interval) - 1
+            if missing >= self.capacity:
+                self.head = 0
+                self.count = 0
+            elif missing > 0:
+                RingBuffer.extend(self, [0] * missing)
+
+        # Seri artık şimdiye kadar dolu; yeniden kapanırsa boşluk buradan ölçülür
+        self.updated = now
+        self._write_header()
+
+    def append(self, value):
+        """Değeri ekler ve başlığı yerinde günceller"""
+        self.extend((value,))
+
+    def extend(self, values):
+        """Aynı anda gelen değerleri ekler, örnek aralığını tahmin eder ve başlığı günceller"""
+        values = list(values)
+        if not values:
+            return
+
+        now = time.time()
+        if self.updated and now > self.updated:
+            step = (now - self.updated) / len(values)
+            self.interval = step if not self.interval else 0.9 * self.interval + 0.1 * step
+
+        for value in values:
+            RingBuffer.append(self, value)
+        self.updated = now
+        self._write_header()
+
+    def close(self):
+        """Eşlemeyi kapatır (çekirdek sayfaları kendi zamanında diske yazar)"""
+        try:
+            self.data.release()
+            self.mmap.close()
+        except BufferError:
+            # Grafikler hâlâ bir görünüm tutuyor; eşleme süreçle birlikte kapanır
+            pass
+
+
+class RollupTier:
+    """Sabit genişlikli zaman kovalarında min/max/ortalama/son değer tutan katman"""
+
+    def __init__(self, width, capacity, make_ring):
+        self.width = width
+        self.capacity = capacity
+        self.rings = {field: make_ring(field, capacity) for field in ROLLUP_FIELDS}
+        self.bucket = None  # [kova no, min, max, toplam, ağırlık, son]
+
+    def __len__(self):
+        return len(self.rings["mean"])
+
+    def add(self, timestamp, vmin, vmax, vmean, vlast, weight):
+        """Kovaya bir özet ekler; kova kapandıysa kapanan kovanın özetini döndürür"""
+        bucket_id = int(timestamp // self.width)
+        closed = None
+        if self.bucket is not None and self.bucket[0] != bucket_id:
+            closed = self._flush()
+
+        bucket = self.bucket
+        if bucket is None:
+            self.bucket = [bucket_id, vmin, vmax, vmean * weight, weight, vlast]
+        else:
+            bucket[1] = min(bucket[1], vmin)
+            bucket[2] = max(bucket[2], vmax)
+            bucket[3] += vmean * weight
+            bucket[4] += weight
+            bucket[5] = vlast
+        return closed
+
+    def _flush(self):
+        """Açık kovayı halka arabelleklere yazar ve özetini döndürür"""
+        bucket_id, vmin, vmax, total, weight, vlast = self.bucket
+        vmean = total / weight
+        self.rings["min"].append(vmin)
+        self.rings["max"].append(vmax)
+        self.rings["mean"].append(vmean)
+        self.rings["last"].append(vlast)
+        self.bucket = None
+        return (bucket_id * self.width, vmin, vmax, vmean, vlast, weight)
+
+
+class RollupSeries:
+    """Ham örneklerin yanında kademeli toplama katmanları tutan seri
+
+    Her örnek ham halka arabelleğe yazılır ve ilk katmanın açık kovasına
+    eklenir; bir kova kapandığında özeti bir sonraki katmana aktarılır.
+    Böylece uzun zaman pencereleri sınırlı bellekle ve az noktayla çizilir.
+    """
+
+    def __init__(self, base, make_ring, tiers=ROLLUP_TIERS):
+        self.base = base
+        self.tiers = [
+            RollupTier(width, capacity,
+                       lambda field, cap, width=width: make_ring(f"{width}s.{field}", cap))
+            for width, capacity in tiers
+        ]
+        # Örnekler arası ortalama süre (tahmini); kayıtlı seride dosyadan başlar
+        self.interval = getattr(base, "interval", 0)
+        self.last_timestamp = None
+
+    def __len__(self):
+        return len(self.base)
+
+    @property
+    def capacity(self):
+        return self.base.capacity
+
+    def append(self, value, timestamp=None):
+        """Seriye bir değer ekler"""
+        self.extend((value,), timestamp)
+
+    def extend(self, values, timestamp=None):
+        """Aynı anda gelen değerleri (ör. sürücü örnek arabelleği) ekler"""
+        values = list(values)
+        if not values:
+            return
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        # Ham çözünürlüğü tahmin et; grafikler katman seçerken kullanır
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            step = (timestamp - self.last_timestamp) / len(values)
+            self.interval = step if not self.interval else 0.9 * self.interval + 0.1 * step
+        self.last_timestamp = timestamp
+
+        self.base.extend(values)
+        for value in values:
+            # Kapanan kovaları bir üst katmana aktar
+            summary = (timestamp, value, value, value, value, 1)
+            for tier in self.tiers:
+                summary = tier.add(*summary)
+                if summary is None:
+                    break
+
+    def view(self, n=None):
+        """Ham serinin son n değerini kopyasız döndürür"""
+        return self.base.view(n)
+
+    def last(self, default=0):
+        """En son eklenen değeri döndürür"""
+        return self.base.last(default)
+
+    def select(self, window, max_points):
+        """Zaman penceresini en fazla max_points noktayla kapsayan katmanı seçer
+
+        (çözünürlük sn, ortalama, min, max) döndürür; ham seride min/max None'dır.
+        """
+        resolution = self.interval or 1
+        n = max(int(window / resolution), 1)
+        if n <= max_points and n <= self.base.capacity:
+            return resolution, self.base.view(n), None, None
+
+        for i, tier in enumerate(self.tiers):
+            n = max(int(window // tier.width), 1)
+            if (n <= max_points and n <= tier.capacity) or i == len(self.tiers) - 1:
+                if not len(tier) and len(self.base):
+                    # Henüz bu katmanda kova yok: eldeki en ince veriyi göster
+                    return resolution, self.base.view(max_points), None, None
+                n = min(n, tier.capacity)
+                rings = tier.rings
+                return tier.width, rings["mean"].view(n), rings["min"].view(n), rings["max"].view(n)
+
+
+class TimeSeriesStore:
+    """Tüm kontrolcülerin paylaştığı, adlandırılmış halka arabellek deposu
+
+    Seri adları noktalı hiyerarşi izler: "cpu", "cpu.core.3", "ram",
+    "swap", "gpu.0", "disk./home" gibi. Bir dizin verilirse her seri o
+    dizinde belleğe eşlenmiş bir halka dosyasında tutulur ve yeniden
+    başlatmalardan sonra da korunur.
+    """
+
+    SUFFIX = ".ring"
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, typecode="f", directory=None):
+        self.capacity = capacity
+        self.typecode = typecode
+        self.directory = directory
+        self.series = {}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._open_existing()
+
+    def _open_existing(self):
+        """Dizindeki kayıtlı serileri açar; grafikler ilk turda dolu görünür"""
+        found = {}
+        for path in glob.glob(os.path.join(self.directory, "*" + self.SUFFIX)):
+            # Katman dosyaları "ad@10s.mean.ring" biçimindedir
+            key = unquote(os.path.basename(path)[:-len(self.SUFFIX)])
+            name, _, tier = key.partition("@")
+            found[name] = found.get(name, False) or bool(tier)
+
+        for name, rollup in found.items():
+            capacity = self._stored_capacity(self._path(name)) or self.capacity
+            try:
+                self.get(name, capacity, rollup)
+            except (OSError, ValueError) as e:
+                print(f"Geçmiş dosyası açılamadı ({name}): {e}")
+
+    def _path(self, key):
+        """Seri anahtarının dosya yolunu döndürür"""
+        # "disk./home" gibi adlar dosya adında güvenle kodlanır
+        return os.path.join(self.directory, quote(key, safe="") + self.SUFFIX)
+
+    def _ring(self, key, capacity):
+        """Depo türüne göre bellek içi ya da dosyaya eşlenmiş halka arabellek oluşturur"""
+        if self.directory:
+            return MappedRingBuffer(self._path(key), capacity, self.typecode)
+        return RingBuffer(capacity, self.typecode)
+
+    @staticmethod
+    def _stored_capacity(path):
+        """Halka dosyasının başlığındaki kapasiteyi döndürür"""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(MappedRingBuffer.HEADER.size)
+            return MappedRingBuffer.HEADER.unpack(header)[3]
+        except (OSError, struct.error):
+            return None
+
+    def get(self, name, capacity=None, rollup=True):
+        """Adlandırılmış seriyi döndürür, yoksa oluşturur
+
+        rollup True ise seri uzun pencereler için toplama katmanları da tutar;
+        çekirdek başına seriler gibi çok sayıdaki ayrıntı serileri için kapatılabilir.
+        """
+        series = self.series.get(name)
+        if series is None:
+            base = self._ring(name, capacity or self.capacity)
+            if rollup:
+                series = RollupSeries(base, lambda key, cap: self._ring(f"{name}@{key}", cap))
+            else:
+                series = base
+            self.series[name] = series
+        return series
+
+    def append(self, name, value, capacity=None, rollup=True):
+        """Seriye bir değer ekler"""
+        self.get(name, capacity, rollup).append(value)
+
+    def view(self, name, n=None):
+        """Serinin son n değerini kopyasız döndürür"""
+        ring = self.series.get(name)
+        if ring is None:
+            return memoryview(array(self.typecode))
+        return ring.view(n)
+
+    def names(self, prefix=""):
+        """Verilen önekle başlayan seri adlarını döndürür"""
+        return [name for name in self.series if name.startswith(prefix)]
+
+    def close(self):
+        """Dosyaya eşlenmiş serileri kapatır"""
+        for series in self.series.values():
+            rings = [series]
+            if isinstance(series, RollupSeries):
+                rings = [series.base]
+                rings += [ring for tier in series.tiers for ring in tier.rings.values()]
+            for ring in rings:
+                if isinstance(ring, MappedRingBuffer):
+                    ring.close()
@@ -0,0 +1,156 @@
+"""
+Espresso - /proc/meminfo ve /proc/vmstat tabanlı bellek modeli
+"""
+
+import os
+import time
+
+from espresso.models.sysfs import open_fd, pread_all, close_fd
+
+
+# /proc/meminfo alanı -> kayıttaki ad; kayıt sabit yuvalıdır (alan sırası)
+MEMINFO_FIELDS = (
+    ("MemTotal", "total"),
+    ("MemFree", "free"),
+    ("MemAvailable", "available"),
+    ("Buffers", "buffers"),
+    ("Cached", "cached"),
+    ("SwapCached", "swap_cached"),
+    ("Active", "active"),
+    ("Inactive", "inactive"),
+    ("Dirty", "dirty"),
+    ("Writeback", "writeback"),
+    ("AnonPages", "anon"),
+    ("Mapped", "mapped"),
+    ("Shmem", "shmem"),
+    ("Slab", "slab"),
+    ("SReclaimable", "slab_reclaimable"),
+    ("SUnreclaim", "slab_unreclaimable"),
+    ("KernelStack", "kernel_stack"),
+    ("PageTables", "page_tables"),
+    ("Committed_AS", "committed"),
+    ("SwapTotal", "swap_total"),
+    ("SwapFree", "swap_free"),
+    ("HugePages_Total", "hugepages_total"),
+    ("HugePages_Free", "hugepages_free"),
+    ("Hugepagesize", "hugepage_size"),
+    ("Hugetlb", "hugetlb")
+)
+
+# /proc/vmstat sayacı -> saniyelik hız adı (pswp* sayfa, pgpg* KB cinsindendir)
+VMSTAT_FIELDS = (
+    ("pswpin", "swap_in"),
+    ("pswpout", "swap_out"),
+    ("pgpgin", "page_in"),
+    ("pgpgout", "page_out"),
+    ("pgmajfault", "major_faults")
+)
+
+
+class MemInfo:
+    """/proc/meminfo ve /proc/vmstat'ı her turda tek okumada ayrıştıran sınıf
+
+    meminfo alanları sabit yuvalı bir kayda (bayt) yazılır; vmstat
+    sayaçlarının iki okuma arasındaki farkından swap giriş/çıkış ve sayfa
+    giriş/çıkış hızları hesaplanır.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.meminfo_fd = open_fd(os.path.join(proc_root, "meminfo"))
+        self.vmstat_fd = open_fd(os.path.join(proc_root, "vmstat"))
+        self.meminfo_buffer = bytearray(8 * 1024)
+        self.vmstat_buffer = bytearray(16 * 1024)
+
+        # Alan adı -> kayıttaki yuva
+        self.meminfo_slots = {
+            key.encode("ascii"): slot for slot, (key, _) in enumerate(MEMINFO_FIELDS)
+        }
+        self.vmstat_slots = {
+            key.encode("ascii"): slot for slot, (key, _) in enumerate(VMSTAT_FIELDS)
+        }
+
+        self.previous_time = None
+        self.previous = None  # önceki vmstat sayaçları
+
+    @property
+    def available(self):
+        """/proc/meminfo okunabiliyor mu"""
+        return self.meminfo_fd is not None
+
+    def read(self):
+        """(meminfo kaydı, vmstat hızları) sözlüklerini döndürür"""
+        now = time.monotonic()
+
+        record = [0] * len(MEMINFO_FIELDS)
+        if self.meminfo_fd is not None:
+            self.meminfo_buffer, size = pread_all(self.meminfo_fd, self.meminfo_buffer)
+            slots = self.meminfo_slots
+            for line in bytes(memoryview(self.meminfo_buffer)[:size]).split(b"\n"):
+                # MemTotal:       16318412 kB
+                parts = line.split()
+                if len(parts) < 2:
+                    continue
+                slot = slots.get(parts[0][:-1])
+                if slot is not None:
+                    value = int(parts[1])
+                    record[slot] = value * 1024 if len(parts) > 2 else value
+
+        counters = [0] * len(VMSTAT_FIELDS)
+        if self.vmstat_fd is not None:
+            self.vmstat_buffer, size = pread_all(self.vmstat_fd, self.vmstat_buffer)
+            slots = self.vmstat_slots
+            for line in bytes(memoryview(self.vmstat_buffer)[:size]).split(b"\n"):
+                name, _, value = line.partition(b" ")
+                slot = slots.get(name)
+                if slot is not None:
+                    counters[slot] = int(value)
+
+        rates = dict.fromkeys((name for _, name in VMSTAT_FIELDS), 0.0)
+        if self.previous is not None and now > self.previous_time:
+            elapsed = now - self.previous_time
+            for (_, name), value, before in zip(VMSTAT_FIELDS, counters, self.previous):
+                rates[name] = max(value - before, 0) / elapsed
+
+        self.previous = counters
+        self.previous_time = now
+
+        details = {name: value for (_, name), value in zip(MEMINFO_FIELDS, record)}
+        return details, rates
+
+    @staticmethod
+    def summarize(details):
+        """psutil.virtual_memory/swap_memory ile aynı özetleri (RAM, swap) döndürür"""
+        total = details["total"]
+        free = details["free"]
+
+        # psutil ile aynı: geri kazanılabilir slab da önbellek sayılır
+        cached = details["cached"] + details["slab_reclaimable"]
+        used = total - free - cached - details["buffers"]
+        if used < 0:
+            used = total - free
+
+        available = details["available"] or free
+        ram = {
+            "total": total,
+            "available": available,
+            "used": used,
+            "free": free,
+            "percent": round((total - available) / total * 100, 1) if total else 0.0
+        }
+
+        swap_total = details["swap_total"]
+        swap_used = swap_total - details["swap_free"]
+        swap = {
+            "total": swap_total,
+            "used": swap_used,
+            "free": details["swap_free"],
+            "percent": round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+        }
+        return ram, swap
+
+    def close(self):
+        """Açık procfs dosyalarını kapatır"""
+        close_fd(self.meminfo_fd)
+        close_fd(self.vmstat_fd)
+        self.meminfo_fd = None
+        self.vmstat_fd = None
@@ -2,70 +2,278 @@
 Espresso - Sistem metrikleri modeli
 """
 
-import os
+import time
 import psutil
-import subprocess
 from pathlib import Path
 
+from espresso.models.cpustat import CPUStat
+from espresso.models.diskstats import DiskStats
+from espresso.models.meminfo import MemInfo
+from espresso.models.netdev import NetDev
+from espresso.models.pressure import PressureStall
+from espresso.models.sensors import ThermalSensors
+from espresso.models.topology import CPUTopology
+from espresso.models.mounts import MountTable, MountUsagePoller
+from espresso.models.gpu import NvidiaGPUBackend, AMDGPUBackend
 
-class SystemMetrics:
+
+class MetricsReader:
+    """SystemMetrics ve MetricsSnapshot için ortak getter metodları"""
+    
+    def get_cpu_usage(self):
+        """CPU kullanım yüzdesini döndürür"""
+        return self.cpu_usage
+    
+    def get_cpu_temperature(self):
+        """CPU sıcaklığını döndürür"""
+        return self.cpu_temp
+    
+    def get_cpu_package_temperatures(self):
+        """CPU paket sıcaklıklarını döndürür"""
+        return self.cpu_temps["packages"]
+    
+    def get_cpu_core_temperatures(self):
+        """CPU çekirdek sıcaklıklarını döndürür"""
+        return self.cpu_temps["cores"]
+    
+    def get_cpu_core_usages(self):
+        """CPU çekirdek kullanımlarını döndürür"""
+        return self.cpu_cores
+    
+    def get_cpu_times(self):
+        """Toplam CPU zaman dağılımını (user/system/iowait/steal/irq... yüzdeleri) döndürür"""
+        return self.cpu_times
+    
+    def get_cpu_core_times(self):
+        """Çekirdek başına CPU zaman dağılımlarını (alan -> çekirdek değerleri listesi) döndürür"""
+        return self.cpu_core_times
+    
+    def get_cpu_groups(self):
+        """Düğüm, soket ve fiziksel çekirdek başına ortalama CPU kullanımlarını döndürür"""
+        return self.cpu_groups
+    
+    def get_ram_info(self):
+        """RAM bilgilerini döndürür"""
+        return self.ram_info
+    
+    def get_swap_info(self):
+        """Swap bilgilerini döndürür"""
+        return self.swap_info
+    
+    def get_memory_details(self):
+        """/proc/meminfo dökümünü (önbellek, kirli, slab, hugepage... bayt) döndürür"""
+        return self.memory_details
+    
+    def get_node_memory(self):
+        """NUMA düğümü başına bellek kullanımını döndürür"""
+        return self.node_memory
+    
+    def get_vmstat_rates(self):
+        """Swap giriş/çıkış (sayfa/sn), sayfalama (KB/sn) ve büyük hata hızlarını döndürür"""
+        return self.vmstat_rates
+    
+    def get_gpu_type(self):
+        """GPU türünü döndürür"""
+        return self.gpu_type
+    
+    def get_gpu_usage(self):
+        """GPU kullanım yüzdesini döndürür"""
+        return self.gpu_info.get("usage", 0)
+    
+    def get_gpu_temperature(self):
+        """GPU sıcaklığını döndürür"""
+        return self.gpu_info.get("temp", 0)
+    
+    def get_gpu_memory(self):
+        """GPU bellek bilgilerini döndürür"""
+        return self.gpu_info.get("memory", {"total": 0, "used": 0, "free": 0, "percent": 0})
+    
+    def get_gpu_info(self):
+        """Tüm GPU bilgilerini döndürür"""
+        return self.gpu_info
+    
+    def get_gpus(self):
+        """Her GPU için ayrı bilgi listesini döndürür"""
+        return self.gpus
+    
+    def get_disk_info(self):
+        """Disk bilgilerini döndürür"""
+        return self.disk_info
+    
+    def get_disk_io(self):
+        """Blok aygıtı başına G/Ç hızlarını döndürür"""
+        return self.disk_io
+    
+    def get_network(self):
+        """Ağ arayüzü başına saniyelik hızları döndürür"""
+        return self.net_info
+    
+    def get_pressure(self):
+        """Kaynak başına basınç duraklama bilgisini (PSI) döndürür"""
+        return self.pressure
+    
+    def get_version(self, section):
+        """Bölümün kaç kez güncellendiğini döndürür"""
+        return self.versions.get(section, 0)
+    
+    def to_dict(self):
+        """Metrikleri JSON/msgpack ile yazılabilecek bir sözlük olarak döndürür"""
+        # Sürücü örnek arabelleği yalnızca son GPU turunun farkıdır; kayıtlarda tekrarlanmasın
+        gpus = [
+            {key: value for key, value in gpu.items() if key != "samples"}
+            for gpu in self.gpus
+        ]
+        
+        return {
+            "timestamp": self.timestamp,
+            "seq": self.seq,
+            "cpu": {
+                "usage": self.cpu_usage,
+                "cores": self.cpu_cores,
+                "times": self.cpu_times,
+                "core_times": self.cpu_core_times,
+                "groups": self.cpu_groups,
+                "temp": self.cpu_temp,
+                "temps": self.cpu_temps
+            },
+            "ram": self.ram_info,
+            "swap": self.swap_info,
+            "memory": self.memory_details,
+            "vmstat": self.vmstat_rates,
+            "nodes": {str(node): memory for node, memory in self.node_memory.items()},
+            "gpus": gpus,
+            "disks": self.disk_info,
+            "disk_io": self.disk_io,
+            "network": self.net_info,
+            "pressure": self.pressure
+        }
+
+
+class SystemMetrics(MetricsReader):
     """Sistem performans metriklerini toplayan sınıf"""
     
+    # Bağımsız olarak örneklenebilen metrik bölümleri
+    SECTIONS = ("cpu", "temp", "ram", "gpu", "disk", "io", "net", "psi")
+    
     def __init__(self):
         self.cpu_usage = 0
         self.cpu_temp = 0
+        self.cpu_temps = {"packages": {}, "cores": {}}
         self.cpu_cores = []
+        self.cpu_times = {}
+        self.cpu_core_times = {}
+        self.cpu_groups = {}
         self.ram_info = {}
         self.swap_info = {}
+        self.memory_details = {}
+        self.vmstat_rates = {}
+        self.node_memory = {}
         self.gpu_type = None
         self.gpu_info = {}
+        self.gpus = []
+        self.gpu_backend = None
         self.disk_info = {}
+        self.disk_io = {}
+        self.net_info = {}
+        self.pressure = {}
+        self.seq = 0
+        self.timestamp = 0
+        self.versions = dict.fromkeys(self.SECTIONS, 0)
+        
+        # Bölüm adı -> güncelleme metodu
+        self.updaters = {
+            "cpu": self._update_cpu,
+            "temp": self._update_temperature,
+            "ram": self._update_ram,
+            "gpu": self._update_gpu,
+            "disk": self._update_disk,
+            "io": self._update_io,
+            "net": self._update_network,
+            "psi": self._update_pressure
+        }
+        
+        # /proc/stat bir kez açılır, her turda tek okumayla ayrıştırılır
+        self.cpu_stat = CPUStat()
+        
+        # /proc/meminfo ve /proc/vmstat bir kez açılır
+        self.mem_info = MemInfo()
+        
+        # NUMA düğümleri, soketler ve SMT kardeşleri bir kez keşfedilir
+        self.topology = CPUTopology()
+        
+        # Sıcaklık sensörlerini bir kez keşfet
+        self.thermal = ThermalSensors()
+        
+        # Bağlama noktaları önbelleği
+        self.mount_table = MountTable()
+        self.usage_poller = MountUsagePoller()
+        
+        # /proc/diskstats bir kez açılır
+        self.disk_stats = DiskStats()
+        
+        # /proc/net/dev bir kez açılır
+        self.net_dev = NetDev()
+        
+        # /proc/pressure dosyaları bir kez açılır (PSI destekleniyorsa)
+        self.pressure_stall = PressureStall()
         
         # GPU türünü belirle
         self._detect_gpu()
     
     def update_all(self):
         """Tüm metrikleri günceller"""
-        self._update_cpu()
-        self._update_ram()
-        self._update_gpu()
-        self._update_disk()
+        for section in self.SECTIONS:
+            self.update(section)
+    
+    def update(self, section):
+        """Tek bir metrik bölümünü günceller ve sürümünü artırır"""
+        self.updaters[section]()
+        
+        # Yayınlanmış görüntüler sözlüğü paylaştığı için yenisini oluştur
+        versions = dict(self.versions)
+        versions[section] += 1
+        self.versions = versions
+        
+        self.seq += 1
+        self.timestamp = time.time()
+    
+    def snapshot(self):
+        """Güncel metriklerin değişmez bir kopyasını döndürür"""
+        return MetricsSnapshot(self)
     
     def _update_cpu(self):
         """CPU metriklerini günceller"""
-        # Genel CPU kullanımı
-        self.cpu_usage = psutil.cpu_percent()
+        # Toplam ve çekirdek başına dağılım tek /proc/stat okumasından
+        self.cpu_times, self.cpu_core_times = self.cpu_stat.read()
         
-        # Çekirdek kullanımları
-        self.cpu_cores = psutil.cpu_percent(percpu=True)
+        # Genel ve çekirdek kullanımları
+        self.cpu_usage = self.cpu_times["usage"]
+        self.cpu_cores = self.cpu_core_times["usage"]
         
-        # CPU sıcaklığı (lm-sensors kullanarak)
-        try:
-            sensors_output = subprocess.check_output(
-                ["sensors"], 
-                universal_newlines=True,
-                stderr=subprocess.DEVNULL
-            )
-            
-            # Çıktıyı işle ve sıcaklığı bul
-            for line in sensors_output.split("\n"):
-                if "Core" in line and "°C" in line:
-                    temp_str = line.split("+")[1].split("°C")[0].strip()
-                    try:
-                        temp = float(temp_str)
-                        # Birden fazla çekirdek varsa ortalama al
-                        if self.cpu_temp == 0:
-                            self.cpu_temp = temp
-                        else:
-                            self.cpu_temp = (self.cpu_temp + temp) / 2
-                    except ValueError:
-                        pass
-        except (subprocess.SubprocessError, FileNotFoundError):
-            # lm-sensors yoksa veya çalışmazsa
-            self.cpu_temp = 0
+        # Düğüm/soket/fiziksel çekirdek toplamları
+        self.cpu_groups = self.topology.aggregate(self.cpu_cores, self.cpu_stat.core_ids)
+    
+    def _update_temperature(self):
+        """CPU sıcaklıklarını sysfs sensörlerinden günceller"""
+        # Paket ve çekirdek sıcaklıkları
+        self.cpu_temps = self.thermal.read()
+        self.cpu_temp = self.thermal.summarize(self.cpu_temps)
     
     def _update_ram(self):
         """RAM metriklerini günceller"""
+        # Düğüm başına bellek (NUMA yoksa boş)
+        self.node_memory = self.topology.read_node_memory()
+        
+        if not self.mem_info.available:
+            self._update_ram_psutil()
+            return
+        
+        # meminfo ve vmstat tek turda okunur; özetler aynı kayıttan türetilir
+        self.memory_details, self.vmstat_rates = self.mem_info.read()
+        self.ram_info, self.swap_info = self.mem_info.summarize(self.memory_details)
+    
+    def _update_ram_psutil(self):
+        """/proc/meminfo bulunmayan sistemlerde RAM metriklerini psutil ile günceller"""
         # RAM bilgileri
         ram = psutil.virtual_memory()
         self.ram_info = {
@@ -87,39 +295,22 @@ class SystemMetrics:
     
     def _detect_gpu(self):
         """GPU türünü tespit eder"""
-        # NVIDIA GPU kontrolü
+        # NVIDIA GPU kontrolü (NVML bir kez başlatılır)
         try:
-            import pynvml
-            pynvml.nvmlInit()
-            self.gpu_type = "nvidia"
-            return
-        except (ImportError, Exception):
-            pass
-        
-        # AMD GPU kontrolü
-        try:
-            # rocm-smi veya benzeri bir araç kullanılabilir
-            result = subprocess.run(
-                ["rocm-smi"], 
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            if result.returncode == 0:
-                self.gpu_type = "amd"
+            nvidia_backend = NvidiaGPUBackend()
+            if nvidia_backend.devices:
+                self.gpu_type = "nvidia"
+                self.gpu_backend = nvidia_backend
                 return
-        except (FileNotFoundError, subprocess.SubprocessError):
+        except (ImportError, Exception):
             pass
         
-        # Alternatif AMD kontrolü
-        try:
-            if os.path.exists("/sys/class/drm/card0/device/vendor"):
-                with open("/sys/class/drm/card0/device/vendor", "r") as f:
-                    vendor = f.read().strip()
-                    if vendor == "0x1002":  # AMD vendor ID
-                        self.gpu_type = "amd"
-                        return
-        except (FileNotFoundError, IOError):
-            pass
+        # AMD GPU kontrolü (tüm kartlar, sysfs üzerinden)
+        amd_backend = AMDGPUBackend()
+        if amd_backend.cards:
+            self.gpu_type = "amd"
+            self.gpu_backend = amd_backend
+            return
         
         self.gpu_type = None
     
@@ -128,150 +319,63 @@ class SystemMetrics:
         if not self.gpu_type:
             return
         
-        if self.gpu_type == "nvidia":
-            self._update_nvidia_gpu()
-        elif self.gpu_type == "amd":
-            self._update_amd_gpu()
-    
-    def _update_nvidia_gpu(self):
-        """NVIDIA GPU metriklerini günceller"""
-        try:
-            import pynvml
-            
-            # İlk GPU'yu al (çoklu GPU desteği eklenebilir)
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            
-            # GPU kullanımı
-            utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
-            self.gpu_info["usage"] = utilization.gpu
-            
-            # GPU sıcaklığı
-            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-            self.gpu_info["temp"] = temp
-            
-            # GPU belleği
-            memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
-            self.gpu_info["memory"] = {
-                "total": memory.total,
-                "used": memory.used,
-                "free": memory.free,
-                "percent": (memory.used / memory.total) * 100
-            }
-            
-            # GPU modeli
-            self.gpu_info["name"] = pynvml.nvmlDeviceGetName(handle)
-            
-        except (ImportError, Exception):
-            self.gpu_info = {
-                "usage": 0,
-                "temp": 0,
-                "memory": {"total": 0, "used": 0, "free": 0, "percent": 0},
-                "name": "Unknown NVIDIA GPU"
-            }
-    
-    def _update_amd_gpu(self):
-        """AMD GPU metriklerini günceller"""
-        # AMD GPU için veri toplama (daha basit)
-        self.gpu_info = {
-            "usage": 0,
-            "temp": 0,
-            "memory": {"total": 0, "used": 0, "free": 0, "percent": 0},
-            "name": "AMD GPU"
-        }
+        # Tüm kartlar tek turda, önbelleklenmiş tanıtıcılarla okunur
+        self.gpus = self.gpu_backend.read()
         
-        try:
-            # rocm-smi veya benzeri bir araç kullanılabilir
-            result = subprocess.run(
-                ["rocm-smi", "--showuse", "--showtemp"], 
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-            
-            if result.returncode == 0:
-                output = result.stdout
-                
-                # Kullanım oranını bul
-                for line in output.split("\n"):
-                    if "GPU use (%)" in line:
-                        try:
-                            usage = float(line.split(":")[1].strip())
-                            self.gpu_info["usage"] = usage
-                        except (ValueError, IndexError):
-                            pass
-                    
-                    # Sıcaklığı bul
-                    if "Temperature" in line:
-                        try:
-                            temp = float(line.split(":")[1].split("c")[0].strip())
-                            self.gpu_info["temp"] = temp
-                        except (ValueError, IndexError):
-                            pass
-        except (FileNotFoundError, subprocess.SubprocessError):
-            pass
+        # Tek GPU getter'ları ilk kartı raporlar
+        self.gpu_info = self.gpus[0] if self.gpus else {}
     
     def _update_disk(self):
         """Disk metriklerini günceller"""
-        # Ana disk bölümlerini al
-        partitions = psutil.disk_partitions()
-        self.disk_info = {}
+        # Bağlama listesi yalnızca mountinfo değiştiğinde yeniden okunur
+        self.mount_table.refresh()
         
-        for partition in partitions:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                self.disk_info[partition.mountpoint] = {
-                    "total": usage.total,
-                    "used": usage.used,
-                    "free": usage.free,
-                    "percent": usage.percent,
-                    "fstype": partition.fstype,
-                    "device": partition.device
-                }
-            except (PermissionError, OSError):
-                # Bazı bölümlere erişim izni olmayabilir
-                pass
-    
-    # Getter metodları
-    def get_cpu_usage(self):
-        """CPU kullanım yüzdesini döndürür"""
-        return self.cpu_usage
-    
-    def get_cpu_temperature(self):
-        """CPU sıcaklığını döndürür"""
-        return self.cpu_temp
+        # statvfs çağrıları askıda kalan bağlamalara karşı havuzda çalışır
+        mounts = self.mount_table.mounts
+        usages = self.usage_poller.poll([mountpoint for mountpoint, _, _ in mounts])
+        
+        disk_info = {}
+        for mountpoint, device, fstype in mounts:
+            if mountpoint not in usages:
+                continue
+            
+            # Havuzdaki sözlükler önceki görüntülerde yayınlanmış olabilir
+            disk_info[mountpoint] = dict(usages[mountpoint], fstype=fstype, device=device)
+        
+        self.disk_info = disk_info
     
-    def get_cpu_core_usages(self):
-        """CPU çekirdek kullanımlarını döndürür"""
-        return self.cpu_cores
+    def _update_io(self):
+        """Disk G/Ç hızlarını /proc/diskstats farklarından günceller"""
+        # poll ucuzdur; bölüm eşlemesi bağlamalar değişince hemen güncellensin
+        self.mount_table.refresh()
+        self.disk_io = self.disk_stats.read(self.mount_table.mounts)
     
-    def get_ram_info(self):
-        """RAM bilgilerini döndürür"""
-        return self.ram_info
+    def _update_network(self):
+        """Ağ arayüzü hızlarını /proc/net/dev farklarından günceller"""
+        self.net_info = self.net_dev.read()
     
-    def get_swap_info(self):
-        """Swap bilgilerini döndürür"""
-        return self.swap_info
-    
-    def get_gpu_type(self):
-        """GPU türünü döndürür"""
-        return self.gpu_type
-    
-    def get_gpu_usage(self):
-        """GPU kullanım yüzdesini döndürür"""
-        return self.gpu_info.get("usage", 0)
+    def _update_pressure(self):
+        """Basınç duraklama oranlarını günceller"""
+        self.pressure = self.pressure_stall.read()
+
+
+class MetricsSnapshot(MetricsReader):
+    """SystemMetrics'in belirli bir andaki değişmez kopyası
     
-    def get_gpu_temperature(self):
-        """GPU sıcaklığını döndürür"""
-        return self.gpu_info.get("temp", 0)
+    Toplayıcı iş parçacığı her turda yeni sözlük ve listeler oluşturur,
+    yayınlanmış nesneleri değiştirmez; bu yüzden kopya yüzeyseldir.
+    """
     
-    def get_gpu_memory(self):
-        """GPU bellek bilgilerini döndürür"""
-        return self.gpu_info.get("memory", {"total": 0, "used": 0, "free": 0, "percent": 0})
+    FIELDS = (
+        "cpu_usage", "cpu_temp", "cpu_temps", "cpu_cores", "cpu_times", "cpu_core_times",
+        "cpu_groups", "ram_info", "swap_info", "memory_details", "vmstat_rates", "node_memory",
+        "gpu_type", "gpu_info", "gpus", "disk_info", "disk_io", "net_info", "pressure",
+        "seq", "timestamp", "versions"
+    )
     
-    def get_gpu_info(self):
-        """Tüm GPU bilgilerini döndürür"""
-        return self.gpu_info
+    def __init__(self, metrics):
+        for field in self.FIELDS:
+            object.__setattr__(self, field, getattr(metrics, field))
     
-    def get_disk_info(self):
-        """Disk bilgilerini döndürür"""
-        return self.disk_info
+    def __setattr__(self, name, value):
+        raise AttributeError("MetricsSnapshot değiştirilemez")
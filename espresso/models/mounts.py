@@ -0,0 +1,273 @@
+"""
+Espresso - Bağlama noktası tablosu modeli
+"""
+
+import os
+import re
+import time
+import queue
+import select
+import threading
+from concurrent.futures import Future, wait
+
+import psutil
+
+
+class MountTable:
+    """Fiziksel bağlama noktalarını önbellekleyen sınıf
+
+    Liste yalnızca /proc/self/mountinfo poll ile POLLPRI bildirdiğinde
+    yeniden okunur; aksi halde her turda önbellekteki liste kullanılır.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.proc_root = proc_root
+        self.mounts = []  # (bağlama noktası, aygıt, dosya sistemi türü)
+        self.file = None
+        self.poller = None
+        self.physical_fstypes = self._read_physical_fstypes()
+
+        try:
+            self.file = open(os.path.join(proc_root, "self", "mountinfo"), "rb")
+            self.poller = select.poll()
+            self.poller.register(self.file.fileno(), select.POLLPRI | select.POLLERR)
+        except (OSError, AttributeError):
+            # mountinfo yoksa (Linux dışı) psutil ile her seferinde listele
+            self.close()
+
+        self._reload()
+
+    def refresh(self):
+        """Bağlama tablosu değiştiyse yeniden okur, değiştiyse True döndürür"""
+        if self.poller is None:
+            self._reload()
+            return True
+
+        if not self.poller.poll(0):
+            return False
+
+        self._reload()
+        return True
+
+    def _reload(self):
+        """Bağlama listesini yeniden oluşturur"""
+        if self.file is None:
+            self.mounts = [
+                (p.mountpoint, p.device, p.fstype)
+                for p in psutil.disk_partitions()
+            ]
+            return
+
+        # Dosyayı baştan okumak bekleyen POLLPRI olayını da tüketir
+        self.file.seek(0)
+        data = self.file.read().decode("utf-8", "replace")
+
+        mounts = []
+        for line in data.splitlines():
+            mount = self._parse_line(line)
+            if mount:
+                mounts.append(mount)
+        self.mounts = mounts
+
+    def _parse_line(self, line):
+        """Tek bir mountinfo satırını ayrıştırır, fiziksel değilse None döndürür"""
+        # 36 35 98:0 /mnt1 /mnt/parent rw,noatime master:1 - ext3 /dev/root rw
+        head, sep, tail = line.partition(" - ")
+        if not sep:
+            return None
+
+        fields = head.split()
+        tail_fields = tail.split()
+        if len(fields) < 5 or len(tail_fields) < 2:
+            return None
+
+        mountpoint = _unescape(fields[4])
+        fstype = tail_fields[0]
+        device = _unescape(tail_fields[1])
+
+        # psutil.disk_partitions(all=False) ile aynı süzme kuralları
+        if device == "none":
+            device = ""
+        if not device or fstype not in self.physical_fstypes:
+            return None
+
+        return (mountpoint, device, fstype)
+
+    def _read_physical_fstypes(self):
+        """nodev olmayan dosya sistemi türlerini döndürür"""
+        fstypes = {"zfs"}
+        try:
+            with open(os.path.join(self.proc_root, "filesystems"), "r") as f:
+                for line in f:
+                    if not line.startswith("nodev"):
+                        fstypes.add(line.strip())
+        except OSError:
+            pass
+        return fstypes
+
+    def close(self):
+        """mountinfo dosyasını kapatır"""
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.poller = None
+
+
+class MountUsagePoller:
+    """Bölüm kullanımlarını zaman aşımı korumalı bir iş parçacığı havuzunda sorgulayan sınıf
+
+    Askıda kalan bir NFS/FUSE bağlaması statvfs çağrısını süresiz
+    bloklayabilir. Sorgular sınırlı sayıda arka plan iş parçacığında
+    eşzamanlı çalışır; süresinde yanıt vermeyen bağlamalar "unresponsive"
+    olarak işaretlenir ve üstel artan aralıklarla yeniden denenir; geç
+    gelen yanıt son değeri günceller ama geri çekilmeyi kaldırmaz. Askıda
+    kalan her sorgunun tuttuğu iş parçacığı için havuza yenisi eklenir;
+    bağlama başına en fazla bir sorgu bekleyebildiğinden ek iş parçacığı
+    sayısı askıdaki bağlama sayısıyla sınırlıdır.
+    """
+
+    def __init__(self, max_workers=8, timeout=1.0, backoff_base=5, backoff_max=300,
+                 usage_func=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.usage_func = usage_func or disk_usage
+
+        self.pending = {}   # bağlama noktası -> henüz bitmemiş Future
+        self.backoff = {}   # bağlama noktası -> (yeniden deneme anı, bekleme süresi)
+        self.last = {}      # bağlama noktası -> son bilinen kullanım
+
+        # ThreadPoolExecutor çıkışta iş parçacıklarını bekler; askıda kalan bir
+        # statvfs uygulamanın kapanmasını engellemesin diye daemon iş parçacıkları
+        self.tasks = queue.Queue()
+        self.workers = 0
+        self._ensure_workers(max_workers)
+
+    def _ensure_workers(self, count):
+        """Havuzdaki iş parçacığı sayısını en az count'a çıkarır"""
+        while self.workers < count:
+            worker = threading.Thread(target=self._worker, name=f"espresso-statvfs-{self.workers}")
+            worker.daemon = True
+            worker.start()
+            self.workers += 1
+
+    def _worker(self):
+        """Kuyruktaki statvfs işlerini çalıştırır"""
+        while True:
+            future, mountpoint = self.tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.usage_func(mountpoint))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _submit(self, mountpoint):
+        """Bağlama noktası için yeni bir sorgu kuyruğa ekler"""
+        future = Future()
+        self.tasks.put((future, mountpoint))
+        self.pending[mountpoint] = future
+        return future
+
+    def poll(self, mountpoints):
+        """Bağlama noktalarının kullanımını döndürür (erişilemeyenler hariç)"""
+        now = time.monotonic()
+        submitted = {}  # bağlama noktası -> bu turda gönderilen Future
+
+        # Askıda kalan sorguların tuttuğu iş parçacıkları yerine yenileri açılır;
+        # yoksa max_workers kadar askıdaki bağlama diğer tüm sorguları engeller
+        stuck = sum(1 for future in self.pending.values() if future.running())
+        self._ensure_workers(self.max_workers + stuck)
+
+        for mountpoint in mountpoints:
+            # Hâlâ askıdaki sorgu varken yenisi gönderilmez; geç yanıt vermiş olan engellemez
+            future = self.pending.get(mountpoint)
+            if future is not None and not future.done():
+                continue
+            retry = self.backoff.get(mountpoint)
+            if retry and retry[0] > now:
+                continue
+            submitted[mountpoint] = self._submit(mountpoint)
+
+        # Yalnızca bu turda gönderilen sorgular beklenir; daha önce askıda
+        # kalanlar her turu tekrar zaman aşımına uğratmaz
+        if submitted:
+            wait(submitted.values(), timeout=self.timeout)
+
+        now = time.monotonic()
+        results = {}
+        for mountpoint in mountpoints:
+            future = self.pending.get(mountpoint)
+
+            if future is not None and future.done():
+                del self.pending[mountpoint]
+                try:
+                    usage = future.result()
+                except (PermissionError, OSError):
+                    # Bazı bölümlere erişim izni olmayabilir
+                    self.backoff.pop(mountpoint, None)
+                    self.last.pop(mountpoint, None)
+                    continue
+
+                self.last[mountpoint] = usage
+                if mountpoint in submitted:
+                    # Süresinde yanıt verdi: geri çekilme sıfırlanır
+                    usage["status"] = "ok"
+                    self.backoff.pop(mountpoint, None)
+                    results[mountpoint] = usage
+                    continue
+                # Zaman aşımına uğramış sorgu geç yanıt verdi: değer saklanır,
+                # ancak yeniden deneme anı gelene kadar bağlama sorgulanmaz
+
+            elif future is not None and future.cancel():
+                # Havuz dolu olduğu için hiç başlamadı; bağlamayı suçlama
+                del self.pending[mountpoint]
+                if mountpoint in self.last:
+                    results[mountpoint] = self.last[mountpoint]
+                continue
+
+            elif mountpoint in submitted:
+                # Bu turdaki sorgu zaman aşımına uğradı: ilk seferde temel
+                # bekleme süresiyle, yeniden denemede iki katıyla geri çekil
+                retry = self.backoff.get(mountpoint)
+                delay = min(retry[1] * 2, self.backoff_max) if retry else self.backoff_base
+                self.backoff[mountpoint] = (now + delay, delay)
+
+            if mountpoint in self.backoff:
+                usage = dict(self.last.get(mountpoint) or
+                             {"total": 0, "used": 0, "free": 0, "percent": 0})
+                usage["status"] = "unresponsive"
+                results[mountpoint] = usage
+
+        # Kaldırılan bağlamaların durumunu unut
+        active = set(mountpoints)
+        for state in (self.backoff, self.last, self.pending):
+            for mountpoint in [mp for mp in state if mp not in active]:
+                del state[mountpoint]
+
+        return results
+
+
+def disk_usage(mountpoint):
+    """psutil.disk_usage ile aynı hesaplamayı doğrudan statvfs ile yapar"""
+    st = os.statvfs(mountpoint)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+
+    # Kök için ayrılmış bloklar hariç, kullanıcının görebildiği toplam
+    total_user = used + free
+    percent = round(used / total_user * 100, 1) if total_user else 0.0
+
+    return {
+        "total": total,
+        "used": used,
+        "free": free,
+        "percent": percent
+    }
+
+
+def _unescape(value):
+    """mountinfo'daki \\040 gibi sekizlik kaçışları çözer"""
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), value)
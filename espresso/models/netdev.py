@@ -0,0 +1,100 @@
+"""
+Espresso - /proc/net/dev tabanlı ağ arayüzü modeli
+"""
+
+import os
+import time
+
+from espresso.models.sysfs import open_fd, pread_all, close_fd
+
+
+# /proc/net/dev sütunlarından raporlananlar: (alan adı, sütun)
+NET_FIELDS = (
+    ("rx_bytes", 0),
+    ("rx_packets", 1),
+    ("rx_errors", 2),
+    ("rx_drops", 3),
+    ("tx_bytes", 8),
+    ("tx_packets", 9),
+    ("tx_errors", 10),
+    ("tx_drops", 11)
+)
+
+
+class NetDev:
+    """/proc/net/dev farklarından arayüz başına saniyelik ağ hızlarını hesaplayan sınıf
+
+    Her turda tek bir pread yapılır, arayüz başına sistem çağrısı yoktur.
+    Sanal arayüzler (lo, veth, docker, bridge...) /sys/devices/virtual/net
+    listesinden belirlenir; liste yalnızca arayüz kümesi değiştiğinde
+    yeniden okunur.
+    """
+
+    def __init__(self, proc_root="/proc", sysfs_root="/sys"):
+        self.virtual_dir = os.path.join(sysfs_root, "devices", "virtual", "net")
+        self.fd = open_fd(os.path.join(proc_root, "net", "dev"))
+        self.buffer = bytearray(64 * 1024)
+
+        self.previous_time = None
+        self.previous = {}  # arayüz -> sayaç listesi
+        self.virtual = set()
+        self.known = frozenset()
+
+    def read(self):
+        """Arayüz adı -> saniyelik hızlar sözlüğü döndürür (ilk okumada sıfır)"""
+        if self.fd is None:
+            return {}
+
+        now = time.monotonic()
+        self.buffer, size = pread_all(self.fd, self.buffer)
+        data = bytes(memoryview(self.buffer)[:size])
+
+        rows = {}
+        # İlk iki satır sütun başlıklarıdır
+        for line in data.split(b"\n")[2:]:
+            name, sep, values = line.partition(b":")
+            if not sep:
+                continue
+            fields = values.split()
+            rows[name.strip().decode("utf-8", "replace")] = [
+                int(fields[column]) for _, column in NET_FIELDS
+            ]
+
+        interfaces = frozenset(rows)
+        if interfaces != self.known:
+            self.virtual = self._read_virtual()
+            self.known = interfaces
+
+        elapsed = now - self.previous_time if self.previous_time is not None else 0
+        previous = self.previous
+
+        result = {}
+        for name, counters in rows.items():
+            before = previous.get(name)
+            if before is None or elapsed <= 0:
+                stats = dict.fromkeys((field for field, _ in NET_FIELDS), 0.0)
+            else:
+                # Sayaç sıfırlanırsa (arayüz yeniden oluşturuldu) negatif hız gösterme
+                stats = {
+                    field: max(value - old, 0) / elapsed
+                    for (field, _), value, old in zip(NET_FIELDS, counters, before)
+                }
+            stats["virtual"] = name in self.virtual
+            result[name] = stats
+
+        self.previous = rows
+        self.previous_time = now
+        return result
+
+    def _read_virtual(self):
+        """Sanal arayüz adlarını döndürür"""
+        try:
+            return set(os.listdir(self.virtual_dir))
+        except OSError:
+            # sysfs yoksa en azından geri döngü arayüzünü sanal say
+            return {"lo"}
+
+    def close(self):
+        """/proc/net/dev dosyasını kapatır"""
+        close_fd(self.fd)
+        self.fd = None
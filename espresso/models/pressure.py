@@ -0,0 +1,96 @@
+"""
+Espresso - Basınç duraklama bilgisi (PSI) modeli
+"""
+
+import os
+import time
+
+from espresso.models.sysfs import open_fd, close_fd
+
+
+# /proc/pressure altında izlenen kaynaklar
+PSI_RESOURCES = ("cpu", "memory", "io")
+
+
+class PressureStall:
+    """/proc/pressure dosyalarından kaynak başına duraklama oranlarını okuyan sınıf
+
+    Çekirdeğin avg10/avg60/avg300 ortalamalarının yanında, "total"
+    sayacının (mikrosaniye) iki okuma arasındaki farkından son aralıktaki
+    duraklama oranı da hesaplanır. PSI desteklenmiyorsa boş sözlük döner.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.fds = {}
+        for resource in PSI_RESOURCES:
+            fd = open_fd(os.path.join(proc_root, "pressure", resource))
+            if fd is not None:
+                self.fds[resource] = fd
+
+        self.previous_time = None
+        self.previous = {}  # (kaynak, tür) -> total
+
+    def read(self):
+        """Kaynak -> {"some": {...}, "full": {...}} sözlüğü döndürür"""
+        now = time.monotonic()
+        elapsed = now - self.previous_time if self.previous_time is not None else 0
+
+        result = {}
+        current = {}
+        for resource, fd in self.fds.items():
+            try:
+                data = os.pread(fd, 256, 0).decode("ascii", "replace")
+            except OSError:
+                continue
+
+            kinds = {}
+            for line in data.splitlines():
+                # some avg10=0.00 avg60=0.00 avg300=0.00 total=0
+                parts = line.split()
+                if not parts:
+                    continue
+                values = dict(part.split("=", 1) for part in parts[1:] if "=" in part)
+                stats = {
+                    "avg10": float(values.get("avg10", 0)),
+                    "avg60": float(values.get("avg60", 0)),
+                    "avg300": float(values.get("avg300", 0)),
+                    "total": int(values.get("total", 0)),
+                    "rate": 0.0
+                }
+
+                key = (resource, parts[0])
+                before = self.previous.get(key)
+                if before is not None and elapsed > 0:
+                    # Mikrosaniye cinsinden duraklama süresinin geçen süreye oranı (%)
+                    stats["rate"] = min(max(stats["total"] - before, 0) / (elapsed * 10000), 100.0)
+                current[key] = stats["total"]
+                kinds[parts[0]] = stats
+
+            result[resource] = kinds
+
+        self.previous = current
+        self.previous_time = now
+        return result
+
+    @staticmethod
+    def format(kinds, include_full=True):
+        """Bir kaynağın duraklama oranlarını (metin, ipucu) olarak biçimler"""
+        names = {"some": "kısmi", "full": "tam"}
+        shown = [kind for kind in ("some", "full")
+                 if kind in kinds and (include_full or kind == "some")]
+
+        text = "Duraklama: " + ", ".join(
+            f"{kinds[kind]['rate']:.1f}% {names[kind]}" for kind in shown
+        )
+        tooltip = "\n".join(
+            f"{names[kind]}: 10 sn {kinds[kind]['avg10']:.2f}%, "
+            f"60 sn {kinds[kind]['avg60']:.2f}%, 300 sn {kinds[kind]['avg300']:.2f}%"
+            for kind in shown
+        )
+        return text, tooltip
+
+    def close(self):
+        """PSI dosyalarını kapatır"""
+        for fd in self.fds.values():
+            close_fd(fd)
+        self.fds = {}
@@ -0,0 +1,388 @@
+"""
+Espresso - Sıkıştırılmış dizin tarama sonuçları
+"""
+
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+
+# Girdi bayrakları
+FLAG_DIRECTORY = 1
+FLAG_HIDDEN = 2  # gösterim derinliğinin altında; yalnızca artımlı tarama için tutulur
+FLAG_FILES = 4   # dizinin dosyaları da girdi olarak tutuluyor
+FLAG_REMOVED = 8  # tarama sonrası silindi ya da taşındı (izleme kipi)
+
+
+class ScanResults:
+    """Tarama girdilerini paralel tipli dizilerde tutan yapı
+
+    Her girdi için boyut (8 bayt), üst dizin indeksi (4 bayt), bayraklar
+    (1 bayt) ve ad sonu ofseti (4 bayt) saklanır; adlar tek bir bitişik
+    bayt alanına art arda yazılır (ad alanı 4 GiB ile sınırlıdır). Tam
+    yollar tutulmaz, gerektiğinde üst dizin zincirinden yeniden kurulur.
+    0 numaralı girdi taranan köktür ve adı kökün tam yoludur. Alt öğe
+    indeksi ilk gerektiğinde kurulur ve girdi başına 4 bayt daha tutar;
+    nbytes bunu da sayar. Sonraki eklemeler indeksi geçersiz kılmaz, üst
+    dizin başına ek listelere yazılır; prepare bunları indekse katar.
+    
+    Listelenen her dizin için ayrıca (aygıt, inode, mtime, ctime) ve
+    doğrudan içerdiği dosyaların toplam boyutu tutulur; sonraki taramada
+    değişmemiş dizinler yeniden listelenmeden bu kayıttan kurulur. Yapı
+    save/load ile tek bir dizin dosyasına yazılıp okunabilir.
+    """
+    
+    # magic, sürüm, girdi sayısı, ad alanı boyutu, dizin kaydı sayısı
+    HEADER = struct.Struct("<4sHxxQQQ")
+    MAGIC = b"ESPS"
+    VERSION = 2
+
+    def __init__(self, root):
+        self.sizes = array("q")
+        self.parents = array("i")
+        self.flags = array("B")
+        self.name_ends = array("I")
+        self.names = bytearray()
+
+        # Dizin kayıtları (yalnızca listelenen dizinler için)
+        self.dir_indices = array("i")
+        self.dir_devices = array("Q")
+        self.dir_inodes = array("Q")
+        self.dir_mtimes = array("q")
+        self.dir_ctimes = array("q")
+        self.dir_file_sizes = array("q")
+
+        # (aygıt, inode) araması için inode'a göre sıralı dizin kayıtları
+        self.lookup_inodes = None
+        self.lookup_slots = None
+
+        # Alt öğe indeksi yalnızca gerektiğinde kurulur: üst dizine göre sıralı girdiler;
+        # kurulduktan sonra eklenenler üst dizin başına ek listelerde tutulur
+        self.child_list = None
+        self.added_children = {}  # üst dizin indeksi -> sonradan eklenen alt öğeler
+
+        self.add(root, -1, True)
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def add(self, name, parent, is_directory, size=0, hidden=False):
+        """Yeni bir girdi ekler ve indeksini döndürür"""
+        self.names += os.fsencode(name)
+        self.name_ends.append(len(self.names))
+        self.sizes.append(size)
+        self.parents.append(parent)
+        self.flags.append((FLAG_DIRECTORY if is_directory else 0) | (FLAG_HIDDEN if hidden else 0))
+        index = len(self.sizes) - 1
+
+        # Kurulu indeks yeniden kurulmaz; izleme kipindeki tek eklemeler O(1) kalır
+        if self.child_list is not None and parent >= 0:
+            added = self.added_children.get(parent)
+            if added is None:
+                added = self.added_children[parent] = array("i")
+            added.append(index)
+        return index
+
+    def set_directory_stat(self, index, stat, file_size, files_kept):
+        """Listelenen dizinin kimliğini, zamanlarını ve dosya toplamını kaydeder"""
+        if files_kept:
+            self.flags[index] |= FLAG_FILES
+        self.dir_indices.append(index)
+        self.dir_devices.append(stat.st_dev)
+        self.dir_inodes.append(stat.st_ino)
+        self.dir_mtimes.append(stat.st_mtime_ns)
+        self.dir_ctimes.append(stat.st_ctime_ns)
+        self.dir_file_sizes.append(file_size)
+        self.lookup_inodes = None
+
+    def find_unchanged(self, stat):
+        """Dizin son kayıttan beri değişmediyse kayıt numarasını, değiştiyse -1 döndürür"""
+        if self.lookup_inodes is None:
+            self.prepare()
+
+        inodes = self.lookup_inodes
+        position = bisect_left(inodes, stat.st_ino)
+        while position < len(inodes) and inodes[position] == stat.st_ino:
+            slot = self.lookup_slots[position]
+            if self.dir_devices[slot] == stat.st_dev:
+                if (self.dir_mtimes[slot] == stat.st_mtime_ns
+                        and self.dir_ctimes[slot] == stat.st_ctime_ns):
+                    return slot
+                return -1
+            position += 1
+        return -1
+
+    def prepare(self):
+        """Arama ve alt öğe indekslerini kurar (iş parçacıkları okumadan önce çağrılır)"""
+        order = sorted(range(len(self.dir_inodes)), key=self.dir_inodes.__getitem__)
+        self.lookup_inodes = array("Q", (self.dir_inodes[slot] for slot in order))
+        self.lookup_slots = array("I", order)
+        if self.child_list is None or self.added_children:
+            self._build_children()
+
+    def set_size(self, index, size):
+        """Girdinin boyutunu günceller"""
+        self.sizes[index] = size
+
+    def name(self, index):
+        """Girdinin adını döndürür"""
+        start = self.name_ends[index - 1] if index else 0
+        return os.fsdecode(bytes(self.names[start:self.name_ends[index]]))
+
+    def size(self, index):
+        """Girdinin boyutunu döndürür"""
+        return self.sizes[index]
+
+    def parent(self, index):
+        """Üst dizinin indeksini döndürür (kök için -1)"""
+        return self.parents[index]
+
+    def is_directory(self, index):
+        """Girdi dizin mi"""
+        return bool(self.flags[index] & FLAG_DIRECTORY)
+
+    def is_hidden(self, index):
+        """Girdi gösterim derinliğinin altında mı"""
+        return bool(self.flags[index] & FLAG_HIDDEN)
+
+    def has_files(self, index):
+        """Dizinin dosyaları girdi olarak tutuluyor mu"""
+        return bool(self.flags[index] & FLAG_FILES)
+
+    def mark_removed(self, index):
+        """Girdiyi kaldırılmış olarak işaretler (alt öğeleri de böylece görünmez olur)"""
+        self.flags[index] |= FLAG_REMOVED
+
+    def is_live(self, index):
+        """Girdi ve üst dizinlerinden hiçbiri kaldırılmamış mı"""
+        while index >= 0:
+            if self.flags[index] & FLAG_REMOVED:
+                return False
+            index = self.parents[index]
+        return True
+
+    def path(self, index):
+        """Girdinin tam yolunu üst dizin zincirinden kurar"""
+        parts = []
+        while index > 0:
+            parts.append(self.name(index))
+            index = self.parents[index]
+        parts.append(self.name(0))
+        return os.path.join(*reversed(parts))
+
+    def children(self, index):
+        """Girdinin alt öğelerinin indekslerini döndürür"""
+        if self.child_list is None:
+            self._build_children()
+        child_list = self.child_list
+        parents = self.parents
+
+        # İlk alt öğe ikili aramayla bulunur; alt öğeler listede ardışıktır
+        low, high = 0, len(child_list)
+        while low < high:
+            middle = (low + high) // 2
+            if parents[child_list[middle]] < index:
+                low = middle + 1
+            else:
+                high = middle
+
+        end = low
+        while end < len(child_list) and parents[child_list[end]] == index:
+            end += 1
+
+        added = self.added_children.get(index)
+        if added is not None:
+            return child_list[low:end] + added
+        return child_list[low:end]
+
+    def find(self, path):
+        """Yolun indeksini döndürür, bulunamazsa -1"""
+        root = self.name(0)
+        relative = os.path.relpath(path, root)
+        if relative == ".":
+            return 0
+        if relative.startswith(".."):
+            return -1
+
+        index = 0
+        for part in relative.split(os.sep):
+            for child in self.children(index):
+                if self.name(child) == part and not self.flags[child] & FLAG_REMOVED:
+                    index = child
+                    break
+            else:
+                return -1
+        return index
+
+    def nbytes(self):
+        """Yapının kullandığı yaklaşık bellek miktarını (bayt) döndürür"""
+        arrays = self._arrays()
+        if self.child_list is not None:
+            arrays.append(self.child_list)
+            arrays += self.added_children.values()
+        if self.lookup_inodes is not None:
+            arrays += [self.lookup_inodes, self.lookup_slots]
+        return sum(len(data) * data.itemsize for data in arrays) + len(self.names)
+
+    def save(self, path):
+        """Yapıyı dizin dosyasına yazar (yarım kalmış dosya bırakmamak için geçici dosya ile)"""
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.HEADER.pack(
+                self.MAGIC, self.VERSION, len(self.sizes), len(self.names), len(self.dir_indices)
+            ))
+            for data in self._arrays():
+                data.tofile(f)
+            f.write(self.names)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Dizin dosyasını okur; dosya yoksa ya da geçersizse None döndürür"""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+
+        if len(raw) < cls.HEADER.size:
+            return None
+        magic, version, count, names_size, dir_count = cls.HEADER.unpack_from(raw)
+        if magic != cls.MAGIC or version != cls.VERSION or not count:
+            return None
+
+        # Kurucunun eklediği boş kök girdisi dosyadaki kayıtlarla değiştirilir
+        results = cls("")
+        for data in results._arrays():
+            del data[:]
+
+        offset = cls.HEADER.size
+        arrays = results._arrays()
+        for position, data in enumerate(arrays):
+            length = count if position < 4 else dir_count
+            end = offset + length * data.itemsize
+            if end > len(raw):
+                return None
+            data.frombytes(raw[offset:end])
+            offset = end
+
+        if offset + names_size != len(raw):
+            return None
+        results.names = bytearray(raw[offset:])
+        return results
+
+    def _arrays(self):
+        """Dosyaya yazılan tipli diziler (önce girdi, sonra dizin kaydı dizileri)"""
+        return [
+            self.sizes, self.parents, self.flags, self.name_ends,
+            self.dir_indices, self.dir_devices, self.dir_inodes,
+            self.dir_mtimes, self.dir_ctimes, self.dir_file_sizes
+        ]
+
+    def _build_children(self):
+        """Girdileri üst dizinlerine göre sayma sıralamasıyla dizerek alt öğe indeksini kurar
+
+        Sonradan eklenen alt öğeler de indekse katılır ve ek listeler boşaltılır.
+        """
+        count = len(self.parents)
+        positions = array("I", bytes(4 * (count + 1)))
+        for parent in self.parents:
+            if parent >= 0:
+                positions[parent + 1] += 1
+        for index in range(count):
+            positions[index + 1] += positions[index]
+
+        # Sıralama için kullanılan konum dizisi iş bitince bırakılır
+        children = array("i", bytes(4 * (count - 1 if count else 0)))
+        for index, parent in enumerate(self.parents):
+            if parent >= 0:
+                children[positions[parent]] = index
+                positions[parent] += 1
+
+        self.child_list = children
+        self.added_children = {}
+
+
+class ScanResultsView(Mapping):
+    """Sonuçları eski yol -> bilgi sözlüğü gibi gösteren tembel görünüm
+
+    Girdi sözlükleri yalnızca erişildiğinde üretilir. Yineleme sırası
+    önceki düzenle aynıdır: önce dizinler, sonra dosyalar, her grup boyuta
+    göre büyükten küçüğe. Kök girdisi görünümde yer almaz.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.order = None
+
+    def __len__(self):
+        return len(self._ordered())
+
+    def __iter__(self):
+        for index in self._ordered():
+            yield self.results.path(index)
+
+    def __getitem__(self, path):
+        index = self.results.find(path)
+        if index <= 0 or self.results.is_hidden(index):
+            raise KeyError(path)
+        return self._info(index)
+
+    def items(self):
+        """(yol, bilgi) çiftlerini yol araması yapmadan üretir"""
+        for index in self._ordered():
+            yield self.results.path(index), self._info(index)
+
+    def _ordered(self):
+        """Girdi indekslerini görünüm sırasıyla döndürür (ilk çağrıda sıralanır)"""
+        if self.order is None:
+            results = self.results
+            self.order = array("i", sorted(
+                (index for index in range(1, len(results))
+                 if not results.is_hidden(index) and results.is_live(index)),
+                key=lambda index: (not results.is_directory(index), -results.sizes[index])
+            ))
+        return self.order
+
+    def _info(self, index):
+        """Girdi için eski biçimdeki bilgi sözlüğünü oluşturur"""
+        results = self.results
+        return {
+            "name": results.name(index),
+            "type": "directory" if results.is_directory(index) else "file",
+            "size": results.sizes[index],
+            "parent": results.path(results.parents[index])
+        }
+
+
+class DirectoryTreeView(Mapping):
+    """Üst dizin yolu -> alt öğe yolları eşlemesini tembel olarak sunan görünüm"""
+
+    def __init__(self, results):
+        self.results = results
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __iter__(self):
+        results = self.results
+        for index in range(len(results)):
+            if (results.is_directory(index) and results.is_live(index)
+                    and self._visible_children(index)):
+                yield results.path(index)
+
+    def __getitem__(self, path):
+        index = self.results.find(path)
+        if index < 0 or not self.results.is_directory(index) or self.results.is_hidden(index):
+            raise KeyError(path)
+        return [self.results.path(child) for child in self._visible_children(index)]
+
+    def _visible_children(self, index):
+        """Gösterim derinliğindeki alt öğelerin indekslerini döndürür"""
+        results = self.results
+        return [
+            child for child in results.children(index)
+            if not results.is_hidden(child) and not results.flags[child] & FLAG_REMOVED
+        ]
@@ -0,0 +1,425 @@
+"""
+Espresso - inotify ile tarama sonuçlarını canlı güncelleyen izleyici
+"""
+
+import os
+import stat
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+
+from espresso.models.scan_results import FLAG_FILES
+
+
+# inotify olay bitleri (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+
+# İzlenen olaylar: boyut değişimi, oluşturma, silme ve taşıma
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+
+# struct inotify_event: wd, mask, cookie, len (ardından len baytlık ad)
+EVENT_HEADER = struct.Struct("iIII")
+
+# Varsayılan izleme sınırı (çekirdeğin max_user_watches değeri de sınırlar)
+DEFAULT_WATCH_LIMIT = 8192
+
+
+def _load_libc():
+    """inotify çağrılarını içeren libc'yi yükler, bulunamazsa None döndürür"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class ScanWatcher:
+    """Tamamlanmış bir taramanın dizinlerini inotify ile izleyip boyutları güncelleyen sınıf
+
+    Dizinler sığdan derine doğru watch_limit sınırına kadar izlenir.
+    Oluşturma, silme, değişiklik ve taşıma olayları girdilere uygulanır
+    ve boyut farkı kök dahil tüm üst dizinlere eklenir; taşımalar silme
+    ve oluşturma olarak işlenir. Dosyaları sonuçlarda tutulmayan
+    (gösterim derinliğinin altındaki) dizinlerin dosya boyutları
+    yalnızca izleyicide tutulur. Dosya boyutu farkları dizin kayıtlarının
+    dosya toplamlarına da işlenir; böylece sonraki artımlı tarama güncel
+    toplamları yeniden kullanır. İzlemeler olay iş parçacığında kurulur,
+    bitince ready ayarlanır. Değişen girdilerin indeksleri kilit
+    tutulurken take_changes ile alınır. Olay kuyruğu taşarsa overflowed
+    ayarlanır; sonuçlar tam olarak yeniden taranmalıdır.
+    """
+
+    def __init__(self, results, display_depth=None, watch_limit=DEFAULT_WATCH_LIMIT):
+        self.results = results
+        self.display_depth = display_depth
+        self.watch_limit = watch_limit
+        self.lock = threading.Lock()
+
+        self.libc = None
+        self.fd = None
+        self.watches = {}   # izleme tanımlayıcısı -> dizin indeksi
+        self.entries = {}   # izlenen dizin indeksi -> {ad: alt öğe indeksi}
+        self.files = {}     # dosyaları tutulmayan izlenen dizin -> {ad: dosya boyutu}
+        self.slots = {}     # izlenen dizin indeksi -> dizin kaydı numarası
+        self.changes = set()
+        self.ready = False
+        self.overflowed = False
+        self.stop_requested = False
+        self.thread = None
+
+    def start(self):
+        """Olay iş parçacığını başlatır; inotify yoksa False döndürür
+
+        İzlemelerin kurulumu (dizin listeleri dahil) iş parçacığında yapılır;
+        çağıran iş parçacığı bloklanmaz.
+        """
+        self.libc = _load_libc()
+        if self.libc is None:
+            return False
+
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            print(f"inotify başlatma hatası: {os.strerror(ctypes.get_errno())}")
+            self.fd = None
+            return False
+
+        self.thread = threading.Thread(target=self._run, name="espresso-scan-watch")
+        self.thread.daemon = True
+        self.thread.start()
+        return True
+
+    def _setup(self):
+        """Dizinleri sığdan derine izlemeye alır; sınır dolarsa üst seviyeler izlenmiş olur"""
+        results = self.results
+        slots = {index: slot for slot, index in enumerate(results.dir_indices)}
+
+        # Sonuçlara yalnızca bu iş parçacığı ekleme yapar; kurulum sırasında kilit gerekmez
+        queue = [0]
+        for index in queue:
+            if self.stop_requested:
+                return
+            if not results.is_live(index):
+                continue
+            children = {results.name(child): child for child in results.children(index)}
+            files = None if results.has_files(index) else self._list_files(results.path(index))
+            if not self._add_watch(index, children, files):
+                break
+            if index in slots:
+                self.slots[index] = slots[index]
+            queue.extend(child for child in children.values() if results.is_directory(child))
+
+        self.ready = True
+
+    def stop(self):
+        """İzlemeyi durdurur ve inotify tanımlayıcısını kapatır"""
+        self.stop_requested = True
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        self.watches = {}
+        self.entries = {}
+        self.files = {}
+        self.slots = {}
+        self.ready = False
+
+    def get_watch_count(self):
+        """Etkin izleme sayısını döndürür"""
+        return len(self.watches)
+
+    def take_changes(self):
+        """Son çağrıdan beri değişen girdilerin indekslerini döndürür (kilit tutulurken çağrılır)"""
+        changes = self.changes
+        self.changes = set()
+        return changes
+
+    def _add_watch(self, index, children, files=None):
+        """Dizine izleme ekler; sınır ya da çekirdek izin vermiyorsa False döndürür"""
+        if len(self.watches) >= self.watch_limit:
+            return False
+
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(self.results.path(index)), WATCH_MASK)
+        if wd < 0:
+            # ENOSPC: max_user_watches doldu; diğer hatalarda yalnızca bu dizin atlanır
+            return ctypes.get_errno() != errno.ENOSPC
+
+        self.watches[wd] = index
+        self.entries[index] = children
+        if files is not None:
+            self.files[index] = files
+        return True
+
+    def _run(self):
+        """İzlemeleri kurar, ardından olayları okuyup her okumayı toplu olarak uygular"""
+        self._setup()
+
+        poller = select.poll()
+        poller.register(self.fd, select.POLLIN)
+
+        while not self.stop_requested:
+            if not poller.poll(250):
+                continue
+
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                print(f"inotify okuma hatası: {e}")
+                return
+
+            self._apply(data)
+
+    def _apply(self, data):
+        """Bir okumadaki olayları uygular; aynı girdiye gelen olaylar tek lstat ile birleştirilir"""
+        touched = {}  # (dizin indeksi, ad) -> birleşik olay maskesi
+        with self.lock:
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self.overflowed = True
+                    continue
+
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+
+                if mask & IN_IGNORED:
+                    # Dizin silindi; girdisi üst dizinin olayıyla güncellenir
+                    del self.watches[wd]
+                    self.entries.pop(directory, None)
+                    self.files.pop(directory, None)
+                    self.slots.pop(directory, None)
+                elif not self.results.is_live(directory):
+                    # Ağacın dışına taşınan dizinin izlemesi sınırdan düşülür
+                    self.libc.inotify_rm_watch(self.fd, wd)
+                    del self.watches[wd]
+                    self.entries.pop(directory, None)
+                    self.files.pop(directory, None)
+                    self.slots.pop(directory, None)
+                elif name:
+                    touched[(directory, name)] = touched.get((directory, name), 0) | mask
+
+            paths = {directory: self.results.path(directory) for directory, _ in touched}
+
+        # Dosya sistemi kilit dışında okunur; yeni dizinlerin alt ağaçları da burada listelenir
+        updates = []
+        for (directory, name), mask in touched.items():
+            path = os.path.join(paths[directory], name)
+            try:
+                status = os.lstat(path)
+            except OSError:
+                updates.append((directory, name, None))
+                continue
+
+            # Olay maskesi yerine güncel tür esas alınır (ad bu arada yeniden kullanılmış olabilir)
+            if stat.S_ISDIR(status.st_mode):
+                # Alt dizinin öznitelik değişikliği boyutları etkilemez; içeriğini kendi izlemesi bildirir
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    updates.append((directory, name, self._list_tree(path)))
+            elif stat.S_ISREG(status.st_mode):
+                updates.append((directory, name, status.st_size))
+            else:
+                updates.append((directory, name, None))
+
+        with self.lock:
+            for directory, name, value in updates:
+                if directory in self.entries and self.results.is_live(directory):
+                    self._update_entry(directory, name, value)
+
+    def _update_entry(self, directory, name, value):
+        """Girdiyi eşitler (None: yok, tamsayı: dosya boyutu, liste: yeni dizin ağacı)"""
+        entries = self.entries[directory]
+        files = self.files.get(directory)
+        results = self.results
+
+        # Dosyaları tutulmayan dizinde yalnızca izleyicideki boyut güncellenir
+        if files is not None and (name in files or isinstance(value, int)):
+            index = entries.get(name)
+            if index is not None and isinstance(value, int):
+                # Aynı adlı dizin dosyayla değiştirildi; eski dizin girdisi önce kaldırılır
+                self._remove_entry(directory, name, index)
+            delta = (value if isinstance(value, int) else 0) - files.pop(name, 0)
+            if isinstance(value, int):
+                files[name] = value
+            self._add_file_size(directory, delta)
+            self._propagate(directory, delta)
+            if isinstance(value, int):
+                return
+
+        index = entries.get(name)
+        if index is not None:
+            # Var olan dosyanın boyutu yerinde güncellenir
+            if isinstance(value, int) and not results.is_directory(index):
+                delta = value - results.size(index)
+                if delta:
+                    results.set_size(index, value)
+                    self.changes.add(index)
+                    self._add_file_size(directory, delta)
+                    self._propagate(directory, delta)
+                return
+
+            # Diğer durumlarda eski girdi kaldırılıp yenisi eklenir
+            self._remove_entry(directory, name, index)
+
+        if value is None:
+            return
+
+        if isinstance(value, int):
+            index = results.add(name, directory, False, value)
+            entries[name] = index
+            self.changes.add(index)
+            self._add_file_size(directory, value)
+            self._propagate(directory, value)
+            return
+
+        index = self._add_tree(directory, value)
+        entries[name] = index
+        self._propagate(directory, results.size(index))
+
+    def _remove_entry(self, directory, name, index):
+        """Girdiyi kaldırır ve boyutunu üst dizinlerden düşer"""
+        results = self.results
+        results.mark_removed(index)
+        self.changes.add(index)
+        if not results.is_directory(index):
+            self._add_file_size(directory, -results.size(index))
+        self._propagate(directory, -results.size(index))
+        del self.entries[directory][name]
+
+    def _add_tree(self, directory, tree):
+        """Yeni dizin ağacını taramayla aynı kurallarla ekler, kökünün indeksini döndürür"""
+        results = self.results
+        display_depth = self.display_depth
+
+        # Dizin boyutları alt ağacın toplamıdır; üstler listede hep önce gelir
+        totals = [size for _, _, _, size in tree]
+        for position in range(len(tree) - 1, 0, -1):
+            totals[tree[position][0]] += totals[position]
+
+        base_depth = self._depth(directory)
+        depths = []
+        added = []
+        children = {}  # ağaçtaki dizin sırası -> {ad: alt öğe indeksi}
+        files = {}     # ağaçtaki dizin sırası -> {ad: dosya boyutu} (dosyaları tutulmayanlar)
+        new_directories = []
+        for position, (parent_position, name, is_directory, _) in enumerate(tree):
+            parent = directory if parent_position < 0 else added[parent_position]
+            parent_depth = base_depth if parent_position < 0 else depths[parent_position]
+            depth = parent_depth + 1
+            depths.append(depth)
+
+            # Gösterim derinliğinin altındaki dosyalar yalnızca toplamlara katılır
+            files_kept = display_depth is None or parent_depth < display_depth
+            if not is_directory and not files_kept:
+                files.setdefault(parent_position, {})[name] = totals[position]
+                added.append(-1)
+                continue
+
+            hidden = display_depth is not None and depth > display_depth
+            index = results.add(name, parent, is_directory, totals[position], hidden=hidden)
+            added.append(index)
+            self.changes.add(index)
+
+            if parent_position >= 0:
+                children.setdefault(parent_position, {})[name] = index
+            if is_directory:
+                if display_depth is None or depth < display_depth:
+                    results.flags[index] |= FLAG_FILES
+                new_directories.append(position)
+
+        # Yeni dizinler de sınıra kadar izlenir
+        for position in new_directories:
+            index = added[position]
+            directory_files = None if results.has_files(index) else files.get(position, {})
+            if not self._add_watch(index, children.get(position, {}), directory_files):
+                break
+
+        return added[0]
+
+    def _list_tree(self, root):
+        """Yeni bir dizin ağacını listeler: [(üst sıra, ad, dizin mi, boyut)], kök ilk sırada"""
+        tree = [(-1, os.path.basename(root), True, 0)]
+        stack = [(0, root)]
+        while stack:
+            position, path = stack.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                tree.append((position, entry.name, True, 0))
+                                stack.append((len(tree) - 1, entry.path))
+                            elif entry.is_file(follow_symlinks=False):
+                                tree.append((position, entry.name, False, entry.stat().st_size))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return tree
+
+    def _list_files(self, path):
+        """Dizinin doğrudan içerdiği dosyaların {ad: boyut} sözlüğünü döndürür"""
+        files = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            files[entry.name] = entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return files
+
+    def _add_file_size(self, directory, delta):
+        """Dizin kaydındaki doğrudan dosya toplamını günceller (artımlı tarama bunu kullanır)"""
+        slot = self.slots.get(directory)
+        if slot is not None:
+            self.results.dir_file_sizes[slot] += delta
+
+    def _propagate(self, directory, delta):
+        """Boyut farkını dizine ve kök dahil tüm üst dizinlerine ekler"""
+        if not delta:
+            return
+        results = self.results
+        parent = directory
+        while parent >= 0:
+            results.set_size(parent, results.size(parent) + delta)
+            self.changes.add(parent)
+            parent = results.parent(parent)
+
+    def _depth(self, index):
+        """Girdinin kökten uzaklığını döndürür"""
+        depth = 0
+        parent = self.results.parent(index)
+        while parent >= 0:
+            depth += 1
+            parent = self.results.parent(parent)
+        return depth
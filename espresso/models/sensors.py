@@ -0,0 +1,133 @@
+"""
+Espresso - sysfs sıcaklık sensörleri modeli
+"""
+
+import os
+import glob
+
+from espresso.models.sysfs import read_text, open_fd, close_fd, natural_key
+
+
+class ThermalSensors:
+    """hwmon ve thermal_zone sıcaklık dosyalarını açık tutarak okuyan sınıf
+
+    Sensörler başlangıçta bir kez keşfedilir; her turda yalnızca açık
+    dosya tanımlayıcıları pread ile yeniden okunur.
+    """
+
+    # CPU sıcaklığı raporlayan hwmon sürücüleri
+    CPU_CHIPS = ("coretemp", "k10temp", "zenpower", "cpu_thermal", "cpu-thermal", "soc_thermal")
+
+    # hwmon bulunamazsa kullanılacak thermal_zone türleri (öncelik sırasıyla)
+    CPU_ZONES = ("x86_pkg_temp", "cpu-thermal", "cpu_thermal", "soc_thermal", "acpitz")
+
+    def __init__(self, sysfs_root="/sys"):
+        self.sysfs_root = sysfs_root
+        self.sensors = []  # (tür, anahtar, fd)
+        self._discover()
+
+    def _discover(self):
+        """CPU sıcaklık sensörlerini keşfeder ve dosyalarını açar"""
+        found = []
+
+        # hwmon sürücüleri
+        hwmon_dirs = glob.glob(os.path.join(self.sysfs_root, "class", "hwmon", "hwmon*"))
+        for hwmon_dir in sorted(hwmon_dirs, key=natural_key):
+            chip = read_text(os.path.join(hwmon_dir, "name"))
+            if chip not in self.CPU_CHIPS:
+                continue
+
+            inputs = glob.glob(os.path.join(hwmon_dir, "temp*_input"))
+            for input_path in sorted(inputs, key=natural_key):
+                prefix = input_path[:-len("_input")]
+                label = read_text(prefix + "_label") or os.path.basename(prefix)
+                kind = self._classify(chip, label)
+                if kind is None:
+                    continue
+                found.append((kind, label, os.path.basename(hwmon_dir), input_path))
+
+        # hwmon yoksa thermal_zone dosyalarına geri dön
+        if not found:
+            zone_dirs = glob.glob(os.path.join(self.sysfs_root, "class", "thermal", "thermal_zone*"))
+            zones = {}
+            for zone_dir in sorted(zone_dirs, key=natural_key):
+                zone_type = read_text(os.path.join(zone_dir, "type"))
+                if zone_type in self.CPU_ZONES:
+                    zones.setdefault(zone_type, []).append(zone_dir)
+
+            for zone_type in self.CPU_ZONES:
+                if zone_type in zones:
+                    for zone_dir in zones[zone_type]:
+                        found.append((
+                            "package", zone_type, os.path.basename(zone_dir),
+                            os.path.join(zone_dir, "temp")
+                        ))
+                    break
+
+        # Aynı etiketi taşıyan sensörleri (ör. çok soketli k10temp) ayırt et
+        label_counts = {}
+        for kind, label, _, _ in found:
+            label_counts[(kind, label)] = label_counts.get((kind, label), 0) + 1
+
+        for kind, label, source, path in found:
+            key = label
+            if label_counts[(kind, label)] > 1:
+                key = f"{label} ({source})"
+
+            fd = open_fd(path)
+            if fd is not None:
+                self.sensors.append((kind, key, fd))
+
+    @staticmethod
+    def _classify(chip, label):
+        """Sensörün paket mi çekirdek mi olduğunu belirler (ilgisizse None)"""
+        if label.startswith("Core") or label.startswith("Tccd"):
+            return "core"
+        if chip in ("coretemp", "k10temp", "zenpower") and not (
+                label.startswith("Package") or label in ("Tctl", "Tdie")):
+            return None
+        return "package"
+
+    def read(self):
+        """Tüm sensörleri okur ve paket/çekirdek sıcaklıklarını döndürür"""
+        temps = {"packages": {}, "cores": {}}
+
+        for kind, key, fd in self.sensors:
+            try:
+                raw = os.pread(fd, 16, 0)
+                value = int(raw) / 1000
+            except (OSError, ValueError):
+                # Bazı sensörler geçici olarak okunamayabilir
+                continue
+
+            if kind == "core":
+                temps["cores"][key] = value
+            else:
+                temps["packages"][key] = value
+
+        return temps
+
+    @staticmethod
+    def summarize(temps):
+        """Paket/çekirdek sıcaklıklarından tek bir CPU sıcaklığı üretir"""
+        packages = temps["packages"]
+
+        # k10temp'te Tctl ofsetli olabilir, Tdie varsa onu tercih et
+        tdie = [v for k, v in packages.items() if k.startswith("Tdie")]
+        if tdie:
+            return max(tdie)
+        if packages:
+            return max(packages.values())
+
+        cores = temps["cores"]
+        if cores:
+            return sum(cores.values()) / len(cores)
+
+        return 0
+
+    def close(self):
+        """Açık sensör dosyalarını kapatır"""
+        for _, _, fd in self.sensors:
+            close_fd(fd)
+        self.sensors = []
+
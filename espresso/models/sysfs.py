@@ -0,0 +1,80 @@
+"""
+Espresso - sysfs/procfs okuma yardımcıları
+"""
+
+import os
+import re
+
+
+def read_text(path):
+    """Küçük bir sysfs dosyasını okur, hata durumunda boş dize döndürür"""
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def read_int(path):
+    """Küçük bir sysfs dosyasını tamsayı olarak okur, hata durumunda 0 döndürür"""
+    try:
+        return int(read_text(path))
+    except ValueError:
+        return 0
+
+
+def open_fd(path):
+    """Dosyayı pread ile okumak üzere açar, açılamazsa None döndürür"""
+    if not path:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def pread_int(fd):
+    """Açık bir sysfs dosyasını baştan okuyup tamsayıya çevirir"""
+    if fd is None:
+        return 0
+    try:
+        return int(os.pread(fd, 32, 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def pread_all(fd, buffer):
+    """Açık bir procfs dosyasının tamamını arabelleğe okur
+
+    seq_file tabanlı procfs dosyaları tek okumada yalnızca yaklaşık bir
+    sayfa döndürür; kısa okuma dosya sonu sayılmaz, okuma 0 dönene kadar
+    ilerleyen konumdan sürdürülür. Dosya sığmazsa arabellek büyütülür;
+    (arabellek, okunan bayt) döndürür. Dönen arabellek sonraki çağrılarda
+    yeniden kullanılmalıdır.
+    """
+    size = 0
+    while True:
+        if size == len(buffer):
+            grown = bytearray(len(buffer) * 2)
+            grown[:size] = buffer
+            buffer = grown
+        count = os.preadv(fd, [memoryview(buffer)[size:]], size)
+        if not count:
+            return buffer, size
+        size += count
+
+
+def close_fd(fd):
+    """Açık dosya tanımlayıcısını sessizce kapatır"""
+    if fd is None:
+        return
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def natural_key(path):
+    """hwmon10'un hwmon2'den sonra gelmesi için doğal sıralama anahtarı"""
+    parts = re.split(r"(\d+)", os.path.basename(path))
+    return [int(part) if part.isdigit() else part for part in parts]
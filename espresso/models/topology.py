@@ -0,0 +1,178 @@
+"""
+Espresso - NUMA ve CPU topolojisi modeli
+"""
+
+import os
+import re
+
+from espresso.models.sysfs import read_text, read_int, open_fd, pread_all, close_fd
+
+
+# CPU gruplama türleri: NUMA düğümü, fiziksel soket, SMT kardeşleri (fiziksel çekirdek)
+CPU_GROUPS = ("node", "socket", "core")
+
+# Düğüm meminfo alanı -> kayıttaki ad
+NODE_MEMINFO_FIELDS = (
+    ("MemTotal", "total"),
+    ("MemFree", "free"),
+    ("FilePages", "file"),
+    ("AnonPages", "anon"),
+    ("Shmem", "shmem"),
+    ("SReclaimable", "slab_reclaimable"),
+    ("SUnreclaim", "slab_unreclaimable")
+)
+
+
+class CPUTopology:
+    """sysfs'ten NUMA düğümlerini, soketleri ve SMT kardeşlerini keşfeden sınıf
+
+    Topoloji bir kez okunur; çekirdek başına kullanımlar düğüm, soket ve
+    fiziksel çekirdek gruplarına ortalanır. Düğüm başına bellek
+    node*/meminfo dosyalarından, açık tanımlayıcılarla okunur. NUMA
+    desteği olmayan sistemlerde tüm CPU'lar ve bellek 0 numaralı düğüme
+    atanır.
+    """
+
+    def __init__(self, sysfs_root="/sys"):
+        self.cpu_dir = os.path.join(sysfs_root, "devices", "system", "cpu")
+        self.node_dir = os.path.join(sysfs_root, "devices", "system", "node")
+
+        self.cpus = {}   # CPU numarası -> {"node", "socket", "core"}
+        self.nodes = []  # NUMA düğüm numaraları
+        self.discover()
+
+        self.meminfo_fds = {}
+        for node in self.nodes:
+            fd = open_fd(os.path.join(self.node_dir, f"node{node}", "meminfo"))
+            if fd is not None:
+                self.meminfo_fds[node] = fd
+        self.meminfo_buffer = bytearray(8 * 1024)
+
+        self.meminfo_slots = {
+            key.encode("ascii"): slot for slot, (key, _) in enumerate(NODE_MEMINFO_FIELDS)
+        }
+
+    def discover(self):
+        """CPU -> düğüm/soket/çekirdek eşlemesini sysfs'ten yeniden okur"""
+        # Düğüm -> CPU listesi
+        cpu_nodes = {}
+        nodes = []
+        for name in _list_numbered(self.node_dir, "node"):
+            node = int(name[len("node"):])
+            nodes.append(node)
+            for cpu in parse_cpu_list(read_text(os.path.join(self.node_dir, name, "cpulist"))):
+                cpu_nodes[cpu] = node
+
+        cpus = {}
+        for name in _list_numbered(self.cpu_dir, "cpu"):
+            cpu = int(name[len("cpu"):])
+            topology = os.path.join(self.cpu_dir, name, "topology")
+
+            # SMT kardeşleri en küçük kardeşin numarasıyla gruplanır
+            siblings = parse_cpu_list(read_text(os.path.join(topology, "thread_siblings_list")))
+            cpus[cpu] = {
+                "node": cpu_nodes.get(cpu, 0),
+                "socket": read_int(os.path.join(topology, "physical_package_id")),
+                "core": min(siblings) if siblings else cpu
+            }
+
+        self.cpus = cpus
+        self.nodes = sorted(nodes) if nodes else [0]
+
+    def aggregate(self, core_usages, core_ids):
+        """Çekirdek kullanımlarını düğüm, soket ve fiziksel çekirdek başına ortalar
+
+        Grup türü -> [{"id", "usage", "cpus"}] sözlüğü döndürür.
+        """
+        # Sonradan çevrimiçi olan CPU'lar için topolojiyi tazele
+        if any(cpu not in self.cpus for cpu in core_ids):
+            self.discover()
+
+            # sysfs'te görünmeyen CPU'lar (ör. kapsayıcılar) her turda yeniden keşif tetiklemesin
+            for cpu in core_ids:
+                self.cpus.setdefault(cpu, {"node": 0, "socket": 0, "core": cpu})
+
+        groups = {group: {} for group in CPU_GROUPS}
+        for cpu, usage in zip(core_ids, core_usages):
+            info = self.cpus[cpu]
+            for group in CPU_GROUPS:
+                members = groups[group].setdefault(info[group], [])
+                members.append((cpu, usage))
+
+        result = {}
+        for group, members_by_id in groups.items():
+            result[group] = [
+                {
+                    "id": group_id,
+                    "usage": round(sum(usage for _, usage in members) / len(members), 1),
+                    "cpus": [cpu for cpu, _ in members]
+                }
+                for group_id, members in sorted(members_by_id.items())
+            ]
+        return result
+
+    def read_node_memory(self):
+        """Düğüm numarası -> bellek kullanımı (bayt ve yüzde) sözlüğü döndürür"""
+        result = {}
+        slots = self.meminfo_slots
+        for node, fd in self.meminfo_fds.items():
+            try:
+                self.meminfo_buffer, size = pread_all(fd, self.meminfo_buffer)
+            except OSError:
+                continue
+
+            record = [0] * len(NODE_MEMINFO_FIELDS)
+            for line in bytes(memoryview(self.meminfo_buffer)[:size]).split(b"\n"):
+                # Node 0 MemTotal:       16318412 kB
+                parts = line.split()
+                if len(parts) < 4:
+                    continue
+                slot = slots.get(parts[2][:-1])
+                if slot is not None:
+                    record[slot] = int(parts[3]) * 1024
+
+            memory = {name: value for (_, name), value in zip(NODE_MEMINFO_FIELDS, record)}
+
+            # Sistem özetiyle aynı tanım: sayfa önbelleği ve geri kazanılabilir slab kullanılmış sayılmaz
+            total = memory["total"]
+            cached = memory["file"] + memory["slab_reclaimable"]
+            used = total - memory["free"] - cached
+            if used < 0:
+                used = total - memory["free"]
+
+            memory["cached"] = cached
+            memory["used"] = used
+            memory["percent"] = round(used / total * 100, 1) if total else 0.0
+            result[node] = memory
+        return result
+
+    def close(self):
+        """Açık düğüm meminfo dosyalarını kapatır"""
+        for fd in self.meminfo_fds.values():
+            close_fd(fd)
+        self.meminfo_fds = {}
+
+
+def parse_cpu_list(text):
+    """0-3,8-11 biçimindeki CPU listesini numara listesine çevirir"""
+    cpus = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        try:
+            cpus.extend(range(int(start), int(end or start) + 1))
+        except ValueError:
+            continue
+    return cpus
+
+
+def _list_numbered(directory, prefix):
+    """Dizindeki "<önek><sayı>" girdilerini sayı sırasıyla döndürür"""
+    pattern = re.compile(re.escape(prefix) + r"\d+$")
+    try:
+        names = [name for name in os.listdir(directory) if pattern.match(name)]
+    except OSError:
+        return []
+    return sorted(names, key=lambda name: int(name[len(prefix):]))
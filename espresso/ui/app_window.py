@@ -11,6 +11,7 @@ from espresso.ui.cpu_panel import CPUPanel
 from espresso.ui.ram_panel import RAMPanel
 from espresso.ui.gpu_panel import GPUPanel
 from espresso.ui.disk_panel import DiskPanel
+from espresso.ui.network_panel import NetworkPanel
 
 
 class AppWindow(Gtk.ApplicationWindow):
@@ -181,7 +182,7 @@ class AppWindow(Gtk.ApplicationWindow):
         # Responsive düzen için FlowBox kullanıyoruz
         self.flow_box = Gtk.FlowBox()
         self.flow_box.set_valign(Gtk.Align.START)
-        self.flow_box.set_max_children_per_line(4)  # Yatayda tüm panelleri göster
+        self.flow_box.set_max_children_per_line(5)  # Yatayda tüm panelleri göster
         self.flow_box.set_min_children_per_line(1)  # Dar ekranlarda en az 1 panel
         self.flow_box.set_selection_mode(Gtk.SelectionMode.NONE)
         self.flow_box.set_homogeneous(False)  # Paneller kendi içlerinde küçülebilsin
@@ -194,6 +195,7 @@ class AppWindow(Gtk.ApplicationWindow):
         self.ram_panel = RAMPanel()
         self.gpu_panel = GPUPanel()
         self.disk_panel = DiskPanel()
+        self.network_panel = NetworkPanel()
         
         # Panelleri FlowBox'a yerleştir
         cpu_flow_child = Gtk.FlowBoxChild()
@@ -211,6 +213,10 @@ class AppWindow(Gtk.ApplicationWindow):
         disk_flow_child = Gtk.FlowBoxChild()
         disk_flow_child.set_child(self.disk_panel)
         self.flow_box.append(disk_flow_child)
+        
+        network_flow_child = Gtk.FlowBoxChild()
+        network_flow_child.set_child(self.network_panel)
+        self.flow_box.append(network_flow_child)
     
     def _create_menu_model(self):
         """Menü modelini oluşturur"""
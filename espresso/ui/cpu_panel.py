@@ -6,10 +6,21 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 
+from espresso.models.pressure import PressureStall
+from espresso.ui.graph import HistoryGraph
+
 
 class CPUPanel(Gtk.Box):
     """CPU paneli bileşeni"""
     
+    # (grup türü, seçicideki başlık); None gruplanmamış çekirdeklerdir
+    GROUP_OPTIONS = (
+        (None, "Çekirdek"),
+        ("node", "Düğüm"),
+        ("socket", "Soket"),
+        ("core", "Fiziksel")
+    )
+    
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         
@@ -17,15 +28,40 @@ class CPUPanel(Gtk.Box):
         self.add_css_class("panel")
         
         # Panel başlığı
+        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        self.append(title_box)
+        
         title_label = Gtk.Label(label="CPU")
         title_label.add_css_class("panel-title")
         title_label.set_halign(Gtk.Align.START)
-        self.append(title_label)
+        title_label.set_hexpand(True)
+        title_box.append(title_label)
+        
+        # Çekirdek çubuklarının gruplanması (mantıksal CPU, NUMA düğümü, soket, SMT kardeşleri)
+        self.group_selector = Gtk.DropDown.new_from_strings(
+            [title for _, title in self.GROUP_OPTIONS]
+        )
+        self.group_selector.set_tooltip_text("Çekirdek kullanımlarını grupla")
+        title_box.append(self.group_selector)
         
         # CPU kullanım grafiği
         self.usage_graph = CPUUsageGraph()
         self.append(self.usage_graph)
         
+        # CPU zaman dağılımı (kullanıcı/sistem/G/Ç bekleme/çalınan/kesme)
+        self.times_label = Gtk.Label(label="")
+        self.times_label.add_css_class("dim-label")
+        self.times_label.set_halign(Gtk.Align.START)
+        self.times_label.set_margin_top(4)
+        self.append(self.times_label)
+        
+        # Basınç duraklama oranı (PSI)
+        self.pressure_label = Gtk.Label(label="")
+        self.pressure_label.add_css_class("dim-label")
+        self.pressure_label.set_halign(Gtk.Align.START)
+        self.pressure_label.set_visible(False)
+        self.append(self.pressure_label)
+        
         # CPU sıcaklığı
         temp_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         temp_box.set_margin_top(8)
@@ -59,33 +95,46 @@ class CPUPanel(Gtk.Box):
         cores_box.append(cores_label)
         
         # Çekirdek kullanım çubukları
+        self.cores_box = cores_box
+        self.core_rows = []
         self.core_bars = []
         self.core_labels = []
         
         # Varsayılan olarak 4 çekirdek göster
         for i in range(4):
-            core_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-            core_box.set_margin_top(4)
-            cores_box.append(core_box)
-            
-            core_label = Gtk.Label(label=f"Çekirdek {i+1}:")
-            core_label.set_halign(Gtk.Align.START)
-            core_label.set_width_chars(10)
-            core_box.append(core_label)
-            self.core_labels.append(core_label)
-            
-            progress_bar = Gtk.ProgressBar()
-            progress_bar.set_fraction(0)
-            progress_bar.add_css_class("usage-bar")
-            progress_bar.add_css_class("low")
-            progress_bar.set_hexpand(True)
-            core_box.append(progress_bar)
-            self.core_bars.append(progress_bar)
+            self._add_core_row(f"Çekirdek {i+1}:")
     
     def update_usage_graph(self, history):
         """CPU kullanım grafiğini günceller"""
         self.usage_graph.update_data(history)
     
+    def update_time_breakdown(self, times):
+        """CPU zamanının kiplere göre dağılımını gösterir"""
+        if not times:
+            return
+        
+        irq = times["irq"] + times["softirq"]
+        self.times_label.set_text(
+            f"Kullanıcı {times['user'] + times['nice']:.1f}%  "
+            f"Sistem {times['system']:.1f}%  "
+            f"G/Ç {times['iowait']:.1f}%  "
+            f"Çalınan {times['steal']:.1f}%  "
+            f"IRQ {irq:.1f}%"
+        )
+        self.times_label.set_tooltip_text(
+            "\n".join(f"{field}: {value:.1f}%" for field, value in times.items() if field != "usage")
+        )
+    
+    def update_pressure(self, kinds):
+        """Basınç duraklama oranlarını gösterir (PSI yoksa gizler)"""
+        self.pressure_label.set_visible(bool(kinds))
+        if not kinds:
+            return
+        
+        text, tooltip = PressureStall.format(kinds, include_full=False)
+        self.pressure_label.set_text(text)
+        self.pressure_label.set_tooltip_text(tooltip)
+    
     def update_temperature(self, temperature):
         """CPU sıcaklık değerini günceller"""
         # Sıcaklık değerini güncelle
@@ -103,123 +152,72 @@ class CPUPanel(Gtk.Box):
         else:
             self.temp_value.add_css_class("high")
     
-    def update_core_info(self, core_usages):
-        """CPU çekirdek kullanım bilgilerini günceller"""
-        # Çekirdek sayısını kontrol et ve gerekirse yeni çubuklar ekle
-        if len(core_usages) > len(self.core_bars):
-            # Ek çekirdekler için yeni çubuklar ekle
-            parent = self.core_bars[0].get_parent().get_parent()
-            
-            for i in range(len(self.core_bars), len(core_usages)):
-                core_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-                core_box.set_margin_top(4)
-                parent.append(core_box)
-                
-                core_label = Gtk.Label(label=f"Çekirdek {i+1}:")
-                core_label.set_halign(Gtk.Align.START)
-                core_label.set_width_chars(10)
-                core_box.append(core_label)
-                self.core_labels.append(core_label)
-                
-                progress_bar = Gtk.ProgressBar()
-                progress_bar.set_fraction(0)
-                progress_bar.add_css_class("usage-bar")
-                progress_bar.add_css_class("low")
-                progress_bar.set_hexpand(True)
-                core_box.append(progress_bar)
-                self.core_bars.append(progress_bar)
+    def update_temperature_details(self, package_temps, core_temps):
+        """Paket ve çekirdek sıcaklıklarını ipucu olarak gösterir"""
+        lines = [f"{name}: {temp:.1f}°C" for name, temp in package_temps.items()]
+        lines += [f"{name}: {temp:.1f}°C" for name, temp in core_temps.items()]
+        self.temp_value.set_tooltip_text("\n".join(lines) if lines else None)
+    
+    def get_group(self):
+        """Seçili gruplama türünü döndürür (gruplanmamışsa None)"""
+        return self.GROUP_OPTIONS[self.group_selector.get_selected()][0]
+    
+    def update_core_info(self, core_usages, labels=None, tooltips=None):
+        """CPU çekirdek (ya da grup) kullanım bilgilerini günceller"""
+        if labels is None:
+            labels = [f"Çekirdek {i+1}:" for i in range(len(core_usages))]
+        
+        # Eksik satırları ekle
+        for i in range(len(self.core_bars), len(core_usages)):
+            self._add_core_row(labels[i])
+        
+        # Gruplama değişince fazla satırlar gizlenir
+        for i, row in enumerate(self.core_rows):
+            row.set_visible(i < len(core_usages))
         
         # Çekirdek kullanım değerlerini güncelle
         for i, usage in enumerate(core_usages):
-            if i < len(self.core_bars):
-                # İlerleme çubuğunu güncelle
-                self.core_bars[i].set_fraction(usage / 100)
-                
-                # Renk sınıfını güncelle
-                self.core_bars[i].remove_css_class("low")
-                self.core_bars[i].remove_css_class("medium")
-                self.core_bars[i].remove_css_class("high")
-                
-                if usage < 50:
-                    self.core_bars[i].add_css_class("low")
-                elif usage < 80:
-                    self.core_bars[i].add_css_class("medium")
-                else:
-                    self.core_bars[i].add_css_class("high")
+            self.core_labels[i].set_text(labels[i])
+            self.core_labels[i].set_tooltip_text(tooltips[i] if tooltips else None)
+            
+            # İlerleme çubuğunu güncelle
+            self.core_bars[i].set_fraction(usage / 100)
+            
+            # Renk sınıfını güncelle
+            self.core_bars[i].remove_css_class("low")
+            self.core_bars[i].remove_css_class("medium")
+            self.core_bars[i].remove_css_class("high")
+            
+            if usage < 50:
+                self.core_bars[i].add_css_class("low")
+            elif usage < 80:
+                self.core_bars[i].add_css_class("medium")
+            else:
+                self.core_bars[i].add_css_class("high")
+    
+    def _add_core_row(self, label):
+        """Çekirdek listesine etiket ve kullanım çubuğundan oluşan bir satır ekler"""
+        core_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        core_box.set_margin_top(4)
+        self.cores_box.append(core_box)
+        self.core_rows.append(core_box)
+        
+        core_label = Gtk.Label(label=label)
+        core_label.set_halign(Gtk.Align.START)
+        core_label.set_width_chars(10)
+        core_box.append(core_label)
+        self.core_labels.append(core_label)
+        
+        progress_bar = Gtk.ProgressBar()
+        progress_bar.set_fraction(0)
+        progress_bar.add_css_class("usage-bar")
+        progress_bar.add_css_class("low")
+        progress_bar.set_hexpand(True)
+        core_box.append(progress_bar)
+        self.core_bars.append(progress_bar)
 
 
-class CPUUsageGraph(Gtk.DrawingArea):
+class CPUUsageGraph(HistoryGraph):
     """CPU kullanım grafiği bileşeni"""
     
-    def __init__(self):
-        super().__init__()
-        
-        # Veri noktaları
-        self.data = []
-        self.max_data_points = 60
-        
-        # Çizim alanı ayarları
-        self.set_content_width(200)
-        self.set_content_height(100)
-        self.set_draw_func(self._draw_func)
-        self.set_hexpand(True)
-    
-    def update_data(self, data):
-        """Grafik verilerini günceller"""
-        self.data = data.copy()
-        self.queue_draw()
-    
-    def _draw_func(self, area, cr, width, height):
-        """Grafik çizim fonksiyonu"""
-        # Arka planı temizle
-        cr.set_source_rgba(0.2, 0.2, 0.2, 0.5)
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
-        
-        # Veri yoksa çizme
-        if not self.data:
-            return
-        
-        # Izgara çiz
-        cr.set_source_rgba(0.5, 0.5, 0.5, 0.2)
-        cr.set_line_width(1)
-        
-        # Yatay ızgaralar
-        for i in range(1, 4):
-            y = height * i / 4
-            cr.move_to(0, y)
-            cr.line_to(width, y)
-            cr.stroke()
-        
-        # Dikey ızgaralar
-        for i in range(1, 6):
-            x = width * i / 6
-            cr.move_to(x, 0)
-            cr.line_to(x, height)
-            cr.stroke()
-        
-        # Veriyi çiz
-        cr.set_source_rgba(0.2, 0.7, 0.9, 1.0)
-        cr.set_line_width(2)
-        
-        # Veri noktalarını ölçeklendir
-        point_width = width / min(self.max_data_points, len(self.data))
-        
-        # İlk noktayı ayarla
-        cr.move_to(0, height - (self.data[0] / 100) * height)
-        
-        # Diğer noktaları çiz
-        for i, value in enumerate(self.data):
-            x = i * point_width
-            y = height - (value / 100) * height
-            cr.line_to(x, y)
-        
-        # Çizgiyi çiz
-        cr.stroke()
-        
-        # Dolgu ekle
-        cr.line_to(width, height)
-        cr.line_to(0, height)
-        cr.close_path()
-        cr.set_source_rgba(0.2, 0.7, 0.9, 0.3)
-        cr.fill()
+    COLORS = [(0.2, 0.7, 0.9)]
@@ -5,9 +5,11 @@ Espresso - Disk panel bileşeni
 import os
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib, Gio, GdkPixbuf
+from gi.repository import Gtk, GLib, Gio, GdkPixbuf, GObject
 
 from espresso.models.disk_scanner import DiskScanner
+from espresso.models.pressure import PressureStall
+from espresso.ui.graph import HistoryGraph
 
 
 class DiskPanel(Gtk.Box):
@@ -50,6 +52,35 @@ class DiskPanel(Gtk.Box):
         # Disk bölümleri için dinamik olarak oluşturulacak
         self.partition_bars = {}
         
+        # Aygıt başına G/Ç etkinliği
+        io_frame = Gtk.Frame()
+        io_frame.set_margin_top(8)
+        self.append(io_frame)
+        
+        io_outer = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        io_outer.set_margin_top(8)
+        io_outer.set_margin_bottom(8)
+        io_outer.set_margin_start(8)
+        io_outer.set_margin_end(8)
+        io_frame.set_child(io_outer)
+        
+        io_label = Gtk.Label(label="Disk G/Ç")
+        io_label.set_halign(Gtk.Align.START)
+        io_outer.append(io_label)
+        
+        # Basınç duraklama oranı (PSI)
+        self.pressure_label = Gtk.Label(label="")
+        self.pressure_label.add_css_class("dim-label")
+        self.pressure_label.set_halign(Gtk.Align.START)
+        self.pressure_label.set_visible(False)
+        io_outer.append(self.pressure_label)
+        
+        self.io_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        io_outer.append(self.io_box)
+        
+        # Aygıt adı -> satır bileşenleri; aygıt listesi değişmedikçe yerinde güncellenir
+        self.io_rows = {}
+        
         # Dizin tarama sonuçları
         tree_frame = Gtk.Frame()
         tree_frame.set_margin_top(16)
@@ -85,12 +116,19 @@ class DiskPanel(Gtk.Box):
         self.tree_store = Gtk.TreeStore(
             str,    # Dizin/dosya adı
             str,    # Boyut (insan okunabilir)
-            int,    # Boyut (bayt)
+            GObject.TYPE_INT64,  # Boyut (bayt); 2 GB üstü boyutlar için 64 bit
             str,    # Tür (dizin/dosya)
             str,    # Tam yol
-            str     # İkon adı
+            str,    # İkon adı
+            int     # Tarama sonuçlarındaki girdi indeksi
         )
         
+        # Girdi indeksi -> ağaç satırı (izleme kipinde yerinde güncelleme için)
+        self.tree_rows = {}
+        
+        # Alt öğeleri eklenmiş dizin satırlarının girdi indeksleri (açıldıkça doldurulur)
+        self.populated = set()
+        
         # Ağaç görünümü
         self.tree_view = Gtk.TreeView(model=self.tree_store)
         self.tree_view.set_headers_visible(True)
@@ -160,7 +198,13 @@ class DiskPanel(Gtk.Box):
             used_gb = info["used"] / (1024 * 1024 * 1024)
             percent = info["percent"]
             
-            usage_label = Gtk.Label(label=f"{used_gb:.1f} / {total_gb:.1f} GB ({percent:.1f}%)")
+            usage_text = f"{used_gb:.1f} / {total_gb:.1f} GB ({percent:.1f}%)"
+            unresponsive = info.get("status") == "unresponsive"
+            if unresponsive:
+                # Askıda kalan bağlama: son bilinen değerleri göster
+                usage_text = f"Yanıt vermiyor ({usage_text})" if total_gb else "Yanıt vermiyor"
+            
+            usage_label = Gtk.Label(label=usage_text)
             usage_label.set_halign(Gtk.Align.END)
             usage_label.set_hexpand(True)
             label_box.append(usage_label)
@@ -171,7 +215,10 @@ class DiskPanel(Gtk.Box):
             progress_bar.add_css_class("usage-bar")
             
             # Renk sınıfını ayarla
-            if percent < 70:
+            if unresponsive:
+                progress_bar.set_sensitive(False)
+                progress_bar.set_tooltip_text("statvfs zaman aşımına uğradı, daha sonra yeniden denenecek")
+            elif percent < 70:
                 progress_bar.add_css_class("low")
             elif percent < 90:
                 progress_bar.add_css_class("medium")
@@ -186,6 +233,73 @@ class DiskPanel(Gtk.Box):
                 "label": usage_label
             }
     
+    def update_pressure(self, kinds):
+        """Basınç duraklama oranlarını gösterir (PSI yoksa gizler)"""
+        self.pressure_label.set_visible(bool(kinds))
+        if not kinds:
+            return
+        
+        text, tooltip = PressureStall.format(kinds)
+        self.pressure_label.set_text(text)
+        self.pressure_label.set_tooltip_text(tooltip)
+    
+    def update_disk_io(self, disk_io, histories):
+        """Aygıt başına G/Ç hızlarını ve okuma/yazma grafiklerini günceller
+        
+        histories, aygıt adından (okuma serisi, yazma serisi) ikilisine eşlenir.
+        """
+        # Aygıt listesi değiştiyse satırları yeniden oluştur
+        if set(disk_io) != set(self.io_rows):
+            while child := self.io_box.get_first_child():
+                self.io_box.remove(child)
+            self.io_rows = {}
+            
+            for device in sorted(disk_io):
+                row = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+                row.set_margin_top(4)
+                self.io_box.append(row)
+                
+                header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+                row.append(header)
+                
+                name_label = Gtk.Label()
+                name_label.set_halign(Gtk.Align.START)
+                header.append(name_label)
+                
+                rate_label = Gtk.Label()
+                rate_label.set_halign(Gtk.Align.END)
+                rate_label.set_hexpand(True)
+                header.append(rate_label)
+                
+                # Okuma (mavi) ve yazma (turuncu) hızları, görünen en yüksek değere ölçekli
+                graph = DiskIOGraph()
+                row.append(graph)
+                
+                self.io_rows[device] = {
+                    "name": name_label,
+                    "rate": rate_label,
+                    "graph": graph
+                }
+        
+        for device, stats in disk_io.items():
+            row = self.io_rows[device]
+            
+            mountpoints = ", ".join(stats["mountpoints"])
+            row["name"].set_text(f"{device} ({mountpoints}):" if mountpoints else f"{device}:")
+            
+            read = DiskScanner.format_size(int(stats["read_bytes"]))
+            write = DiskScanner.format_size(int(stats["write_bytes"]))
+            row["rate"].set_text(f"O {read}/s  Y {write}/s  {stats['utilization']:.0f}%")
+            row["rate"].set_tooltip_text(
+                f"Okuma: {stats['read_iops']:.0f} IOPS, {stats['read_latency']:.2f} ms\n"
+                f"Yazma: {stats['write_iops']:.0f} IOPS, {stats['write_latency']:.2f} ms\n"
+                f"Kuyruk derinliği: {stats['queue_depth']:.2f} (süren: {stats['in_flight']})\n"
+                f"Meşguliyet: {stats['utilization']:.1f}%"
+            )
+            
+            if device in histories:
+                row["graph"].update_data(list(histories[device]))
+    
     def update_scan_status(self, scanning):
         """Tarama durumunu günceller"""
         if scanning:
@@ -195,81 +309,146 @@ class DiskPanel(Gtk.Box):
             self.scan_status.stop()
             self.scan_status.set_visible(False)
     
-    def update_directory_tree(self, scan_results):
-        """Dizin ağacını günceller"""
+    def update_directory_tree(self, results):
+        """Dizin ağacını tipli dizi tabanlı tarama sonuçlarından günceller
+        
+        Tarama derinliği sınırsız olduğundan tüm girdiler bir kerede modele
+        eklenmez; yalnızca kök ve doğrudan alt öğeleri eklenir, diğer
+        dizinler açıldıkça populate_directory_row ile doldurulur.
+        """
         # Ağaç modelini temizle
         self.tree_store.clear()
+        self.tree_rows = {}
+        self.populated = set()
+        if results is None:
+            return
+        
+        # Kök (0 numaralı girdi) taramanın toplam boyutunu taşır
+        root_iter = self._append_row(None, results, 0, results.name(0))
+        self.populate_directory_row(results, root_iter)
+    
+    def populate_directory_row(self, results, row):
+        """Dizin satırının alt öğelerini ilk açılışta sonuçların alt öğe indeksinden ekler"""
+        index = self.tree_store.get_value(row, 6)
+        if index in self.populated:
+            return
+        self.populated.add(index)
         
-        # Kök dizinleri bul
-        root_paths = set()
-        for path, info in scan_results.items():
-            parent = info["parent"]
-            if parent not in scan_results:
-                root_paths.add(parent)
+        # Genişletme okunu gösteren yer tutucuyu kaldır
+        child = self.tree_store.iter_children(row)
+        if child is not None and self.tree_store.get_value(child, 6) < 0:
+            self.tree_store.remove(child)
         
-        # Her kök dizin için ağaç oluştur
-        for root_path in sorted(root_paths):
-            self._add_directory_to_tree(None, root_path, scan_results)
+        # Gösterim derinliğinin altındaki (gizli) dizinler yalnızca artımlı tarama içindir
+        children = sorted(
+            (child for child in results.children(index) if self._is_shown(results, child)),
+            key=lambda child: (not results.is_directory(child), results.name(child))
+        )
+        
+        # Önce dizinler, sonra dosyalar
+        dir_path = self.tree_store.get_value(row, 4)
+        for child in children:
+            self._append_row(row, results, child, os.path.join(dir_path, results.name(child)))
     
-    def _add_directory_to_tree(self, parent_iter, directory, scan_results):
-        """Dizini ve alt öğelerini ağaca ekler"""
-        # Dizin adını al
-        dir_name = os.path.basename(directory)
-        if not dir_name:  # Kök dizin için
-            dir_name = directory
-        
-        # Dizin bilgilerini al
-        dir_info = scan_results.get(directory)
-        if dir_info:
-            dir_size = dir_info["size"]
-            dir_size_str = DiskScanner.format_size(dir_size)
-            dir_type = "Dizin"
-            dir_icon = "folder-symbolic"
+    def update_directory_entries(self, results, changes):
+        """İzleme kipinde değişen girdilerin satırlarını ağacı yeniden kurmadan günceller"""
+        # Yeni girdiler üst dizinlerinden sonra eklendiğinden artan sırada önce üst satır kurulur
+        for index in sorted(changes):
+            if results.is_hidden(index):
+                continue
+            
+            row = self.tree_rows.get(index)
+            if not results.is_live(index):
+                if row is not None:
+                    self._remove_row(row)
+                continue
+            
+            if row is not None:
+                size = results.size(index)
+                self.tree_store.set_value(row, 1, DiskScanner.format_size(size))
+                self.tree_store.set_value(row, 2, size)
+                continue
+            
+            # Henüz açılmamış dizinlere satır eklenmez; açıldığında güncel sonuçlardan doldurulur
+            parent = results.parent(index)
+            parent_row = self.tree_rows.get(parent)
+            if parent_row is None:
+                continue
+            if parent in self.populated:
+                path = os.path.join(self.tree_store.get_value(parent_row, 4), results.name(index))
+                self._append_row(parent_row, results, index, path)
+            elif self.tree_store.iter_children(parent_row) is None:
+                self._append_placeholder(parent_row)
+    
+    def _is_shown(self, results, index):
+        """Girdi ağaçta gösterilir mi"""
+        return not results.is_hidden(index) and results.is_live(index)
+    
+    def _append_row(self, parent_iter, results, index, path):
+        """Girdi için ağaca satır ekler ve satırı döndürür"""
+        name = results.name(index)
+        size = results.size(index)
+        if index == 0:
+            # Kökün adı tam yoludur
+            name = os.path.basename(name) or name
+        
+        if results.is_directory(index):
+            values = [
+                name, DiskScanner.format_size(size), size, "Dizin", path, "folder-symbolic", index
+            ]
         else:
-            dir_size = 0
-            dir_size_str = "0 B"
-            dir_type = "Dizin"
-            dir_icon = "folder-symbolic"
-        
-        # Dizini ağaca ekle
-        dir_iter = self.tree_store.append(parent_iter, [
-            dir_name, dir_size_str, dir_size, dir_type, directory, dir_icon
-        ])
-        
-        # Alt öğeleri bul
-        children = {}
-        for path, info in scan_results.items():
-            if info["parent"] == directory:
-                children[path] = info
-        
-        # Önce dizinleri ekle
-        for path, info in sorted(children.items(), key=lambda x: x[0]):
-            if info["type"] == "directory":
-                self._add_directory_to_tree(dir_iter, path, scan_results)
-        
-        # Sonra dosyaları ekle
-        for path, info in sorted(children.items(), key=lambda x: x[0]):
-            if info["type"] == "file":
-                file_name = info["name"]
-                file_size = info["size"]
-                file_size_str = DiskScanner.format_size(file_size)
-                
-                # Dosya türüne göre ikon belirle
-                file_icon = "text-x-generic-symbolic"
-                
-                # Uzantıya göre ikon
-                if file_name.endswith((".jpg", ".jpeg", ".png", ".gif")):
-                    file_icon = "image-x-generic-symbolic"
-                elif file_name.endswith((".mp3", ".wav", ".ogg", ".flac")):
-                    file_icon = "audio-x-generic-symbolic"
-                elif file_name.endswith((".mp4", ".mkv", ".avi", ".mov")):
-                    file_icon = "video-x-generic-symbolic"
-                elif file_name.endswith((".pdf", ".epub")):
-                    file_icon = "x-office-document-symbolic"
-                elif file_name.endswith((".zip", ".tar", ".gz", ".xz", ".bz2")):
-                    file_icon = "package-x-generic-symbolic"
-                
-                # Dosyayı ağaca ekle
-                self.tree_store.append(dir_iter, [
-                    file_name, file_size_str, file_size, "Dosya", path, file_icon
-                ])
+            values = [
+                name, DiskScanner.format_size(size), size, "Dosya", path,
+                self._file_icon(name), index
+            ]
+        
+        row = self.tree_store.append(parent_iter, values)
+        self.tree_rows[index] = row
+        
+        # Alt öğesi olan dizinler açılabilir görünsün diye yer tutucu alır
+        if index and results.is_directory(index) and any(
+            self._is_shown(results, child) for child in results.children(index)
+        ):
+            self._append_placeholder(row)
+        return row
+    
+    def _append_placeholder(self, row):
+        """Henüz doldurulmamış dizin satırına boş bir alt satır ekler"""
+        self.tree_store.append(row, ["", "", 0, "", "", "", -1])
+    
+    def _remove_row(self, row):
+        """Satırı alt satırlarıyla birlikte kaldırır ve eşlemeden düşer"""
+        stack = [row]
+        while stack:
+            current = stack.pop()
+            index = self.tree_store.get_value(current, 6)
+            self.tree_rows.pop(index, None)
+            self.populated.discard(index)
+            child = self.tree_store.iter_children(current)
+            while child is not None:
+                stack.append(child)
+                child = self.tree_store.iter_next(child)
+        self.tree_store.remove(row)
+    
+    def _file_icon(self, file_name):
+        """Dosya uzantısına göre ikon adını döndürür"""
+        if file_name.endswith((".jpg", ".jpeg", ".png", ".gif")):
+            return "image-x-generic-symbolic"
+        elif file_name.endswith((".mp3", ".wav", ".ogg", ".flac")):
+            return "audio-x-generic-symbolic"
+        elif file_name.endswith((".mp4", ".mkv", ".avi", ".mov")):
+            return "video-x-generic-symbolic"
+        elif file_name.endswith((".pdf", ".epub")):
+            return "x-office-document-symbolic"
+        elif file_name.endswith((".zip", ".tar", ".gz", ".xz", ".bz2")):
+            return "package-x-generic-symbolic"
+        return "text-x-generic-symbolic"
+
+
+class DiskIOGraph(HistoryGraph):
+    """Aygıt başına okuma/yazma hızı grafiği"""
+    
+    COLORS = [(0.2, 0.7, 0.9), (0.9, 0.5, 0.1)]
+    
+    def __init__(self):
+        super().__init__(max_value=None, height=36)
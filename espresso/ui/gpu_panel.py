@@ -4,7 +4,10 @@ Espresso - GPU panel bileşeni
 
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, GObject, Pango
+
+from espresso.models.disk_scanner import DiskScanner
+from espresso.ui.graph import HistoryGraph
 
 
 class GPUPanel(Gtk.Box):
@@ -81,6 +84,85 @@ class GPUPanel(Gtk.Box):
         info_label.set_halign(Gtk.Align.START)
         self.info_box.append(info_label)
         
+        # GPU listesi (birden fazla GPU varsa)
+        self.gpu_list_frame = Gtk.Frame()
+        self.gpu_list_frame.set_margin_top(8)
+        self.gpu_list_frame.set_visible(False)
+        self.append(self.gpu_list_frame)
+        
+        self.gpu_list_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        self.gpu_list_box.set_margin_top(8)
+        self.gpu_list_box.set_margin_bottom(8)
+        self.gpu_list_box.set_margin_start(8)
+        self.gpu_list_box.set_margin_end(8)
+        self.gpu_list_frame.set_child(self.gpu_list_box)
+        
+        gpu_list_label = Gtk.Label(label="GPU'lar")
+        gpu_list_label.set_halign(Gtk.Align.START)
+        self.gpu_list_box.append(gpu_list_label)
+        
+        # GPU başına satır bileşenleri
+        self.gpu_rows = []
+        
+        # GPU süreçleri tablosu
+        self.process_frame = Gtk.Frame()
+        self.process_frame.set_margin_top(8)
+        self.process_frame.set_visible(False)
+        self.append(self.process_frame)
+        
+        process_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        process_box.set_margin_top(8)
+        process_box.set_margin_bottom(8)
+        process_box.set_margin_start(8)
+        process_box.set_margin_end(8)
+        self.process_frame.set_child(process_box)
+        
+        process_label = Gtk.Label(label="Süreçler")
+        process_label.set_halign(Gtk.Align.START)
+        process_box.append(process_label)
+        
+        process_scroll = Gtk.ScrolledWindow()
+        process_scroll.set_min_content_height(120)
+        process_scroll.set_vexpand(True)
+        process_box.append(process_scroll)
+        
+        # Süreç tablosu modeli
+        self.process_store = Gtk.ListStore(
+            int,                # PID
+            str,                # Süreç adı
+            int,                # GPU dizini
+            str,                # Tür (C/G/C+G)
+            str,                # Bellek (insan okunabilir)
+            GObject.TYPE_INT64, # Bellek (bayt)
+            str,                # SM kullanımı (metin)
+            int                 # SM kullanımı (sıralama için, yoksa -1)
+        )
+        
+        self.process_view = Gtk.TreeView(model=self.process_store)
+        self.process_view.set_headers_visible(True)
+        process_scroll.set_child(self.process_view)
+        
+        # Sütunlar: (başlık, gösterilen sütun, sıralama sütunu, genişlesin mi)
+        for title, text_column, sort_column, expand in (
+                ("PID", 0, 0, False),
+                ("Ad", 1, 1, True),
+                ("GPU", 2, 2, False),
+                ("Tür", 3, 3, False),
+                ("Bellek", 4, 5, False),
+                ("SM", 6, 7, False)):
+            renderer = Gtk.CellRendererText()
+            if title == "Ad":
+                renderer.set_property("ellipsize", Pango.EllipsizeMode.END)
+            else:
+                renderer.set_alignment(1.0, 0.5)
+            column = Gtk.TreeViewColumn(title, renderer, text=text_column)
+            column.set_sort_column_id(sort_column)
+            column.set_expand(expand)
+            self.process_view.append_column(column)
+        
+        # Varsayılan olarak en çok bellek kullanan süreç üstte
+        self.process_store.set_sort_column_id(5, Gtk.SortType.DESCENDING)
+        
         # GPU bulunamadı mesajı
         self.no_gpu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self.no_gpu_box.set_margin_top(16)
@@ -124,6 +206,8 @@ class GPUPanel(Gtk.Box):
         """GPU bulunamadı mesajını gösterir"""
         self.usage_graph.set_visible(False)
         self.info_box.get_parent().set_visible(False)
+        self.gpu_list_frame.set_visible(False)
+        self.process_frame.set_visible(False)
         self.no_gpu_box.set_visible(True)
     
     def show_gpu_info(self):
@@ -132,9 +216,9 @@ class GPUPanel(Gtk.Box):
         self.info_box.get_parent().set_visible(True)
         self.no_gpu_box.set_visible(False)
     
-    def update_usage_graph(self, history):
-        """GPU kullanım grafiğini günceller"""
-        self.usage_graph.update_data(history)
+    def update_usage_graph(self, histories):
+        """GPU kullanım grafiğini günceller (GPU başına bir geçmiş)"""
+        self.usage_graph.update_data(histories)
     
     def update_temperature(self, temperature):
         """GPU sıcaklık değerini günceller"""
@@ -180,80 +264,123 @@ class GPUPanel(Gtk.Box):
         # GPU modeli
         if "name" in gpu_info:
             self.model_value.set_text(gpu_info["name"])
-
-
-class GPUUsageGraph(Gtk.DrawingArea):
-    """GPU kullanım grafiği bileşeni"""
     
-    def __init__(self):
-        super().__init__()
+    def update_gpu_list(self, gpus):
+        """Her GPU için kullanım, sıcaklık ve bellek satırlarını günceller"""
+        # Tek GPU'da özet bilgiler yeterli
+        self.gpu_list_frame.set_visible(len(gpus) > 1)
+        if len(gpus) < 2:
+            return
         
-        # Veri noktaları
-        self.data = []
-        self.max_data_points = 60
+        # Eksik satırları oluştur
+        for i in range(len(self.gpu_rows), len(gpus)):
+            row_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+            row_box.set_margin_top(4)
+            self.gpu_list_box.append(row_box)
+            
+            label_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+            row_box.append(label_box)
+            
+            name_label = Gtk.Label(label=f"GPU {i}:")
+            name_label.set_halign(Gtk.Align.START)
+            name_label.set_ellipsize(Pango.EllipsizeMode.END)
+            label_box.append(name_label)
+            
+            value_label = Gtk.Label(label="")
+            value_label.set_halign(Gtk.Align.END)
+            value_label.set_hexpand(True)
+            label_box.append(value_label)
+            
+            progress_bar = Gtk.ProgressBar()
+            progress_bar.set_fraction(0)
+            progress_bar.add_css_class("usage-bar")
+            progress_bar.add_css_class("low")
+            row_box.append(progress_bar)
+            
+            self.gpu_rows.append({
+                "box": row_box,
+                "name": name_label,
+                "value": value_label,
+                "bar": progress_bar
+            })
+        
+        # Fazla satırları gizle
+        for i, row in enumerate(self.gpu_rows):
+            row["box"].set_visible(i < len(gpus))
         
-        # Çizim alanı ayarları
-        self.set_content_width(200)
-        self.set_content_height(100)
-        self.set_draw_func(self._draw_func)
-        self.set_hexpand(True)
-    
-    def update_data(self, data):
-        """Grafik verilerini günceller"""
-        self.data = data.copy()
-        self.queue_draw()
+        # Değerleri güncelle
+        for row, gpu in zip(self.gpu_rows, gpus):
+            usage = gpu["usage"]
+            memory = gpu["memory"]
+            used_gb = memory["used"] / (1024 * 1024 * 1024)
+            total_gb = memory["total"] / (1024 * 1024 * 1024)
+            
+            row["name"].set_text(f"{gpu.get('index', 0)}: {gpu['name']}")
+            row["value"].set_text(
+                f"{usage:.0f}% · {gpu['temp']:.0f}°C · {used_gb:.1f} / {total_gb:.1f} GB"
+            )
+            row["bar"].set_fraction(usage / 100)
+            
+            # Renk sınıfını güncelle
+            row["bar"].remove_css_class("low")
+            row["bar"].remove_css_class("medium")
+            row["bar"].remove_css_class("high")
+            
+            if usage < 50:
+                row["bar"].add_css_class("low")
+            elif usage < 80:
+                row["bar"].add_css_class("medium")
+            else:
+                row["bar"].add_css_class("high")
+
+
+    def update_process_table(self, processes):
+        """GPU süreç tablosunu yerinde günceller"""
+        self.process_frame.set_visible(bool(processes))
+        
+        # Mevcut satırları (GPU, PID) anahtarıyla eşle; seçim ve sıralama korunur
+        rows = {}
+        tree_iter = self.process_store.get_iter_first()
+        while tree_iter is not None:
+            key = (self.process_store[tree_iter][2], self.process_store[tree_iter][0])
+            rows[key] = tree_iter
+            tree_iter = self.process_store.iter_next(tree_iter)
+        
+        for process in processes:
+            sm_util = process["sm_util"]
+            values = [
+                process["pid"],
+                process["name"],
+                process["gpu"],
+                "+".join(process["type"]),
+                DiskScanner.format_size(process["memory"]),
+                process["memory"],
+                f"{sm_util}%" if sm_util is not None else "-",
+                sm_util if sm_util is not None else -1
+            ]
+            
+            tree_iter = rows.pop((process["gpu"], process["pid"]), None)
+            if tree_iter is None:
+                self.process_store.append(values)
+            else:
+                self.process_store.set(tree_iter, list(range(len(values))), values)
+        
+        # Sonlanan süreçleri kaldır
+        for tree_iter in rows.values():
+            self.process_store.remove(tree_iter)
+
+
+class GPUUsageGraph(HistoryGraph):
+    """GPU kullanım grafiği bileşeni"""
     
-    def _draw_func(self, area, cr, width, height):
-        """Grafik çizim fonksiyonu"""
-        # Arka planı temizle
-        cr.set_source_rgba(0.2, 0.2, 0.2, 0.5)
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
-        
-        # Veri yoksa çizme
-        if not self.data:
-            return
-        
-        # Izgara çiz
-        cr.set_source_rgba(0.5, 0.5, 0.5, 0.2)
-        cr.set_line_width(1)
-        
-        # Yatay ızgaralar
-        for i in range(1, 4):
-            y = height * i / 4
-            cr.move_to(0, y)
-            cr.line_to(width, y)
-            cr.stroke()
-        
-        # Dikey ızgaralar
-        for i in range(1, 6):
-            x = width * i / 6
-            cr.move_to(x, 0)
-            cr.line_to(x, height)
-            cr.stroke()
-        
-        # Veriyi çiz
-        cr.set_source_rgba(0.9, 0.5, 0.1, 1.0)
-        cr.set_line_width(2)
-        
-        # Veri noktalarını ölçeklendir
-        point_width = width / min(self.max_data_points, len(self.data))
-        
-        # İlk noktayı ayarla
-        cr.move_to(0, height - (self.data[0] / 100) * height)
-        
-        # Diğer noktaları çiz
-        for i, value in enumerate(self.data):
-            x = i * point_width
-            y = height - (value / 100) * height
-            cr.line_to(x, y)
-        
-        # Çizgiyi çiz
-        cr.stroke()
-        
-        # Dolgu ekle
-        cr.line_to(width, height)
-        cr.line_to(0, height)
-        cr.close_path()
-        cr.set_source_rgba(0.9, 0.5, 0.1, 0.3)
-        cr.fill()
+    # GPU başına çizgi renkleri (ilki tek GPU'daki varsayılan renk)
+    COLORS = [
+        (0.9, 0.5, 0.1),
+        (0.2, 0.7, 0.9),
+        (0.4, 0.8, 0.3),
+        (0.8, 0.3, 0.7),
+        (0.9, 0.8, 0.2),
+        (0.9, 0.3, 0.3),
+        (0.5, 0.5, 0.9),
+        (0.6, 0.9, 0.8)
+    ]
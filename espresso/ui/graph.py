@@ -0,0 +1,221 @@
+"""
+Espresso - Zaman penceresli geçmiş grafiği bileşeni
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib
+
+
+class HistoryGraph(Gtk.DrawingArea):
+    """Geçmiş deposundaki serileri seçilen zaman penceresinde çizen grafik
+
+    Fare tekerleğiyle pencere büyütülüp küçültülür. Her seri, pencereyi
+    grafik genişliğine sığan en ince toplama katmanından okunur; toplanmış
+    katmanlarda ortalama çizginin arkasında min/max bandı gösterilir.
+    """
+
+    # Seçilebilir zaman pencereleri (saniye, etiket)
+    WINDOWS = [
+        (60, "1 dk"),
+        (10 * 60, "10 dk"),
+        (60 * 60, "1 sa"),
+        (6 * 60 * 60, "6 sa"),
+        (24 * 60 * 60, "24 sa"),
+        (7 * 24 * 60 * 60, "7 gün")
+    ]
+
+    # Seri başına çizgi renkleri
+    COLORS = [(0.2, 0.7, 0.9)]
+
+    def __init__(self, max_value=100, height=100):
+        super().__init__()
+
+        # Geçmiş deposundaki seriler (toplama katmanlı), kopyalanmaz
+        self.series = []
+        self.window_index = 0
+
+        # Dikey eksenin üst sınırı; None ise görünen en yüksek değere ölçeklenir
+        self.max_value = max_value
+
+        # Çizim alanı ayarları
+        self.set_content_width(200)
+        self.set_content_height(height)
+        self.set_draw_func(self._draw_func)
+        self.set_hexpand(True)
+        self.set_tooltip_text("Zaman aralığını değiştirmek için kaydırın")
+
+        # Tekerlek ile zaman penceresini değiştir
+        scroll = Gtk.EventControllerScroll.new(Gtk.EventControllerScrollFlags.VERTICAL)
+        scroll.connect("scroll", self._on_scroll)
+        self.add_controller(scroll)
+
+    def update_data(self, series):
+        """Grafik serilerini günceller (tek seri ya da seri listesi)"""
+        if not isinstance(series, (list, tuple)):
+            series = [series]
+        self.series = series
+        self.queue_draw()
+
+    def _on_scroll(self, controller, dx, dy):
+        """Yukarı kaydırma pencereyi daraltır, aşağı kaydırma genişletir"""
+        step = 1 if dy > 0 else -1
+        index = min(max(self.window_index + step, 0), len(self.WINDOWS) - 1)
+        if index != self.window_index:
+            self.window_index = index
+            self.queue_draw()
+        return True
+
+    def _draw_func(self, area, cr, width, height):
+        """Grafik çizim fonksiyonu"""
+        # Arka planı temizle
+        cr.set_source_rgba(0.2, 0.2, 0.2, 0.5)
+        cr.rectangle(0, 0, width, height)
+        cr.fill()
+
+        # Veri yoksa çizme
+        if not any(len(series) for series in self.series):
+            return
+
+        # Izgara çiz
+        cr.set_source_rgba(0.5, 0.5, 0.5, 0.2)
+        cr.set_line_width(1)
+
+        # Yatay ızgaralar
+        for i in range(1, 4):
+            y = height * i / 4
+            cr.move_to(0, y)
+            cr.line_to(width, y)
+            cr.stroke()
+
+        # Dikey ızgaralar
+        for i in range(1, 6):
+            x = width * i / 6
+            cr.move_to(x, 0)
+            cr.line_to(x, height)
+            cr.stroke()
+
+        window, label = self.WINDOWS[self.window_index]
+        single = len(self.series) == 1
+
+        # Piksel başına en fazla iki nokta okunur
+        selections = [series.select(window, max(int(width) * 2, 1)) for series in self.series]
+
+        max_value = self.max_value
+        if max_value is None:
+            max_value = max(
+                (max(high if high is not None else mean, default=0)
+                 for _, mean, _, high in selections),
+                default=0
+            ) or 1
+
+        for index, (resolution, mean, low, high) in enumerate(selections):
+            if not len(mean):
+                continue
+
+            # Noktalar sağa (şimdiye) hizalanır; pencere dolmadıysa sol boş kalır
+            step = width / max(window / resolution - 1, 1)
+            start = width - (len(mean) - 1) * step
+            scale = height / max_value
+
+            r, g, b = self.COLORS[index % len(self.COLORS)]
+
+            if low is not None:
+                # Min/max bandı: üst sınır ileri, alt sınır geri
+                for i, value in enumerate(high):
+                    cr.line_to(start + i * step, height - value * scale)
+                for i in range(len(low) - 1, -1, -1):
+                    cr.line_to(start + i * step, height - low[i] * scale)
+                cr.close_path()
+                cr.set_source_rgba(r, g, b, 0.25 if single else 0.15)
+                cr.fill()
+
+            cr.set_source_rgba(r, g, b, 1.0)
+            cr.set_line_width(2 if single else 1.5)
+
+            # Ortalama çizgisi
+            for i, value in enumerate(mean):
+                cr.line_to(start + i * step, height - value * scale)
+
+            # Çizgiyi çiz
+            cr.stroke_preserve()
+
+            if single and low is None:
+                # Dolgu ekle
+                cr.line_to(width, height)
+                cr.line_to(start, height)
+                cr.close_path()
+                cr.set_source_rgba(r, g, b, 0.3)
+                cr.fill()
+            else:
+                cr.new_path()
+
+        # Seçili pencere etiketi
+        cr.set_source_rgba(0.8, 0.8, 0.8, 0.8)
+        cr.set_font_size(10)
+        cr.move_to(4, 12)
+        cr.show_text(label)
+
+
+class StackedHistoryGraph(HistoryGraph):
+    """Serileri üst üste yığılmış alanlar olarak çizen geçmiş grafiği
+
+    Seriler aynı anda eklendiğinden aynı katmandan eşit uzunlukta okunur;
+    toplanmış katmanlarda yalnızca ortalamalar yığılır.
+    """
+
+    def _draw_func(self, area, cr, width, height):
+        """Grafik çizim fonksiyonu"""
+        # Arka planı temizle
+        cr.set_source_rgba(0.2, 0.2, 0.2, 0.5)
+        cr.rectangle(0, 0, width, height)
+        cr.fill()
+
+        # Veri yoksa çizme
+        if not any(len(series) for series in self.series):
+            return
+
+        window, label = self.WINDOWS[self.window_index]
+        selections = [series.select(window, max(int(width) * 2, 1)) for series in self.series]
+
+        resolution = selections[0][0]
+        count = min(len(mean) for _, mean, _, _ in selections)
+        if count:
+            step = width / max(window / resolution - 1, 1)
+            start = width - (count - 1) * step
+            scale = height / (self.max_value or 100)
+
+            # Her katmanın alt sınırı bir önceki katmanın üst sınırıdır
+            base = [0.0] * count
+            for index, (_, mean, _, _) in enumerate(selections):
+                mean = mean[len(mean) - count:]
+                top = [below + value for below, value in zip(base, mean)]
+
+                for i, value in enumerate(top):
+                    cr.line_to(start + i * step, height - value * scale)
+                for i in range(count - 1, -1, -1):
+                    cr.line_to(start + i * step, height - base[i] * scale)
+                cr.close_path()
+
+                r, g, b = self.COLORS[index % len(self.COLORS)]
+                cr.set_source_rgba(r, g, b, 0.6)
+                cr.fill()
+
+                base = top
+
+        # Izgara çiz
+        cr.set_source_rgba(0.5, 0.5, 0.5, 0.2)
+        cr.set_line_width(1)
+
+        # Yatay ızgaralar
+        for i in range(1, 4):
+            y = height * i / 4
+            cr.move_to(0, y)
+            cr.line_to(width, y)
+            cr.stroke()
+
+        # Seçili pencere etiketi
+        cr.set_source_rgba(0.8, 0.8, 0.8, 0.8)
+        cr.set_font_size(10)
+        cr.move_to(4, 12)
+        cr.show_text(label)
@@ -0,0 +1,170 @@
+"""
+Espresso - Ağ panel bileşeni
+"""
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib, GObject, Pango
+
+from espresso.models.disk_scanner import DiskScanner
+from espresso.ui.graph import HistoryGraph
+
+
+class NetworkPanel(Gtk.Box):
+    """Ağ paneli bileşeni"""
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+
+        # CSS sınıfı ekle
+        self.add_css_class("panel")
+
+        # Panel başlığı
+        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        self.append(title_box)
+
+        title_label = Gtk.Label(label="Ağ")
+        title_label.add_css_class("panel-title")
+        title_label.set_halign(Gtk.Align.START)
+        title_label.set_hexpand(True)
+        title_box.append(title_label)
+
+        # Sanal arayüz (lo, veth, docker...) süzgeci
+        self.virtual_toggle = Gtk.CheckButton(label="Sanal")
+        self.virtual_toggle.set_tooltip_text("Sanal arayüzleri (lo, veth, docker, köprü...) göster")
+        title_box.append(self.virtual_toggle)
+
+        # Alma/gönderme grafiği
+        self.usage_graph = NetworkGraph()
+        self.append(self.usage_graph)
+
+        # Toplam hızlar
+        totals_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        totals_box.set_margin_top(8)
+        self.append(totals_box)
+
+        rx_label = Gtk.Label(label="Alma:")
+        rx_label.set_halign(Gtk.Align.START)
+        totals_box.append(rx_label)
+
+        self.rx_value = Gtk.Label(label="0 B/s")
+        self.rx_value.set_halign(Gtk.Align.START)
+        self.rx_value.set_hexpand(True)
+        totals_box.append(self.rx_value)
+
+        tx_label = Gtk.Label(label="Gönderme:")
+        tx_label.set_halign(Gtk.Align.START)
+        totals_box.append(tx_label)
+
+        self.tx_value = Gtk.Label(label="0 B/s")
+        self.tx_value.set_halign(Gtk.Align.END)
+        totals_box.append(self.tx_value)
+
+        # Arayüz tablosu
+        interface_frame = Gtk.Frame()
+        interface_frame.set_margin_top(8)
+        self.append(interface_frame)
+
+        interface_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        interface_box.set_margin_top(8)
+        interface_box.set_margin_bottom(8)
+        interface_box.set_margin_start(8)
+        interface_box.set_margin_end(8)
+        interface_frame.set_child(interface_box)
+
+        interface_label = Gtk.Label(label="Arayüzler")
+        interface_label.set_halign(Gtk.Align.START)
+        interface_box.append(interface_label)
+
+        interface_scroll = Gtk.ScrolledWindow()
+        interface_scroll.set_min_content_height(120)
+        interface_scroll.set_vexpand(True)
+        interface_box.append(interface_scroll)
+
+        # Arayüz tablosu modeli
+        self.interface_store = Gtk.ListStore(
+            str,                # Arayüz adı
+            str,                # Alma hızı (insan okunabilir)
+            GObject.TYPE_INT64, # Alma hızı (bayt/sn)
+            str,                # Gönderme hızı (insan okunabilir)
+            GObject.TYPE_INT64, # Gönderme hızı (bayt/sn)
+            str,                # Paket/sn (alma / gönderme)
+            str,                # Hata ve düşen paket/sn
+            GObject.TYPE_INT64  # Hata + düşen (sıralama için)
+        )
+
+        self.interface_view = Gtk.TreeView(model=self.interface_store)
+        self.interface_view.set_headers_visible(True)
+        interface_scroll.set_child(self.interface_view)
+
+        # Sütunlar: (başlık, gösterilen sütun, sıralama sütunu, genişlesin mi)
+        for title, text_column, sort_column, expand in (
+                ("Arayüz", 0, 0, True),
+                ("Alma", 1, 2, False),
+                ("Gönderme", 3, 4, False),
+                ("Paket/sn", 5, 5, False),
+                ("Hata/Düşen", 6, 7, False)):
+            renderer = Gtk.CellRendererText()
+            if title == "Arayüz":
+                renderer.set_property("ellipsize", Pango.EllipsizeMode.END)
+            else:
+                renderer.set_alignment(1.0, 0.5)
+            column = Gtk.TreeViewColumn(title, renderer, text=text_column)
+            column.set_sort_column_id(sort_column)
+            column.set_expand(expand)
+            self.interface_view.append_column(column)
+
+        # Varsayılan olarak en çok veri alan arayüz üstte
+        self.interface_store.set_sort_column_id(2, Gtk.SortType.DESCENDING)
+
+    def update_usage_graph(self, histories):
+        """Alma/gönderme grafiğini günceller (alma ve gönderme geçmişleri)"""
+        self.usage_graph.update_data(histories)
+
+    def update_totals(self, rx_bytes, tx_bytes):
+        """Toplam alma/gönderme hızlarını günceller"""
+        self.rx_value.set_text(f"{DiskScanner.format_size(int(rx_bytes))}/s")
+        self.tx_value.set_text(f"{DiskScanner.format_size(int(tx_bytes))}/s")
+
+    def update_interface_table(self, interfaces):
+        """Arayüz tablosunu yerinde günceller"""
+        # Mevcut satırları arayüz adıyla eşle; seçim ve sıralama korunur
+        rows = {}
+        tree_iter = self.interface_store.get_iter_first()
+        while tree_iter is not None:
+            rows[self.interface_store[tree_iter][0]] = tree_iter
+            tree_iter = self.interface_store.iter_next(tree_iter)
+
+        for name, stats in interfaces.items():
+            faults = stats["rx_errors"] + stats["tx_errors"] + stats["rx_drops"] + stats["tx_drops"]
+            values = [
+                name,
+                f"{DiskScanner.format_size(int(stats['rx_bytes']))}/s",
+                int(stats["rx_bytes"]),
+                f"{DiskScanner.format_size(int(stats['tx_bytes']))}/s",
+                int(stats["tx_bytes"]),
+                f"{stats['rx_packets']:.0f} / {stats['tx_packets']:.0f}",
+                f"{stats['rx_errors'] + stats['tx_errors']:.0f} / "
+                f"{stats['rx_drops'] + stats['tx_drops']:.0f}",
+                int(faults)
+            ]
+
+            tree_iter = rows.pop(name, None)
+            if tree_iter is None:
+                self.interface_store.append(values)
+            else:
+                self.interface_store.set(tree_iter, list(range(len(values))), values)
+
+        # Kaldırılan ya da süzülen arayüzleri sil
+        for tree_iter in rows.values():
+            self.interface_store.remove(tree_iter)
+
+
+class NetworkGraph(HistoryGraph):
+    """Ağ alma/gönderme hızı grafiği"""
+
+    # Alma (mavi) ve gönderme (turuncu)
+    COLORS = [(0.2, 0.7, 0.9), (0.9, 0.5, 0.1)]
+
+    def __init__(self):
+        super().__init__(max_value=None)
@@ -6,6 +6,9 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 
+from espresso.models.pressure import PressureStall
+from espresso.ui.graph import StackedHistoryGraph
+
 
 class RAMPanel(Gtk.Box):
     """RAM paneli bileşeni"""
@@ -17,10 +20,33 @@ class RAMPanel(Gtk.Box):
         self.add_css_class("panel")
         
         # Panel başlığı
+        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        self.append(title_box)
+        
         title_label = Gtk.Label(label="RAM")
         title_label.add_css_class("panel-title")
         title_label.set_halign(Gtk.Align.START)
-        self.append(title_label)
+        title_label.set_hexpand(True)
+        title_box.append(title_label)
+        
+        # NUMA düğümlerine göre gruplama
+        self.node_toggle = Gtk.CheckButton(label="Düğümler")
+        self.node_toggle.set_tooltip_text("Belleği ve CPU kullanımını NUMA düğümlerine göre göster")
+        title_box.append(self.node_toggle)
+        
+        # Bellek bileşimi grafiği (uygulamalar / arabellek / önbellek)
+        self.composition_graph = MemoryCompositionGraph()
+        self.append(self.composition_graph)
+        
+        legend_label = Gtk.Label()
+        legend_label.set_markup(
+            '<span foreground="#3399e6">■</span> Uygulamalar  '
+            '<span foreground="#b366cc">■</span> Arabellek  '
+            '<span foreground="#66cc4d">■</span> Önbellek'
+        )
+        legend_label.add_css_class("dim-label")
+        legend_label.set_halign(Gtk.Align.START)
+        self.append(legend_label)
         
         # RAM kullanım çubuğu
         ram_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
@@ -45,6 +71,22 @@ class RAMPanel(Gtk.Box):
         self.ram_bar.add_css_class("low")
         ram_box.append(self.ram_bar)
         
+        # Basınç duraklama oranı (PSI)
+        self.pressure_label = Gtk.Label(label="")
+        self.pressure_label.add_css_class("dim-label")
+        self.pressure_label.set_halign(Gtk.Align.START)
+        self.pressure_label.set_margin_top(4)
+        self.pressure_label.set_visible(False)
+        ram_box.append(self.pressure_label)
+        
+        # NUMA düğümü başına bellek çubukları
+        self.nodes_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        self.nodes_box.set_margin_top(8)
+        self.nodes_box.set_visible(False)
+        self.append(self.nodes_box)
+        
+        self.node_rows = {}  # düğüm -> (değer etiketi, çubuk)
+        
         # Swap kullanım çubuğu
         swap_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         swap_box.set_margin_top(16)
@@ -135,6 +177,27 @@ class RAMPanel(Gtk.Box):
         self.swap_used_value = Gtk.Label(label="0 GB")
         self.swap_used_value.set_halign(Gtk.Align.END)
         self.details_grid.attach(self.swap_used_value, 1, 4, 1, 1)
+        
+        # /proc/meminfo ve /proc/vmstat ayrıntıları
+        self.detail_values = {}
+        for row, (key, title) in enumerate((
+                ("cached", "Önbellek:"),
+                ("buffers", "Arabellek:"),
+                ("dirty", "Kirli:"),
+                ("writeback", "Geri yazılan:"),
+                ("anon", "Anonim:"),
+                ("shmem", "Paylaşımlı:"),
+                ("slab", "Slab:"),
+                ("hugepages", "Hugepage:"),
+                ("swap_rate", "Swap giriş/çıkış:")), start=5):
+            label = Gtk.Label(label=title)
+            label.set_halign(Gtk.Align.START)
+            self.details_grid.attach(label, 0, row, 1, 1)
+            
+            value = Gtk.Label(label="-")
+            value.set_halign(Gtk.Align.END)
+            self.details_grid.attach(value, 1, row, 1, 1)
+            self.detail_values[key] = value
     
     def update_ram_bar(self, used, total, percent):
         """RAM kullanım çubuğunu günceller"""
@@ -180,6 +243,102 @@ class RAMPanel(Gtk.Box):
         else:
             self.swap_bar.add_css_class("high")
     
+    def update_node_memory(self, node_memory, node_cpu):
+        """Düğüm başına bellek ve CPU kullanımını gösterir (düğümler gizliyse atlar)"""
+        self.nodes_box.set_visible(self.node_toggle.get_active() and bool(node_memory))
+        if not self.nodes_box.get_visible():
+            return
+        
+        gb = 1024 * 1024 * 1024
+        for node, memory in sorted(node_memory.items()):
+            if node not in self.node_rows:
+                label_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+                self.nodes_box.append(label_box)
+                
+                node_label = Gtk.Label(label=f"Düğüm {node}:")
+                node_label.set_halign(Gtk.Align.START)
+                label_box.append(node_label)
+                
+                value_label = Gtk.Label(label="")
+                value_label.set_halign(Gtk.Align.END)
+                value_label.set_hexpand(True)
+                label_box.append(value_label)
+                
+                bar = Gtk.ProgressBar()
+                bar.add_css_class("usage-bar")
+                self.nodes_box.append(bar)
+                self.node_rows[node] = (value_label, bar)
+            
+            value_label, bar = self.node_rows[node]
+            percent = memory["percent"]
+            text = f"{memory['used'] / gb:.1f} / {memory['total'] / gb:.1f} GB ({percent:.1f}%)"
+            if node in node_cpu:
+                text += f"  CPU {node_cpu[node]:.1f}%"
+            value_label.set_text(text)
+            value_label.set_tooltip_text(
+                f"Önbellek: {memory['cached'] / gb:.2f} GB\n"
+                f"Anonim: {memory['anon'] / gb:.2f} GB\n"
+                f"Boş: {memory['free'] / gb:.2f} GB"
+            )
+            bar.set_fraction(percent / 100)
+            
+            # Renk sınıfını güncelle
+            bar.remove_css_class("low")
+            bar.remove_css_class("medium")
+            bar.remove_css_class("high")
+            
+            if percent < 50:
+                bar.add_css_class("low")
+            elif percent < 80:
+                bar.add_css_class("medium")
+            else:
+                bar.add_css_class("high")
+    
+    def update_composition_graph(self, histories):
+        """Bellek bileşimi grafiğini günceller (uygulama, arabellek, önbellek geçmişleri)"""
+        self.composition_graph.update_data(histories)
+    
+    def update_memory_composition(self, details, vmstat_rates):
+        """/proc/meminfo dökümünü ve swap hızlarını gösterir"""
+        if not details:
+            return
+        
+        gb = 1024 * 1024 * 1024
+        values = self.detail_values
+        values["cached"].set_text(f"{details['cached'] / gb:.2f} GB")
+        values["buffers"].set_text(f"{details['buffers'] / gb:.2f} GB")
+        values["dirty"].set_text(f"{details['dirty'] / (1024 * 1024):.1f} MB")
+        values["writeback"].set_text(f"{details['writeback'] / (1024 * 1024):.1f} MB")
+        values["anon"].set_text(f"{details['anon'] / gb:.2f} GB")
+        values["shmem"].set_text(f"{details['shmem'] / gb:.2f} GB")
+        values["slab"].set_text(
+            f"{details['slab'] / gb:.2f} GB "
+            f"({details['slab_reclaimable'] / gb:.2f} geri kazanılabilir)"
+        )
+        
+        # Hugepage'ler ayrılmamışsa gösterilecek bir şey yok
+        if details["hugepages_total"]:
+            used = details["hugepages_total"] - details["hugepages_free"]
+            size_mb = details["hugepage_size"] / (1024 * 1024)
+            values["hugepages"].set_text(f"{used} / {details['hugepages_total']} × {size_mb:.0f} MB")
+        else:
+            values["hugepages"].set_text("-")
+        
+        if vmstat_rates:
+            values["swap_rate"].set_text(
+                f"{vmstat_rates['swap_in']:.0f} / {vmstat_rates['swap_out']:.0f} sayfa/sn"
+            )
+    
+    def update_pressure(self, kinds):
+        """Basınç duraklama oranlarını gösterir (PSI yoksa gizler)"""
+        self.pressure_label.set_visible(bool(kinds))
+        if not kinds:
+            return
+        
+        text, tooltip = PressureStall.format(kinds)
+        self.pressure_label.set_text(text)
+        self.pressure_label.set_tooltip_text(tooltip)
+    
     def update_memory_details(self, ram_info, swap_info):
         """Detaylı bellek bilgilerini günceller"""
         # RAM değerlerini GB'a dönüştür
@@ -197,3 +356,10 @@ class RAMPanel(Gtk.Box):
         self.free_value.set_text(f"{free_gb:.2f} GB")
         self.swap_total_value.set_text(f"{swap_total_gb:.2f} GB")
         self.swap_used_value.set_text(f"{swap_used_gb:.2f} GB")
+
+
+class MemoryCompositionGraph(StackedHistoryGraph):
+    """Bellek bileşimi grafiği (toplam belleğin yüzdesi olarak)"""
+    
+    # Uygulamalar, arabellek, önbellek
+    COLORS = [(0.2, 0.6, 0.9), (0.7, 0.4, 0.8), (0.4, 0.8, 0.3)]
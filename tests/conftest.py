@@ -0,0 +1,23 @@
+"""
+Espresso - Ortak test donanımları
+"""
+
+import os
+
+import pytest
+
+
+PAGE_SIZE = 4096
+
+
+@pytest.fixture
+def short_reads(monkeypatch):
+    """preadv'i seq_file gibi tek çağrıda en fazla bir sayfa döndürecek şekilde kısıtlar"""
+    preadv = os.preadv
+
+    def capped(fd, buffers, offset):
+        buffer = memoryview(buffers[0])[:PAGE_SIZE]
+        return preadv(fd, [buffer], offset)
+
+    monkeypatch.setattr(os, "preadv", capped)
+
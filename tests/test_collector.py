@@ -0,0 +1,67 @@
+"""
+Espresso - Arka plan toplayıcısı testleri
+"""
+
+import threading
+
+from espresso.models.collector import DEFAULT_INTERVALS, MetricsCollector, scaled_intervals
+
+
+class FakeMetrics:
+    """Güncellenen bölümleri sayan SystemMetrics yerine geçen sınıf"""
+
+    SECTIONS = ("cpu", "ram", "disk")
+
+    def __init__(self, fail=()):
+        self.counts = dict.fromkeys(self.SECTIONS, 0)
+        self.fail = fail
+        self.snapshots = 0
+        self.event = threading.Event()
+
+    def update(self, section):
+        self.counts[section] += 1
+        if self.counts["cpu"] >= 20:
+            self.event.set()
+        if section in self.fail:
+            raise RuntimeError("okunamadı")
+
+    def snapshot(self):
+        self.snapshots += 1
+        return dict(self.counts)
+
+
+def test_scaled_intervals_never_faster_than_cpu():
+    intervals = scaled_intervals(0.5)
+    assert set(intervals) == set(DEFAULT_INTERVALS)
+    assert intervals["cpu"] == 0.5
+    assert intervals["ram"] == 1
+    assert intervals["disk"] == 30
+
+    # Yavaş CPU aralığı diğer bölümleri de yavaşlatır, daha yavaş olanlar korunur
+    intervals = scaled_intervals(5)
+    assert intervals["cpu"] == intervals["ram"] == intervals["temp"] == 5
+    assert intervals["disk"] == 30
+
+    # Varsayılandan hızlı CPU aralığı yalnızca CPU'yu hızlandırır
+    assert scaled_intervals(0.1)["cpu"] == 0.1
+    assert scaled_intervals(0.1)["ram"] == DEFAULT_INTERVALS["ram"]
+
+
+def test_sections_run_on_their_own_cadence():
+    metrics = FakeMetrics(fail=("ram",))
+    collector = MetricsCollector(metrics, {"cpu": 0.01, "ram": 0.1, "disk": 60})
+    collector.start()
+    try:
+        assert metrics.event.wait(5)
+    finally:
+        collector.stop()
+        collector.thread.join(5)
+
+    counts = dict(metrics.counts)
+    # Hata veren bölüm toplayıcıyı durdurmaz; uzun aralıklı bölüm yalnızca başta çalışır
+    assert counts["cpu"] >= 20
+    assert 1 <= counts["ram"] < counts["cpu"]
+    assert counts["disk"] == 1
+
+    # Anlık görüntü her turda yeniden yayınlanır
+    assert collector.get_snapshot()["cpu"] >= 20
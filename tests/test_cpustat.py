@@ -0,0 +1,95 @@
+"""
+Espresso - /proc/stat CPU dağılımı testleri
+"""
+
+import os
+
+from espresso.models.cpustat import CPUStat
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _stat(rows):
+    """Etiket -> tik listesi eşlemesinden /proc/stat metni üretir"""
+    lines = [label + " " + " ".join(str(tick) for tick in ticks) for label, ticks in rows.items()]
+    lines.append("intr 12345 " + " ".join("0" for _ in range(2000)))
+    lines.append("ctxt 999")
+    return "\n".join(lines) + "\n"
+
+
+def _read(tmp_path, *snapshots):
+    """Ardışık /proc/stat içeriklerini okuyup son sonucu döndürür"""
+    path = os.path.join(str(tmp_path), "stat")
+    _write(path, _stat(snapshots[0]))
+    stat = CPUStat(proc_root=str(tmp_path))
+    try:
+        result = stat.read()
+        for rows in snapshots[1:]:
+            _write(path, _stat(rows))
+            result = stat.read()
+    finally:
+        stat.close()
+    return stat, result
+
+
+def test_first_read_is_zero(tmp_path):
+    rows = {"cpu": [10] * 10, "cpu0": [5] * 10, "cpu1": [5] * 10}
+    stat, (total, cores) = _read(tmp_path, rows)
+
+    assert set(total.values()) == {0.0}
+    assert cores["usage"] == [0.0, 0.0]
+    assert stat.core_ids == [0, 1]
+
+
+def test_deltas_per_field_and_core(tmp_path):
+    # user nice system idle iowait irq softirq steal guest guest_nice
+    before = {
+        "cpu": [100, 0, 50, 800, 50, 0, 0, 0, 40, 0],
+        "cpu0": [50, 0, 25, 400, 25, 0, 0, 0, 20, 0],
+        "cpu1": [50, 0, 25, 400, 25, 0, 0, 0, 20, 0]
+    }
+    after = {
+        "cpu": [160, 0, 70, 880, 70, 0, 10, 10, 90, 0],
+        "cpu0": [110, 0, 30, 405, 45, 0, 10, 0, 90, 0],
+        "cpu1": [50, 0, 40, 475, 25, 0, 0, 10, 20, 0]
+    }
+    _, (total, cores) = _read(tmp_path, before, after)
+
+    # Toplam: 60 + 20 + 80 + 20 + 10 + 10 = 200 tik; guest alanları sayılmaz
+    assert total == {
+        "user": 30.0, "nice": 0.0, "system": 10.0, "idle": 40.0, "iowait": 10.0,
+        "irq": 0.0, "softirq": 5.0, "steal": 5.0, "usage": 50.0
+    }
+    # cpu0: 60 + 5 + 5 + 20 + 10 = 100 tik; cpu1: 15 + 75 + 10 = 100 tik
+    assert cores["user"] == [60.0, 0.0]
+    assert cores["idle"] == [5.0, 75.0]
+    assert cores["iowait"] == [20.0, 0.0]
+    assert cores["usage"] == [75.0, 25.0]
+
+
+def test_cpu_hotplug_realigns_rows(tmp_path):
+    before = {"cpu": [20, 0, 0, 80, 0, 0, 0, 0], "cpu0": [10, 0, 0, 40, 0, 0, 0, 0],
+              "cpu2": [10, 0, 0, 40, 0, 0, 0, 0]}
+    # cpu1 çevrimiçi oldu; eski çekirdeklerin tikleri etiketle eşlenir
+    after = {"cpu": [70, 0, 0, 130, 0, 0, 0, 0], "cpu0": [20, 0, 0, 50, 0, 0, 0, 0],
+             "cpu1": [30, 0, 0, 30, 0, 0, 0, 0], "cpu2": [20, 0, 0, 50, 0, 0, 0, 0]}
+    stat, (total, cores) = _read(tmp_path, before, after)
+
+    assert stat.core_ids == [0, 1, 2]
+    assert total["usage"] == 50.0
+    assert cores["usage"] == [50.0, 0.0, 50.0]
+
+
+def test_old_kernel_without_steal(tmp_path):
+    # 2.6.11 öncesi çekirdekler yalnızca 7 alan yazar
+    before = {"cpu": [0, 0, 0, 0, 0, 0, 0], "cpu0": [0, 0, 0, 0, 0, 0, 0]}
+    after = {"cpu": [10, 0, 10, 20, 0, 0, 0], "cpu0": [10, 0, 10, 20, 0, 0, 0]}
+    _, (total, cores) = _read(tmp_path, before, after)
+
+    assert total["usage"] == 50.0
+    assert total["steal"] == 0.0
+    assert cores["idle"] == [50.0]
@@ -0,0 +1,109 @@
+"""
+Espresso - Disk paneli dizin ağacı testleri (sahte ağaç modeliyle)
+"""
+
+import os
+
+import pytest
+
+from espresso.models.disk_scanner import DiskScanner
+
+
+class Row:
+    def __init__(self, parent, values):
+        self.parent = parent
+        self.values = list(values)
+        self.children = []
+
+
+class FakeTreeStore:
+    """Panelin kullandığı Gtk.TreeStore çağrılarını liste tabanlı satırlarla yanıtlayan sınıf"""
+
+    def __init__(self):
+        self.roots = []
+
+    def clear(self):
+        self.roots = []
+
+    def append(self, parent, values):
+        row = Row(parent, values)
+        (parent.children if parent else self.roots).append(row)
+        return row
+
+    def get_value(self, row, column):
+        return row.values[column]
+
+    def set_value(self, row, column, value):
+        row.values[column] = value
+
+    def iter_children(self, row):
+        return row.children[0] if row.children else None
+
+    def iter_next(self, row):
+        siblings = row.parent.children if row.parent else self.roots
+        position = siblings.index(row) + 1
+        return siblings[position] if position < len(siblings) else None
+
+    def remove(self, row):
+        (row.parent.children if row.parent else self.roots).remove(row)
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"0" * size)
+
+
+def _rows(store):
+    """Ağaçtaki satırların yol -> boyut eşlemesi ve yer tutucu sayısı"""
+    rows = {}
+    placeholders = 0
+    stack = list(store.roots)
+    while stack:
+        row = stack.pop()
+        if row.values[6] < 0:
+            placeholders += 1
+            continue
+        rows[row.values[4]] = row.values[2]
+        stack.extend(row.children)
+    return rows, placeholders
+
+
+@pytest.fixture
+def panel():
+    pytest.importorskip("gi")
+    from espresso.ui.disk_panel import DiskPanel
+
+    panel = DiskPanel.__new__(DiskPanel)
+    panel.tree_store = FakeTreeStore()
+    panel.tree_rows = {}
+    panel.populated = set()
+    return panel
+
+
+def test_directory_rows_are_populated_on_expand(tmp_path, panel):
+    root = str(tmp_path / "root")
+    _write(os.path.join(root, "a", "b", "c", "f3"), 300)
+    _write(os.path.join(root, "a", "f1"), 100)
+    _write(os.path.join(root, "top"), 7)
+
+    scanner = DiskScanner(workers=1)
+    scanner.scan_directory(root)
+    results = scanner.get_compact_results()
+
+    # Yalnızca kök ve doğrudan alt öğeleri eklenir; a yer tutucuyla açılabilir görünür
+    panel.update_directory_tree(results)
+    rows, placeholders = _rows(panel.tree_store)
+    assert rows == {root: 407, os.path.join(root, "a"): 400, os.path.join(root, "top"): 7}
+    assert placeholders == 1
+
+    # Açılan dizin bir kez doldurulur, yer tutucusu kaldırılır
+    a = os.path.join(root, "a")
+    row = panel.tree_rows[results.find(a)]
+    panel.populate_directory_row(results, row)
+    panel.populate_directory_row(results, row)
+    rows, placeholders = _rows(panel.tree_store)
+    assert set(rows) == {root, a, os.path.join(a, "b"), os.path.join(a, "f1"),
+                         os.path.join(root, "top")}
+    assert placeholders == 1
+    assert [child.values[0] for child in row.children] == ["b", "f1"]
@@ -0,0 +1,120 @@
+"""
+Espresso - DiskScanner testleri
+"""
+
+import os
+
+from espresso.models.disk_scanner import DiskScanner
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"0" * size)
+
+
+def _snapshot(results):
+    """Gösterilen canlı girdilerin yol -> (boyut, dizin mi) eşlemesi"""
+    return {
+        results.path(index): (results.size(index), results.is_directory(index))
+        for index in range(len(results))
+        if results.is_live(index) and not results.is_hidden(index)
+    }
+
+
+def _make_wide_tree(root):
+    """Her biri alt dizinler ve dosyalar içeren 20 dizinlik bir ağaç; toplam boyutu döndürür"""
+    total = 0
+    for outer in range(20):
+        for inner in range(5):
+            size = outer * 10 + inner + 1
+            _write(os.path.join(root, f"d{outer}", f"s{inner}", f"f{inner}"), size)
+            total += size
+        _write(os.path.join(root, f"d{outer}", "top"), 3)
+        total += 3
+    return total
+
+
+def test_parallel_scan_matches_single_worker(tmp_path):
+    root = str(tmp_path / "root")
+    total = _make_wide_tree(root)
+
+    single = DiskScanner(workers=1)
+    single.scan_directory(root)
+    parallel = DiskScanner(workers=4)
+    parallel.scan_directory(root)
+
+    assert single.get_total_size() == parallel.get_total_size() == total
+    assert _snapshot(single.get_compact_results()) == _snapshot(parallel.get_compact_results())
+
+    # Eski yol -> bilgi görünümü: önce dizinler, her grup boyuta göre büyükten küçüğe
+    view = parallel.get_results()
+    paths = list(view)
+    assert paths[0] == os.path.join(root, "d19")
+    assert view[os.path.join(root, "d3", "top")]["size"] == 3
+    assert len(view) == 20 * (1 + 5 + 5 + 1)
+
+
+def test_deep_tree_has_no_depth_limit(tmp_path):
+    # Python özyineleme sınırından daha derin bir zincir
+    root = str(tmp_path / "root")
+    depth = 1200
+    _write(os.path.join(root, "top"), 5)
+    chain = [root]
+    for _ in range(depth):
+        # os.makedirs ve shutil.rmtree de özyinelemelidir; zincir adım adım kurulup silinir
+        chain.append(os.path.join(chain[-1], "d"))
+        os.mkdir(chain[-1])
+    _write(os.path.join(chain[-1], "leaf"), 11)
+
+    try:
+        scanner = DiskScanner(workers=2, display_depth=3)
+        scanner.scan_directory(root)
+        results = scanner.get_compact_results()
+    finally:
+        os.remove(os.path.join(chain[-1], "leaf"))
+        for path in reversed(chain[1:]):
+            os.rmdir(path)
+
+    assert scanner.get_total_size() == 16
+    # Gösterim derinliğinin altındaki dizinler gizli olarak tutulur, dosyaları yalnızca toplamlara katılır
+    assert len(results) == 1 + depth + 1
+    shown = _snapshot(results)
+    assert len(shown) == 1 + 3 + 1
+    assert shown[os.path.join(root, "d", "d", "d")] == (11, True)
+
+
+def test_rescan_reuses_unchanged_directories(tmp_path):
+    root = str(tmp_path / "root")
+    deep = os.path.join(root, "a", "b", "c", "d")
+    _write(os.path.join(deep, "old"), 100)
+    _write(os.path.join(root, "a", "f"), 10)
+    _write(os.path.join(root, "other", "x", "g"), 20)
+    index_dir = str(tmp_path / "index")
+
+    scanner = DiskScanner(workers=2, index_dir=index_dir)
+    scanner.scan_directory(root)
+    assert scanner.reused_directories == 0
+    assert scanner.get_total_size() == 130
+
+    # Yalnızca en derindeki dizinin mtime'ı değişir; üst dizinleri yeniden listelenmez
+    _write(os.path.join(deep, "new"), 7)
+    scanner.scan_directory(root)
+
+    # root, a, b, c, other, other/x yeniden kullanılır; d listelenir
+    assert scanner.reused_directories == 6
+    assert scanner.get_total_size() == 137
+    results = scanner.get_compact_results()
+    assert results.size(results.find(os.path.join(root, "a"))) == 117
+    assert results.size(results.find(os.path.join(deep, "new"))) == 7
+
+    # Yeni bir tarayıcı önceki sonucu dizin dosyasından okur
+    reloaded = DiskScanner(workers=1, index_dir=index_dir)
+    reloaded.scan_directory(root)
+    assert reloaded.reused_directories == 7
+
+    fresh = DiskScanner(workers=1)
+    fresh.scan_directory(root, full=True)
+    assert fresh.reused_directories == 0
+    assert _snapshot(reloaded.get_compact_results()) == _snapshot(fresh.get_compact_results())
+    assert _snapshot(results) == _snapshot(fresh.get_compact_results())
@@ -0,0 +1,86 @@
+"""
+Espresso - /proc/diskstats modeli testleri
+"""
+
+import os
+
+from espresso.models.diskstats import DiskStats, SECTOR_SIZE
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _diskstats(devices):
+    """(aygıt adı, 11 sayaç) listesinden /proc/diskstats metni üretir"""
+    return "".join(
+        f"{major:4d} {minor:7d} {name} " + " ".join(str(value) for value in counters) + "\n"
+        for major, minor, name, counters in devices
+    )
+
+
+def _make_root(tmp_path, devices, disks):
+    proc_root = str(tmp_path / "proc")
+    sysfs_root = str(tmp_path / "sys")
+    _write(os.path.join(proc_root, "diskstats"), _diskstats(devices))
+    for disk in disks:
+        os.makedirs(os.path.join(sysfs_root, "block", disk))
+    return proc_root, sysfs_root
+
+
+def test_rates_and_mount_mapping(tmp_path, monkeypatch):
+    idle = [0] * 11
+    devices = [
+        (8, 0, "sda", idle),
+        (8, 1, "sda1", idle),
+        (8, 2, "sda2", idle),
+        (7, 0, "loop0", idle)
+    ]
+    proc_root, sysfs_root = _make_root(tmp_path, devices, ["sda", "loop0"])
+    stats = DiskStats(proc_root=proc_root, sysfs_root=sysfs_root)
+    clock = iter([100.0, 102.0])
+    monkeypatch.setattr("espresso.models.diskstats.time.monotonic", lambda: next(clock))
+    try:
+        mounts = [("/", "/dev/sda1", "ext4"), ("/proc", "proc", "proc")]
+        first = stats.read(mounts)
+
+        # Bağlı olmayan bölüm ve döngü aygıtı raporlanmaz; ilk okumada hızlar sıfırdır
+        assert set(first) == {"sda", "sda1"}
+        assert first["sda1"]["mountpoints"] == ["/"]
+        assert first["sda"]["read_bytes"] == 0.0
+
+        # 2 saniyede 10 okuma (40 sektör, 30 ms) ve 4 yazma; 1000 ms meşgul
+        busy = [10, 0, 40, 30, 4, 0, 8, 20, 1, 1000, 1600]
+        devices[0] = (8, 0, "sda", busy)
+        _write(os.path.join(proc_root, "diskstats"), _diskstats(devices))
+        sda = stats.read(mounts)["sda"]
+    finally:
+        stats.close()
+
+    assert sda["read_bytes"] == 40 * SECTOR_SIZE / 2
+    assert sda["write_bytes"] == 8 * SECTOR_SIZE / 2
+    assert sda["read_iops"] == 5.0
+    assert sda["write_iops"] == 2.0
+    assert sda["read_latency"] == 3.0
+    assert sda["write_latency"] == 5.0
+    assert sda["utilization"] == 50.0
+    assert sda["queue_depth"] == 0.8
+    assert sda["in_flight"] == 1
+
+
+def test_devices_past_first_page_are_read(tmp_path, short_reads):
+    # Yüzlerce dm aygıtı: dosya birkaç sayfayı aşar
+    devices = [(253, minor, f"dm-{minor}", [minor] * 11) for minor in range(400)]
+    proc_root, sysfs_root = _make_root(tmp_path, devices, [f"dm-{minor}" for minor in range(400)])
+    assert os.path.getsize(os.path.join(proc_root, "diskstats")) > 3 * 4096
+
+    stats = DiskStats(proc_root=proc_root, sysfs_root=sysfs_root)
+    try:
+        result = stats.read()
+    finally:
+        stats.close()
+
+    assert len(result) == 400
+    assert result["dm-399"]["in_flight"] == 399
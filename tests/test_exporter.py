@@ -0,0 +1,91 @@
+"""
+Espresso - Prometheus dışa aktarıcı testleri
+"""
+
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from espresso.exporter import CONTENT_TYPE, MetricsExporter, render_snapshot
+from espresso.models.metrics import SystemMetrics
+
+
+class FakeCollector:
+    """Verilen anlık görüntüyü döndüren toplayıcı yerine geçen sınıf"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def get_snapshot(self):
+        return self.snapshot
+
+
+def _snapshot(seq=1):
+    metrics = SystemMetrics()
+    metrics.seq = seq
+    metrics.cpu_usage = 42.5
+    metrics.cpu_cores = [40.0, 45.0]
+    metrics.cpu_times = {"user": 30.0, "system": 12.5, "usage": 42.5}
+    metrics.disk_info = {
+        "/": {"total": 100, "used": 40, "free": 60, "percent": 40.0, "status": "ok",
+              "device": "/dev/sda1", "fstype": "ext4"},
+        '/mnt/"nfs"': {"total": 0, "used": 0, "free": 0, "percent": 0, "status": "unresponsive"}
+    }
+    metrics.pressure = {"io": {"some": {"avg10": 1.5, "avg60": 0.5, "avg300": 0.1,
+                                        "total": 2500000, "rate": 3.0}}}
+    return metrics.snapshot()
+
+
+def test_render_snapshot_text_format():
+    text = render_snapshot(_snapshot())
+    lines = text.splitlines()
+
+    assert "# TYPE espresso_cpu_usage_percent gauge" in lines
+    assert "espresso_cpu_usage_percent 42.5" in lines
+    assert 'espresso_cpu_core_usage_percent{core="1"} 45.0' in lines
+    # "usage" kip olarak yinelenmez
+    assert not any('mode="usage"' in line for line in lines)
+
+    # Yanıt vermeyen bağlama 0 olarak raporlanır; etiketteki tırnak kaçışlanır
+    assert ('espresso_disk_responsive{mountpoint="/",device="/dev/sda1",fstype="ext4"} 1'
+            in lines)
+    assert 'espresso_disk_responsive{mountpoint="/mnt/\\"nfs\\"",device="",fstype=""} 0' in lines
+
+    # Sayaçlar saniyeye çevrilir
+    assert "# TYPE espresso_pressure_stall_seconds_total counter" in lines
+    assert 'espresso_pressure_stall_seconds_total{resource="io",kind="some"} 2.5' in lines
+
+    # Örneği olmayan aileler başlık da yazmaz
+    assert "espresso_gpu_usage_percent" not in text
+    assert text.endswith("\n")
+
+
+def test_render_is_cached_per_snapshot():
+    collector = FakeCollector(_snapshot(seq=1))
+    exporter = MetricsExporter(collector, 0)
+
+    body = exporter.render()
+    assert exporter.render() is body
+
+    collector.snapshot = _snapshot(seq=2)
+    assert exporter.render() is not body
+
+
+def test_http_endpoint():
+    exporter = MetricsExporter(FakeCollector(_snapshot()), 0)
+    try:
+        exporter.start()
+    except OSError as e:
+        pytest.skip(f"yerel soket açılamıyor: {e}")
+    try:
+        address, port = exporter.server.server_address[:2]
+        with urlopen(f"http://{address}:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert b"espresso_cpu_usage_percent 42.5" in response.read()
+
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"http://{address}:{port}/missing", timeout=5)
+        assert error.value.code == 404
+    finally:
+        exporter.stop()
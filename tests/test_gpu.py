@@ -0,0 +1,88 @@
+"""
+Espresso - GPU arka ucu testleri
+"""
+
+import os
+
+from espresso.models.gpu import AMDGPUBackend
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _make_card(root, card, vendor="0x1002", busy="37\n", vram_used="1073741824\n",
+               vram_total="8589934592\n"):
+    """Sahte bir drm kart dizini oluşturur ve aygıt dizinini döndürür"""
+    device_dir = os.path.join(root, "devices", f"pci-{card}")
+    _write(os.path.join(device_dir, "vendor"), vendor + "\n")
+    _write(os.path.join(device_dir, "device"), "0x73bf\n")
+    _write(os.path.join(device_dir, "gpu_busy_percent"), busy)
+    _write(os.path.join(device_dir, "mem_info_vram_used"), vram_used)
+    _write(os.path.join(device_dir, "mem_info_vram_total"), vram_total)
+
+    drm_dir = os.path.join(root, "class", "drm", card)
+    os.makedirs(drm_dir)
+    os.symlink(device_dir, os.path.join(drm_dir, "device"))
+    return device_dir
+
+
+def test_amd_card_parsing(tmp_path):
+    root = str(tmp_path)
+    device_dir = _make_card(root, "card0")
+    _write(os.path.join(device_dir, "product_name"), "Radeon RX 6800\n")
+
+    # Kenar sıcaklığı etiketiyle seçilir, ilk girdi olmasa bile
+    hwmon = os.path.join(device_dir, "hwmon", "hwmon3")
+    _write(os.path.join(hwmon, "temp1_input"), "90000\n")
+    _write(os.path.join(hwmon, "temp1_label"), "junction\n")
+    _write(os.path.join(hwmon, "temp2_input"), "54000\n")
+    _write(os.path.join(hwmon, "temp2_label"), "edge\n")
+
+    backend = AMDGPUBackend(sysfs_root=root)
+    try:
+        gpus = backend.read()
+    finally:
+        backend.close()
+
+    assert len(gpus) == 1
+    gpu = gpus[0]
+    assert gpu["name"] == "Radeon RX 6800"
+    assert gpu["usage"] == 37
+    assert gpu["temp"] == 54.0
+    assert gpu["memory"]["total"] == 8 * 1024 ** 3
+    assert gpu["memory"]["used"] == 1024 ** 3
+    assert gpu["memory"]["free"] == 7 * 1024 ** 3
+    assert gpu["memory"]["percent"] == 12.5
+
+
+def test_amd_values_are_reread_each_sample(tmp_path):
+    root = str(tmp_path)
+    device_dir = _make_card(root, "card0")
+
+    backend = AMDGPUBackend(sysfs_root=root)
+    try:
+        assert backend.read()[0]["usage"] == 37
+        _write(os.path.join(device_dir, "gpu_busy_percent"), "81\n")
+        assert backend.read()[0]["usage"] == 81
+    finally:
+        backend.close()
+
+
+def test_amd_discovery_skips_other_vendors_and_connectors(tmp_path):
+    root = str(tmp_path)
+    _make_card(root, "card0", vendor="0x10de")
+    device_dir = _make_card(root, "card1")
+    os.symlink(device_dir, os.path.join(root, "class", "drm", "card1-DP-1"))
+
+    backend = AMDGPUBackend(sysfs_root=root)
+    try:
+        gpus = backend.read()
+    finally:
+        backend.close()
+
+    # Ürün adı yoksa aygıt numarası kullanılır; sıcaklık dosyası yoksa 0
+    assert [gpu["name"] for gpu in gpus] == ["AMD GPU 0x73bf"]
+    assert gpus[0]["temp"] == 0
@@ -0,0 +1,43 @@
+"""
+Espresso - Ekransız kip testleri
+"""
+
+import json
+
+import pytest
+
+from espresso import headless
+from espresso.headless import HeadlessRunner
+
+
+def test_writes_one_json_record_per_snapshot(tmp_path):
+    path = str(tmp_path / "metrics.ndjson")
+    runner = HeadlessRunner(interval=0.05, output=path, count=3)
+    assert runner.run() == 3
+
+    with open(path, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    assert len(records) == 3
+    # Aynı görüntü iki kez yazılmaz
+    seqs = [record["seq"] for record in records]
+    assert seqs == sorted(set(seqs))
+    for record in records:
+        assert {"timestamp", "cpu", "ram", "disks", "network"} <= set(record)
+        assert "samples" not in json.dumps(record["gpus"])
+
+
+def test_duration_limits_run(tmp_path):
+    path = str(tmp_path / "metrics.ndjson")
+    runner = HeadlessRunner(interval=0.05, output=path, duration=0.2)
+    written = runner.run()
+
+    with open(path, "rb") as f:
+        assert f.read().count(b"\n") == written
+    assert written <= 4
+
+
+def test_msgpack_requires_package(monkeypatch):
+    monkeypatch.setattr(headless, "msgpack", None)
+    with pytest.raises(ValueError):
+        HeadlessRunner(fmt="msgpack")
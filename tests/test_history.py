@@ -0,0 +1,129 @@
+"""
+Espresso - Geçmiş deposu testleri
+"""
+
+from espresso.models import history
+from espresso.models.history import MappedRingBuffer, RingBuffer, RollupSeries, TimeSeriesStore
+
+
+def test_per_object_series_without_rollup_stay_small():
+    store = TimeSeriesStore()
+    series = store.get("io.loop7.read", 600, rollup=False)
+
+    assert isinstance(series, RingBuffer)
+    assert len(series.data) * series.data.itemsize == 2 * 600 * 4
+    assert isinstance(store.get("cpu"), RollupSeries)
+
+
+def test_ring_select_matches_rollup_format():
+    ring = RingBuffer(capacity=10)
+    ring.extend(range(8))
+
+    resolution, mean, low, high = ring.select(60, 1000)
+    assert resolution == 1
+    assert list(mean) == list(range(8))
+    assert low is None and high is None
+
+    # En fazla max_points nokta döner
+    assert list(ring.select(60, 3)[1]) == [5, 6, 7]
+
+
+def _open_at(monkeypatch, path, now, capacity=10):
+    monkeypatch.setattr(history.time, "time", lambda: now)
+    return MappedRingBuffer(path, capacity)
+
+
+def _fill(monkeypatch, path):
+    """Saniyede bir örnekle üç değer yazıp kapatır (son yazma t=1002)"""
+    ring = _open_at(monkeypatch, path, 1000.0)
+    for now, value in ((1000.0, 1), (1001.0, 2), (1002.0, 3)):
+        monkeypatch.setattr(history.time, "time", lambda now=now: now)
+        ring.append(value)
+    assert ring.interval == 1.0
+    ring.close()
+
+
+def test_restored_ring_pads_downtime(tmp_path, monkeypatch):
+    path = str(tmp_path / "cpu.ring")
+    _fill(monkeypatch, path)
+
+    # 4 sn sonra açılır: aradaki 3 örnek boş
+    ring = _open_at(monkeypatch, path, 1006.0)
+    assert list(ring.view()) == [1, 2, 3, 0, 0, 0]
+    ring.close()
+
+
+def test_restored_ring_resets_after_long_downtime(tmp_path, monkeypatch):
+    path = str(tmp_path / "cpu.ring")
+    _fill(monkeypatch, path)
+
+    # Boşluk kapasiteden uzun: eski örneklerin hiçbiri pencerede kalmaz
+    ring = _open_at(monkeypatch, path, 1100.0)
+    assert len(ring) == 0
+    ring.close()
+
+
+def test_restored_ring_without_downtime_is_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / "cpu.ring")
+    _fill(monkeypatch, path)
+
+    ring = _open_at(monkeypatch, path, 1002.5)
+    assert list(ring.view()) == [1, 2, 3]
+    ring.close()
+
+
+def _rollup(tiers=((10, 4), (60, 3))):
+    return RollupSeries(RingBuffer(capacity=100), lambda name, capacity: RingBuffer(capacity), tiers)
+
+
+def test_rollup_tiers_summarize_closed_buckets():
+    series = _rollup()
+    # 0..29 sn arası saniyede bir örnek: değer = saniye
+    for second in range(30):
+        series.append(float(second), timestamp=1000.0 + second)
+
+    tier = series.tiers[0]
+    # 1000-1009 ve 1010-1019 kovaları kapandı, 1020-1029 hâlâ açık
+    assert len(tier) == 2
+    assert list(tier.rings["min"].view()) == [0, 10]
+    assert list(tier.rings["max"].view()) == [9, 19]
+    assert list(tier.rings["mean"].view()) == [4.5, 14.5]
+    assert list(tier.rings["last"].view()) == [9, 19]
+
+    # İkinci katmanın kovası henüz kapanmadı
+    assert len(series.tiers[1]) == 0
+    assert series.interval == 1.0
+
+
+def test_rollup_batches_are_weighted_and_cascade():
+    series = _rollup()
+    # Aynı anda gelen örnekler (sürücü arabelleği) tek zaman damgasıyla eklenir
+    series.extend([1.0, 2.0, 3.0], timestamp=1000.0)
+    series.extend([10.0], timestamp=1001.0)
+    series.append(0.0, timestamp=1010.0)
+    assert list(series.tiers[0].rings["mean"].view()) == [4.0]
+
+    # Birinci katmanın kovaları dakika sınırında ikinci katmana aktarılır
+    for second in range(1011, 1090):
+        series.append(1.0, timestamp=float(second))
+    assert len(series.tiers[1]) == 1
+    assert series.tiers[1].rings["max"].view()[0] == 10.0
+
+
+def test_rollup_select_picks_tier_by_window():
+    series = _rollup()
+    for second in range(50):
+        series.append(float(second), timestamp=1000.0 + second)
+
+    # Kısa pencere ham seriden çizilir
+    resolution, mean, low, high = series.select(20, 100)
+    assert resolution == 1.0
+    assert list(mean) == [float(second) for second in range(30, 50)]
+    assert low is None and high is None
+
+    # Nokta sınırını aşan pencere 10 sn kovalarından çizilir
+    resolution, mean, low, high = series.select(40, 10)
+    assert resolution == 10
+    assert list(mean) == [4.5, 14.5, 24.5, 34.5]
+    assert list(low) == [0, 10, 20, 30]
+    assert list(high) == [9, 19, 29, 39]
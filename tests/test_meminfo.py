@@ -0,0 +1,86 @@
+"""
+Espresso - /proc/meminfo ve /proc/vmstat modeli testleri
+"""
+
+import os
+
+from espresso.models.meminfo import MemInfo
+
+
+MEMINFO = """MemTotal:       16000000 kB
+MemFree:         4000000 kB
+MemAvailable:    8000000 kB
+Buffers:          500000 kB
+Cached:          3000000 kB
+SwapCached:            0 kB
+SReclaimable:     500000 kB
+SwapTotal:       2000000 kB
+SwapFree:        1500000 kB
+HugePages_Total:       4
+Hugepagesize:       2048 kB
+"""
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _vmstat(counters):
+    """Sayaç sözlüğünü, sonunda verilen sayaçlar olan çok sayfalık bir vmstat metnine çevirir"""
+    # Gerçek dosyada yaklaşık 180 sayaç vardır; ilgilenilen sayaçlar sonlara doğru düşer
+    lines = [f"nr_filler_{number:04d} {number}\n" for number in range(600)]
+    lines += [f"{name} {value}\n" for name, value in counters.items()]
+    return "".join(lines)
+
+
+def test_meminfo_record_and_summary(tmp_path):
+    proc_root = str(tmp_path)
+    _write(os.path.join(proc_root, "meminfo"), MEMINFO)
+    meminfo = MemInfo(proc_root=proc_root)
+    try:
+        details, _ = meminfo.read()
+    finally:
+        meminfo.close()
+
+    assert details["total"] == 16000000 * 1024
+    assert details["slab_reclaimable"] == 500000 * 1024
+    # Birimsiz alanlar olduğu gibi alınır, eksik alanlar sıfırdır
+    assert details["hugepages_total"] == 4
+    assert details["dirty"] == 0
+
+    ram, swap = MemInfo.summarize(details)
+    assert ram["used"] == (16000000 - 4000000 - 3500000 - 500000) * 1024
+    assert ram["percent"] == 50.0
+    assert swap["used"] == 500000 * 1024
+    assert swap["percent"] == 25.0
+
+
+def test_vmstat_rates_past_first_page(tmp_path, monkeypatch, short_reads):
+    proc_root = str(tmp_path)
+    _write(os.path.join(proc_root, "meminfo"), MEMINFO)
+    counters = {"pgpgin": 1000, "pgpgout": 2000, "pswpin": 10, "pswpout": 20, "pgmajfault": 5}
+    _write(os.path.join(proc_root, "vmstat"), _vmstat(counters))
+    assert os.path.getsize(os.path.join(proc_root, "vmstat")) > 2 * 4096
+
+    meminfo = MemInfo(proc_root=proc_root)
+    clock = iter([50.0, 52.0])
+    monkeypatch.setattr("espresso.models.meminfo.time.monotonic", lambda: next(clock))
+    try:
+        _, rates = meminfo.read()
+        assert set(rates.values()) == {0.0}
+
+        counters = {"pgpgin": 1400, "pgpgout": 2100, "pswpin": 14, "pswpout": 20, "pgmajfault": 9}
+        _write(os.path.join(proc_root, "vmstat"), _vmstat(counters))
+        _, rates = meminfo.read()
+    finally:
+        meminfo.close()
+
+    assert rates == {
+        "swap_in": 2.0,
+        "swap_out": 0.0,
+        "page_in": 200.0,
+        "page_out": 50.0,
+        "major_faults": 2.0
+    }
@@ -0,0 +1,186 @@
+"""
+Espresso - MountTable ve MountUsagePoller testleri
+"""
+
+import os
+import time
+import select
+import threading
+
+import pytest
+
+from espresso.models.mounts import MountTable, MountUsagePoller
+
+
+USAGE = {"total": 100, "used": 40, "free": 60, "percent": 40.0}
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+class FakeStatvfs:
+    """Seçilen bağlamalarda olay serbest bırakılana kadar uyuyan statvfs yerine geçen sınıf"""
+
+    def __init__(self):
+        self.hung = set()
+        self.release = threading.Event()
+        self.calls = []
+
+    def __call__(self, mountpoint):
+        self.calls.append(mountpoint)
+        if mountpoint in self.hung:
+            self.release.wait(10)
+        return dict(USAGE)
+
+
+def test_hung_mount_does_not_block_poll():
+    fake = FakeStatvfs()
+    fake.hung.add("/hung")
+    poller = MountUsagePoller(max_workers=2, timeout=0.1, usage_func=fake)
+    try:
+        start = time.monotonic()
+        results = poller.poll(["/ok", "/hung"])
+        assert time.monotonic() - start < 1.0
+
+        assert results["/ok"]["status"] == "ok"
+        assert results["/hung"]["status"] == "unresponsive"
+        assert results["/hung"]["total"] == 0
+    finally:
+        fake.release.set()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_hung_mount_goes_stale_and_backs_off():
+    fake = FakeStatvfs()
+    poller = MountUsagePoller(max_workers=2, timeout=0.05, backoff_base=0.3, usage_func=fake)
+    try:
+        assert poller.poll(["/nfs"])["/nfs"]["status"] == "ok"
+
+        # Askıya alınan bağlama son bilinen değeri "unresponsive" olarak döndürür
+        fake.hung.add("/nfs")
+        usage = poller.poll(["/nfs"])["/nfs"]
+        assert usage["status"] == "unresponsive"
+        assert usage["total"] == USAGE["total"]
+        deadline, delay = poller.backoff["/nfs"]
+        assert delay == 0.3
+
+        # Geç gelen yanıt geri çekilmeyi kaldırmaz; bağlama süre dolana kadar sorgulanmaz
+        calls = len(fake.calls)
+        fake.release.set()
+        assert _wait_for(lambda: poller.pending["/nfs"].done())
+        fake.release.clear()
+        while time.monotonic() < deadline - 0.1:
+            assert poller.poll(["/nfs"])["/nfs"]["status"] == "unresponsive"
+            time.sleep(0.02)
+        assert len(fake.calls) == calls
+        assert poller.backoff["/nfs"] == (deadline, 0.3)
+
+        # Süre dolunca yeniden denenir; yine zaman aşımına uğrarsa bekleme ikiye katlanır
+        time.sleep(max(deadline - time.monotonic(), 0) + 0.01)
+        assert poller.poll(["/nfs"])["/nfs"]["status"] == "unresponsive"
+        assert len(fake.calls) == calls + 1
+        deadline, delay = poller.backoff["/nfs"]
+        assert delay == 0.6
+
+        # Süresinde yanıt veren sorgu durumu düzeltir ve geri çekilmeyi sıfırlar
+        fake.hung.clear()
+        fake.release.set()
+        assert _wait_for(lambda: poller.pending["/nfs"].done())
+        time.sleep(max(deadline - time.monotonic(), 0) + 0.01)
+        assert poller.poll(["/nfs"])["/nfs"]["status"] == "ok"
+        assert "/nfs" not in poller.backoff
+    finally:
+        fake.release.set()
+
+
+def test_healthy_mounts_recover_when_all_workers_hang():
+    fake = FakeStatvfs()
+    fake.hung.update(["/h1", "/h2", "/h3"])
+    poller = MountUsagePoller(max_workers=2, timeout=0.1, usage_func=fake)
+    mountpoints = ["/h1", "/h2", "/h3", "/ok"]
+    try:
+        # İlk turda iki iş parçacığı da askıda kalır; kalan sorgular hiç başlamaz
+        poller.poll(mountpoints)
+
+        # Sonraki turlarda askıdaki iş parçacıklarının yerine yenileri açılır
+        results = poller.poll(mountpoints)
+        assert results["/ok"]["status"] == "ok"
+        results = poller.poll(mountpoints)
+        assert results["/ok"]["status"] == "ok"
+        assert results["/h3"]["status"] == "unresponsive"
+
+        # Ek iş parçacıkları askıdaki bağlama sayısıyla sınırlıdır
+        assert poller.workers <= 2 + 3
+    finally:
+        fake.release.set()
+
+
+MOUNTINFO = """\
+22 1 8:2 / / rw,relatime shared:1 - ext4 /dev/sda2 rw
+23 22 0:5 / /proc rw,nosuid - proc proc rw
+24 22 8:3 / /media/usb\\040disk rw - vfat /dev/sdb1 rw
+25 22 0:40 / /tank rw - zfs tank/data rw
+26 22 0:41 / /run rw - tmpfs none rw
+"""
+
+FILESYSTEMS = "nodev\tproc\nnodev\ttmpfs\n\text4\n\tvfat\n"
+
+
+class FakePoller:
+    """Sıradaki poll çağrısında verilen olayları döndüren select.poll yerine geçen sınıf"""
+
+    def __init__(self):
+        self.events = []
+
+    def poll(self, timeout):
+        events, self.events = self.events, []
+        return events
+
+
+def test_mountinfo_is_parsed_and_reread_only_on_pollpri(tmp_path):
+    _write(str(tmp_path / "self" / "mountinfo"), MOUNTINFO)
+    _write(str(tmp_path / "filesystems"), FILESYSTEMS)
+    table = MountTable(proc_root=str(tmp_path))
+    try:
+        # nodev türler ve aygıtı olmayan bağlamalar süzülür, kaçışlı boşluk çözülür
+        assert table.mounts == [
+            ("/", "/dev/sda2", "ext4"),
+            ("/media/usb disk", "/dev/sdb1", "vfat"),
+            ("/tank", "tank/data", "zfs")
+        ]
+
+        # Bildirim yokken dosya yeniden okunmaz
+        table.poller = FakePoller()
+        _write(str(tmp_path / "self" / "mountinfo"), MOUNTINFO.splitlines(True)[0])
+        mounts = table.mounts
+        assert not table.refresh()
+        assert table.mounts is mounts
+
+        # POLLPRI gelince tablo yeniden ayrıştırılır
+        table.poller.events = [(table.file.fileno(), select.POLLPRI)]
+        assert table.refresh()
+        assert table.mounts == [("/", "/dev/sda2", "ext4")]
+    finally:
+        table.close()
+
+
+def test_real_mountinfo_is_quiet_until_changed():
+    if not os.path.exists("/proc/self/mountinfo"):
+        pytest.skip("mountinfo yalnızca Linux'ta")
+    table = MountTable()
+    try:
+        assert table.poller is not None
+        assert not table.refresh()
+    finally:
+        table.close()
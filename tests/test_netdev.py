@@ -0,0 +1,76 @@
+"""
+Espresso - /proc/net/dev modeli testleri
+"""
+
+import os
+
+from espresso.models.netdev import NetDev
+
+
+HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|"
+    "bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _net_dev(interfaces):
+    """Arayüz adı -> (rx bayt, tx bayt) eşlemesinden /proc/net/dev metni üretir"""
+    lines = [HEADER]
+    for name, (rx, tx) in interfaces.items():
+        lines.append(f"{name:>6}: {rx} 10 1 2 0 0 0 0 {tx} 20 3 4 0 0 0 0\n")
+    return "".join(lines)
+
+
+def _make_root(tmp_path, interfaces, virtual):
+    proc_root = str(tmp_path / "proc")
+    sysfs_root = str(tmp_path / "sys")
+    _write(os.path.join(proc_root, "net", "dev"), _net_dev(interfaces))
+    for name in virtual:
+        os.makedirs(os.path.join(sysfs_root, "devices", "virtual", "net", name))
+    return proc_root, sysfs_root
+
+
+def test_rates_and_virtual_interfaces(tmp_path, monkeypatch):
+    interfaces = {"lo": (500, 500), "eth0": (1000, 2000)}
+    proc_root, sysfs_root = _make_root(tmp_path, interfaces, ["lo"])
+    netdev = NetDev(proc_root=proc_root, sysfs_root=sysfs_root)
+    clock = iter([10.0, 12.0])
+    monkeypatch.setattr("espresso.models.netdev.time.monotonic", lambda: next(clock))
+    try:
+        first = netdev.read()
+        assert first["eth0"]["rx_bytes"] == 0.0
+        assert first["lo"]["virtual"] and not first["eth0"]["virtual"]
+
+        # Sayacı sıfırlanan arayüz negatif hız göstermez
+        interfaces = {"lo": (100, 100), "eth0": (3000, 2400)}
+        _write(os.path.join(proc_root, "net", "dev"), _net_dev(interfaces))
+        second = netdev.read()
+    finally:
+        netdev.close()
+
+    assert second["eth0"]["rx_bytes"] == 1000.0
+    assert second["eth0"]["tx_bytes"] == 200.0
+    assert second["eth0"]["rx_errors"] == 0.0
+    assert second["lo"]["rx_bytes"] == 0.0
+
+
+def test_interfaces_past_first_page_are_read(tmp_path, short_reads):
+    # Binlerce veth arayüzü olan bir kapsayıcı sunucusu
+    interfaces = {f"veth{number:05d}": (number, number) for number in range(2000)}
+    proc_root, sysfs_root = _make_root(tmp_path, interfaces, [])
+    assert os.path.getsize(os.path.join(proc_root, "net", "dev")) > 10 * 4096
+
+    netdev = NetDev(proc_root=proc_root, sysfs_root=sysfs_root)
+    try:
+        result = netdev.read()
+    finally:
+        netdev.close()
+
+    assert set(result) == set(interfaces)
@@ -0,0 +1,227 @@
+"""
+Espresso - NVML arka ucu testleri (sahte pynvml modülüyle)
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from espresso.models.gpu import NvidiaGPUBackend, ProcessNameCache
+from espresso.models.history import TimeSeriesStore
+
+
+class NVMLError(Exception):
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
+class FakeNVML:
+    """Testlerin kullandığı pynvml çağrılarını aygıt sözlüklerinden yanıtlayan modül yerine geçen sınıf"""
+
+    NVMLError = NVMLError
+    NVML_TEMPERATURE_GPU = 0
+    NVML_GPU_UTILIZATION_SAMPLES = 1
+    NVML_ERROR_NOT_SUPPORTED = 3
+    NVML_ERROR_NOT_FOUND = 6
+
+    def __init__(self, devices):
+        self.devices = devices
+
+    def nvmlInit(self):
+        pass
+
+    def nvmlShutdown(self):
+        pass
+
+    def nvmlDeviceGetCount(self):
+        return len(self.devices)
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        return f"GPU {handle}".encode()
+
+    def nvmlDeviceGetUUID(self, handle):
+        return f"GPU-{handle:04d}"
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        return SimpleNamespace(gpu=self.devices[handle].get("usage", 0))
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        return self.devices[handle].get("temp", 0)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        total, used = self.devices[handle].get("memory", (0, 0))
+        return SimpleNamespace(total=total, used=used, free=total - used)
+
+    def nvmlDeviceGetSamples(self, handle, sample_type, last_seen):
+        device = self.devices[handle]
+        if "samples_error" in device:
+            raise NVMLError(device["samples_error"])
+        samples = device.get("samples", [])
+        if not samples:
+            raise NVMLError(self.NVML_ERROR_NOT_FOUND)
+        return 1, [
+            SimpleNamespace(timeStamp=ts, sampleValue=SimpleNamespace(uiVal=value))
+            for ts, value in samples
+        ]
+
+    def nvmlDeviceGetComputeRunningProcesses(self, handle):
+        return [SimpleNamespace(pid=pid, usedGpuMemory=memory)
+                for pid, memory in self.devices[handle].get("compute", [])]
+
+    def nvmlDeviceGetGraphicsRunningProcesses(self, handle):
+        return [SimpleNamespace(pid=pid, usedGpuMemory=memory)
+                for pid, memory in self.devices[handle].get("graphics", [])]
+
+    def nvmlDeviceGetProcessUtilization(self, handle, last_seen):
+        samples = self.devices[handle].get("process_samples", [])
+        if not samples:
+            raise NVMLError(self.NVML_ERROR_NOT_FOUND)
+        return [SimpleNamespace(pid=pid, timeStamp=ts, smUtil=sm, memUtil=mem)
+                for pid, ts, sm, mem in samples]
+
+
+def test_static_properties_and_counters():
+    nvml = FakeNVML([{"usage": 55, "temp": 61, "memory": (4096, 1024)}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    gpu = backend.read()[0]
+    assert gpu["name"] == "GPU 0"
+    assert gpu["uuid"] == "GPU-0000"
+    assert gpu["usage"] == 55
+    assert gpu["temp"] == 61
+    assert gpu["memory"] == {"total": 4096, "used": 1024, "free": 3072, "percent": 25.0}
+
+
+def test_process_utilization_is_aggregated():
+    pid = os.getpid()
+    nvml = FakeNVML([{
+        # Hem hesaplama hem grafik listesinde görünen süreç; bellek raporlanmayan süreç
+        "compute": [(pid, 300), (pid + 1, None)],
+        "graphics": [(pid, 500)],
+        "process_samples": [
+            (pid, 10, 20, 5),
+            (pid, 30, 45, 2),
+            (pid + 1, 20, 7, 9),
+            (pid + 2, 40, 99, 99)  # listede olmayan süreç
+        ]
+    }])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    processes = {process["pid"]: process for process in backend.read()[0]["processes"]}
+    assert set(processes) == {pid, pid + 1}
+
+    process = processes[pid]
+    assert process["type"] == "CG"
+    assert process["memory"] == 500
+    assert process["sm_util"] == 45
+    assert process["mem_util"] == 5
+    assert processes[pid + 1]["memory"] == 0
+    assert (processes[pid + 1]["sm_util"], processes[pid + 1]["mem_util"]) == (7, 9)
+
+    # Sonraki sorgu en yeni örneğin zaman damgasından başlar
+    assert backend.devices[0]["last_process_ts"] == 40
+
+
+def test_process_utilization_disabled_when_not_supported():
+    nvml = FakeNVML([{"compute": [(os.getpid(), 100)]}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    def unsupported(handle, last_seen):
+        raise NVMLError(nvml.NVML_ERROR_NOT_SUPPORTED)
+    nvml.nvmlDeviceGetProcessUtilization = unsupported
+
+    process = backend.read()[0]["processes"][0]
+    assert process["sm_util"] is None
+    assert not backend.devices[0]["process_util_supported"]
+
+
+def test_process_name_cache_evicts_exited_pids():
+    nvml = FakeNVML([{"compute": [(os.getpid(), 100)]}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    backend.read()
+    assert os.getpid() in backend.process_names.names
+
+    # Süreç artık hiçbir GPU'da görünmüyor: adı unutulur
+    nvml.devices[0]["compute"] = []
+    backend.read()
+    assert backend.process_names.names == {}
+
+
+def test_process_name_cache_queries_each_pid_once():
+    cache = ProcessNameCache()
+    cache.names[123456789] = "cached"
+    assert cache.get(123456789) == "cached"
+
+    # Erişilemeyen PID'ler köşeli parantezle adlandırılır
+    missing = 2 ** 31 - 1
+    assert cache.get(missing) == f"[{missing}]"
+
+    cache.retain([missing])
+    assert cache.names == {missing: f"[{missing}]"}
+
+
+def test_sample_buffer_returns_only_new_samples():
+    nvml = FakeNVML([{"usage": 10, "samples": [(300, 70), (100, 50), (200, 60)]}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    # Örnekler zamana göre sıralanır ve son görülen zaman damgası ilerler
+    assert backend.read()[0]["samples"] == [(100, 50), (200, 60), (300, 70)]
+    assert backend.devices[0]["last_sample_ts"] == 300
+
+    # Arabellek daha önce görülen örnekleri de döndürse bile yalnızca yeniler alınır
+    nvml.devices[0]["samples"] = [(200, 60), (300, 70), (400, 80)]
+    assert backend.read()[0]["samples"] == [(400, 80)]
+    assert backend.devices[0]["last_sample_ts"] == 400
+
+
+def test_sample_buffer_without_new_samples():
+    nvml = FakeNVML([{"usage": 10, "samples": [(100, 50)]}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+    backend.read()
+
+    # Yeni örnek yok: arabellek eski örnekleri döndürür ya da NOT_FOUND verir
+    assert backend.read()[0]["samples"] == []
+    nvml.devices[0]["samples"] = []
+    assert backend.read()[0]["samples"] == []
+
+    device = backend.devices[0]
+    assert device["last_sample_ts"] == 100
+    assert device["samples_supported"]
+
+
+def test_sample_buffer_disabled_when_not_supported():
+    nvml = FakeNVML([{"usage": 10, "samples_error": FakeNVML.NVML_ERROR_NOT_SUPPORTED}])
+    backend = NvidiaGPUBackend(nvml=nvml)
+
+    assert backend.read()[0]["samples"] is None
+    assert not backend.devices[0]["samples_supported"]
+
+
+def test_gpu_history_is_extended_with_samples():
+    pytest.importorskip("gi")
+    from espresso.controllers.gpu_controller import GPUController
+
+    history = TimeSeriesStore(capacity=16)
+    controller = GPUController.__new__(GPUController)
+    controller.history = history
+    controller.last_sample_ts = {}
+
+    # Sürücü örnekleri olduğu gibi eklenir, aynı örnek iki kez eklenmez
+    controller._append_history({"index": 0, "usage": 5, "samples": [(100, 50), (200, 60)]})
+    controller._append_history({"index": 0, "usage": 5, "samples": [(200, 60), (300, 70)]})
+    assert list(history.view("gpu.0")) == [50, 60, 70]
+
+    # Yeni örnek yoksa anlık kullanım alt-saniye örneklerin arasına karışmaz
+    controller._append_history({"index": 0, "usage": 5, "samples": []})
+    assert list(history.view("gpu.0")) == [50, 60, 70]
+
+    # Örnek arabelleği olmayan GPU anlık kullanımla beslenir
+    controller._append_history({"index": 1, "usage": 5, "samples": None})
+    controller._append_history({"index": 1, "usage": 7})
+    assert list(history.view("gpu.1")) == [5, 7]
@@ -0,0 +1,67 @@
+"""
+Espresso - Basınç duraklama bilgisi (PSI) testleri
+"""
+
+import os
+
+from espresso.models.pressure import PressureStall
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _psi(some_total, full_total=None):
+    text = f"some avg10=1.50 avg60=0.75 avg300=0.25 total={some_total}\n"
+    if full_total is not None:
+        text += f"full avg10=0.50 avg60=0.20 avg300=0.05 total={full_total}\n"
+    return text
+
+
+def test_rates_from_total_deltas(tmp_path, monkeypatch):
+    proc_root = str(tmp_path)
+    pressure_dir = os.path.join(proc_root, "pressure")
+    # CPU'da "full" satırı olmayan eski çekirdek; memory dosyası yok
+    _write(os.path.join(pressure_dir, "cpu"), _psi(1000000))
+    _write(os.path.join(pressure_dir, "io"), _psi(0, 0))
+
+    stall = PressureStall(proc_root=proc_root)
+    clock = iter([10.0, 12.0])
+    monkeypatch.setattr("espresso.models.pressure.time.monotonic", lambda: next(clock))
+    try:
+        first = stall.read()
+        assert set(first) == {"cpu", "io"}
+        assert set(first["cpu"]) == {"some"}
+        assert first["io"]["some"]["avg10"] == 1.5
+        assert first["io"]["full"]["rate"] == 0.0
+
+        # 2 saniyede 0,5 sn kısmi ve 0,1 sn tam duraklama
+        _write(os.path.join(pressure_dir, "io"), _psi(500000, 100000))
+        second = stall.read()
+    finally:
+        stall.close()
+
+    assert second["io"]["some"]["rate"] == 25.0
+    assert second["io"]["full"]["rate"] == 5.0
+    assert second["io"]["full"]["total"] == 100000
+    assert second["cpu"]["some"]["rate"] == 0.0
+
+
+def test_unsupported_kernel_returns_empty(tmp_path):
+    stall = PressureStall(proc_root=str(tmp_path))
+    assert stall.read() == {}
+
+
+def test_format():
+    kinds = {
+        "some": {"avg10": 1.5, "avg60": 0.75, "avg300": 0.25, "rate": 12.34},
+        "full": {"avg10": 0.5, "avg60": 0.2, "avg300": 0.05, "rate": 3.0}
+    }
+    text, tooltip = PressureStall.format(kinds)
+    assert text == "Duraklama: 12.3% kısmi, 3.0% tam"
+    assert tooltip.splitlines()[1] == "tam: 10 sn 0.50%, 60 sn 0.20%, 300 sn 0.05%"
+
+    text, _ = PressureStall.format(kinds, include_full=False)
+    assert text == "Duraklama: 12.3% kısmi"
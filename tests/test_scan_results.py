@@ -0,0 +1,102 @@
+"""
+Espresso - ScanResults testleri
+"""
+
+import os
+
+from espresso.models.scan_results import ScanResults
+
+
+def _make_results():
+    results = ScanResults("/data")
+    docs = results.add("docs", 0, True, 300)
+    results.add("a.txt", docs, False, 100)
+    media = results.add("media", 0, True, 5000)
+    results.add("b.txt", docs, False, 200)
+    results.add("movie.mkv", media, False, 5000)
+    results.add("deep", media, True, 0, hidden=True)
+    return results
+
+
+def _tree(results):
+    """Girdileri (yol, boyut, dizin mi, gizli mi) kümesine çevirir"""
+    return {
+        (results.path(index), results.size(index), results.is_directory(index),
+         results.is_hidden(index))
+        for index in range(len(results))
+    }
+
+
+def test_children_and_paths():
+    results = _make_results()
+    names = lambda index: sorted(results.name(child) for child in results.children(index))
+
+    assert names(0) == ["docs", "media"]
+    assert names(1) == ["a.txt", "b.txt"]
+    assert names(results.find("/data/media")) == ["deep", "movie.mkv"]
+    assert list(results.children(results.find("/data/docs/a.txt"))) == []
+
+    assert results.path(results.find("/data/media/deep")) == os.path.join("/data", "media", "deep")
+    assert results.find("/data/missing") == -1
+    assert results.find("/elsewhere") == -1
+
+
+def test_add_after_index_is_built_keeps_index():
+    results = _make_results()
+    results.children(0)
+    child_list = results.child_list
+    size = results.nbytes()
+
+    # Kurulu indeks her eklemede yeniden kurulmaz; yeni girdi ek listeden döner
+    new = results.add("c.txt", 1, False, 7)
+    assert results.child_list is child_list
+    assert new in results.children(1)
+    assert results.find("/data/docs/c.txt") == new
+
+    # Girdi dizileri (17 bayt), ad ve ek listedeki 4 bayt sayılır
+    assert results.nbytes() - size == 17 + len("c.txt") + 4
+
+    # Kaldırılan girdi aramada bulunmaz
+    results.mark_removed(new)
+    assert results.find("/data/docs/c.txt") == -1
+    assert not results.is_live(new)
+
+    # prepare ek listeleri indekse katar; sonuç aynı kalır
+    expected = {index: sorted(results.children(index)) for index in range(len(results))}
+    results.prepare()
+    assert results.added_children == {}
+    assert {index: sorted(results.children(index)) for index in range(len(results))} == expected
+
+
+def test_save_load_round_trip(tmp_path):
+    results = _make_results()
+    stat = os.stat(str(tmp_path))
+    results.set_directory_stat(0, stat, 0, True)
+    results.set_directory_stat(1, stat, 300, True)
+    path = str(tmp_path / "data.scan")
+    results.save(path)
+
+    loaded = ScanResults.load(path)
+    assert loaded is not None
+    assert _tree(loaded) == _tree(results)
+    assert list(loaded.dir_file_sizes) == [0, 300]
+    assert loaded.has_files(1)
+    assert loaded.find_unchanged(stat) in (0, 1)
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_load_rejects_invalid_files(tmp_path):
+    path = str(tmp_path / "bad.scan")
+    assert ScanResults.load(path) is None
+
+    with open(path, "wb") as f:
+        f.write(b"ESPS")
+    assert ScanResults.load(path) is None
+
+    # Kesik dosya reddedilir
+    _make_results().save(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-3])
+    assert ScanResults.load(path) is None
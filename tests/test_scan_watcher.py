@@ -0,0 +1,157 @@
+"""
+Espresso - ScanWatcher testleri (inotify gerektirir)
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from espresso.models.disk_scanner import DiskScanner
+from espresso.models.scan_watcher import ScanWatcher, _load_libc
+
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify yalnızca Linux'ta")
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"0" * size)
+
+
+def _make_tree(root):
+    _write(os.path.join(root, "a", "f1"), 100)
+    _write(os.path.join(root, "a", "b", "f2"), 200)
+    _write(os.path.join(root, "a", "b", "c", "f3"), 300)
+    _write(os.path.join(root, "x", "y", "f4"), 50)
+    _write(os.path.join(root, "top"), 7)
+
+
+def _snapshot(results):
+    """Gösterilen canlı girdilerin yol -> (boyut, dizin mi) eşlemesi"""
+    return {
+        results.path(index): (results.size(index), results.is_directory(index))
+        for index in range(len(results))
+        if results.is_live(index) and not results.is_hidden(index)
+    }
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _start_watcher(results, display_depth):
+    watcher = ScanWatcher(results, display_depth)
+    if not watcher.start():
+        pytest.skip("inotify kullanılamıyor")
+    assert _wait_for(lambda: watcher.ready)
+    return watcher
+
+
+@pytest.mark.parametrize("display_depth", [None, 2])
+def test_watched_totals_match_full_scan(tmp_path, display_depth):
+    root = str(tmp_path / "root")
+    _make_tree(root)
+    scanner = DiskScanner(workers=2, display_depth=display_depth)
+    scanner.scan_directory(root)
+    results = scanner.get_compact_results()
+
+    watcher = _start_watcher(results, display_depth)
+    try:
+        with open(os.path.join(root, "a", "f1"), "ab") as f:
+            f.write(b"1" * 11)
+        _write(os.path.join(root, "a", "b", "c", "new"), 5)
+        _write(os.path.join(root, "n", "m", "g"), 40)
+        os.remove(os.path.join(root, "top"))
+        os.rename(os.path.join(root, "x"), os.path.join(root, "x2"))
+        assert _wait_for(lambda: results.size(0) == 100 + 11 + 200 + 300 + 5 + 50 + 40)
+        time.sleep(0.3)
+    finally:
+        watcher.stop()
+
+    fresh = DiskScanner(workers=1, display_depth=display_depth)
+    fresh.scan_directory(root, full=True)
+    assert _snapshot(results) == _snapshot(fresh.get_compact_results())
+
+
+def test_directory_replaced_by_file_below_display_depth(tmp_path):
+    root = str(tmp_path / "root")
+    _make_tree(root)
+    # a/b'nin dosyaları gösterim derinliğinin altında kalır, c alt dizini girdidir
+    scanner = DiskScanner(workers=1, display_depth=2)
+    scanner.scan_directory(root)
+    results = scanner.get_compact_results()
+
+    # Olayların tek okumada birleşmesi için izlemeler bu iş parçacığında kurulur
+    watcher = ScanWatcher(results, 2)
+    watcher.libc = _load_libc()
+    if watcher.libc is None:
+        pytest.skip("inotify kullanılamıyor")
+    watcher.fd = watcher.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    try:
+        watcher._setup()
+
+        # Dizin ağacın dışına taşınır, yerine aynı adlı bir dosya yazılır
+        replaced = os.path.join(root, "a", "b", "c")
+        os.rename(replaced, str(tmp_path / "outside"))
+        _write(replaced, 9)
+        watcher._apply(os.read(watcher.fd, 64 * 1024))
+    finally:
+        watcher.stop()
+
+    # Eski dizin girdisi canlı kalıp yeni dosyayla birlikte sayılmamalı
+    assert results.size(0) == 657 - 300 + 9
+    fresh = DiskScanner(workers=1, display_depth=2)
+    fresh.scan_directory(root, full=True)
+    assert _snapshot(results) == _snapshot(fresh.get_compact_results())
+
+
+def test_incremental_rescan_after_watch_matches_full_scan(tmp_path):
+    root = str(tmp_path / "root")
+    _make_tree(root)
+    scanner = DiskScanner(workers=2, index_dir=str(tmp_path / "index"))
+    scanner.scan_directory(root)
+    results = scanner.get_compact_results()
+
+    # Dosyaya yerinde ekleme dizinin mtime değerini değiştirmez; dizin kaydı izleyiciyle güncellenmeli
+    watcher = _start_watcher(results, None)
+    try:
+        with open(os.path.join(root, "a", "b", "c", "f3"), "ab") as f:
+            f.write(b"1" * 10)
+        assert _wait_for(lambda: results.size(0) == 657 + 10)
+    finally:
+        watcher.stop()
+
+    scanner.scan_directory(root)
+    assert scanner.reused_directories > 0
+
+    fresh = DiskScanner(workers=1)
+    fresh.scan_directory(root, full=True)
+    assert scanner.get_total_size() == fresh.get_total_size() == 667
+    assert _snapshot(scanner.get_compact_results()) == _snapshot(fresh.get_compact_results())
+
+
+def test_watch_limit_caps_watches_shallow_first(tmp_path):
+    root = str(tmp_path / "root")
+    _make_tree(root)
+    scanner = DiskScanner(workers=1)
+    scanner.scan_directory(root)
+    results = scanner.get_compact_results()
+
+    watcher = ScanWatcher(results, None, watch_limit=3)
+    if not watcher.start():
+        pytest.skip("inotify kullanılamıyor")
+    try:
+        assert _wait_for(lambda: watcher.ready)
+        watched = sorted(results.path(index) for index in watcher.watches.values())
+    finally:
+        watcher.stop()
+
+    assert watched == [root, os.path.join(root, "a"), os.path.join(root, "x")]
@@ -0,0 +1,97 @@
+"""
+Espresso - sysfs sıcaklık sensörleri testleri
+"""
+
+import os
+
+from espresso.models.sensors import ThermalSensors
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _hwmon(root, name, chip, inputs):
+    """inputs: (numara, etiket ya da None, millidereceler) listesi"""
+    hwmon_dir = os.path.join(root, "class", "hwmon", name)
+    _write(os.path.join(hwmon_dir, "name"), chip + "\n")
+    for number, label, value in inputs:
+        _write(os.path.join(hwmon_dir, f"temp{number}_input"), f"{value}\n")
+        if label is not None:
+            _write(os.path.join(hwmon_dir, f"temp{number}_label"), label + "\n")
+    return hwmon_dir
+
+
+def _zone(root, name, zone_type, value):
+    zone_dir = os.path.join(root, "class", "thermal", name)
+    _write(os.path.join(zone_dir, "type"), zone_type + "\n")
+    _write(os.path.join(zone_dir, "temp"), f"{value}\n")
+    return zone_dir
+
+
+def test_coretemp_packages_and_cores(tmp_path):
+    root = str(tmp_path)
+    _hwmon(root, "hwmon0", "acpitz", [(1, None, 30000)])
+    hwmon = _hwmon(root, "hwmon2", "coretemp", [
+        (1, "Package id 0", 55000),
+        (2, "Core 0", 50000),
+        (10, "Core 8", 52000)
+    ])
+    _zone(root, "thermal_zone0", "x86_pkg_temp", 99000)
+
+    sensors = ThermalSensors(sysfs_root=root)
+    try:
+        temps = sensors.read()
+        assert temps == {"packages": {"Package id 0": 55.0}, "cores": {"Core 0": 50.0, "Core 8": 52.0}}
+        assert ThermalSensors.summarize(temps) == 55.0
+
+        # Dosyalar açık tutulur; her okuma güncel değeri verir
+        _write(os.path.join(hwmon, "temp1_input"), "61500\n")
+        assert sensors.read()["packages"]["Package id 0"] == 61.5
+    finally:
+        sensors.close()
+
+
+def test_k10temp_multi_socket_labels_and_tdie(tmp_path):
+    root = str(tmp_path)
+    for name, offset in (("hwmon1", 0), ("hwmon10", 1000)):
+        _hwmon(root, name, "k10temp", [
+            (1, "Tctl", 70000 + offset),
+            (2, "Tdie", 60000 + offset),
+            (3, "Tccd1", 58000 + offset)
+        ])
+
+    sensors = ThermalSensors(sysfs_root=root)
+    try:
+        temps = sensors.read()
+    finally:
+        sensors.close()
+
+    # Aynı etiketler kaynak hwmon adıyla ayrılır; Tctl ofsetli olduğundan Tdie tercih edilir
+    assert temps["packages"]["Tdie (hwmon10)"] == 61.0
+    assert set(temps["cores"]) == {"Tccd1 (hwmon1)", "Tccd1 (hwmon10)"}
+    assert ThermalSensors.summarize(temps) == 61.0
+
+
+def test_thermal_zone_fallback(tmp_path):
+    root = str(tmp_path)
+    _zone(root, "thermal_zone0", "acpitz", 40000)
+    _zone(root, "thermal_zone1", "x86_pkg_temp", 47000)
+    _zone(root, "thermal_zone2", "iwlwifi_1", 35000)
+
+    sensors = ThermalSensors(sysfs_root=root)
+    try:
+        temps = sensors.read()
+    finally:
+        sensors.close()
+
+    # hwmon yoksa öncelikli bölge türü kullanılır
+    assert temps == {"packages": {"x86_pkg_temp": 47.0}, "cores": {}}
+
+
+def test_no_sensors(tmp_path):
+    sensors = ThermalSensors(sysfs_root=str(tmp_path))
+    assert sensors.read() == {"packages": {}, "cores": {}}
+    assert ThermalSensors.summarize(sensors.read()) == 0
@@ -0,0 +1,26 @@
+"""
+Espresso - sysfs/procfs okuma yardımcıları testleri
+"""
+
+import os
+
+from espresso.models.sysfs import open_fd, pread_all, close_fd
+
+
+def test_pread_all_reads_past_short_reads(tmp_path, short_reads):
+    path = tmp_path / "maps"
+    data = b"".join(b"line %06d\n" % number for number in range(3000))
+    path.write_bytes(data)
+
+    fd = open_fd(str(path))
+    try:
+        # Arabellek büyür ve kısa okumalar dosya sonu sayılmaz
+        buffer, size = pread_all(fd, bytearray(1024))
+        assert bytes(buffer[:size]) == data
+
+        # Yeniden kullanılan arabellek dosya küçüldüğünde eski baytları döndürmez
+        os.truncate(str(path), 100)
+        buffer, size = pread_all(fd, buffer)
+        assert bytes(buffer[:size]) == data[:100]
+    finally:
+        close_fd(fd)
@@ -0,0 +1,99 @@
+"""
+Espresso - NUMA ve CPU topolojisi testleri
+"""
+
+import os
+
+from espresso.models.topology import CPUTopology, parse_cpu_list
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _node_meminfo(node, total_kb, free_kb, file_kb, padding=0):
+    """Düğüm meminfo metni üretir; padding kadar ek alan dosyayı büyütür"""
+    lines = [
+        f"Node {node} MemTotal:       {total_kb} kB",
+        f"Node {node} MemFree:        {free_kb} kB",
+    ]
+    lines += [f"Node {node} Filler{number:05d}:  0 kB" for number in range(padding)]
+    lines += [
+        f"Node {node} FilePages:      {file_kb} kB",
+        f"Node {node} SReclaimable:   0 kB",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _make_sysfs(root):
+    """2 soket, soket başına 2 çekirdek ve SMT'li 8 CPU'luk bir sistem"""
+    cpu_dir = os.path.join(root, "devices", "system", "cpu")
+    node_dir = os.path.join(root, "devices", "system", "node")
+    for cpu in range(8):
+        topology = os.path.join(cpu_dir, f"cpu{cpu}", "topology")
+        first = cpu % 4
+        _write(os.path.join(topology, "physical_package_id"), f"{first // 2}\n")
+        _write(os.path.join(topology, "thread_siblings_list"), f"{first},{first + 4}\n")
+    _write(os.path.join(node_dir, "node0", "cpulist"), "0-1,4-5\n")
+    _write(os.path.join(node_dir, "node1", "cpulist"), "2-3,6-7\n")
+    _write(os.path.join(node_dir, "node0", "meminfo"), _node_meminfo(0, 1000, 250, 250))
+    # Sayfadan büyük düğüm meminfo'su: alanlar ilk sayfanın ötesinde kalır
+    _write(os.path.join(node_dir, "node1", "meminfo"), _node_meminfo(1, 2000, 1000, 500, padding=200))
+    return node_dir
+
+
+def test_parse_cpu_list():
+    assert parse_cpu_list("0-3,8-9,12\n") == [0, 1, 2, 3, 8, 9, 12]
+    assert parse_cpu_list("") == []
+    assert parse_cpu_list("x,2") == [2]
+
+
+def test_groups_by_node_socket_and_core(tmp_path):
+    _make_sysfs(str(tmp_path))
+    topology = CPUTopology(sysfs_root=str(tmp_path))
+    try:
+        assert topology.nodes == [0, 1]
+        assert topology.cpus[6] == {"node": 1, "socket": 1, "core": 2}
+
+        usages = [10, 20, 30, 40, 50, 60, 70, 80]
+        groups = topology.aggregate(usages, list(range(8)))
+    finally:
+        topology.close()
+
+    assert groups["node"] == [
+        {"id": 0, "usage": 35.0, "cpus": [0, 1, 4, 5]},
+        {"id": 1, "usage": 55.0, "cpus": [2, 3, 6, 7]}
+    ]
+    assert [group["usage"] for group in groups["socket"]] == [35.0, 55.0]
+    assert groups["core"][0] == {"id": 0, "usage": 30.0, "cpus": [0, 4]}
+
+
+def test_unknown_cpus_default_to_node_zero(tmp_path):
+    # sysfs topolojisi olmayan (kapsayıcı) sistem
+    topology = CPUTopology(sysfs_root=str(tmp_path))
+    try:
+        assert topology.nodes == [0]
+        groups = topology.aggregate([10, 30], [0, 1])
+        assert groups["node"] == [{"id": 0, "usage": 20.0, "cpus": [0, 1]}]
+        assert topology.read_node_memory() == {}
+    finally:
+        topology.close()
+
+
+def test_node_memory_past_first_page(tmp_path, short_reads):
+    node_dir = _make_sysfs(str(tmp_path))
+    assert os.path.getsize(os.path.join(node_dir, "node1", "meminfo")) > 4096
+
+    topology = CPUTopology(sysfs_root=str(tmp_path))
+    try:
+        memory = topology.read_node_memory()
+    finally:
+        topology.close()
+
+    assert memory[0]["used"] == 500 * 1024
+    assert memory[0]["percent"] == 50.0
+    assert memory[1]["total"] == 2000 * 1024
+    assert memory[1]["cached"] == 500 * 1024
+    assert memory[1]["percent"] == 25.0